@@ -0,0 +1,213 @@
+import argparse
+import os
+import re
+from collections import deque, namedtuple
+from multiprocessing import Pool
+
+# 심각도 단계(숫자가 클수록 심각).
+SEVERITY_LEVELS = {'INFO': 0, 'WARNING': 1, 'ERROR': 2, 'CRITICAL': 3}
+
+# 규칙 하나: 이름, 패턴, 심각도, 정규식 여부(False면 키워드로 취급해 이스케이프).
+Rule = namedtuple('Rule', ['name', 'pattern', 'severity', 'is_regex'])
+# 추출 결과 한 줄: 바이트 오프셋, 다음 줄 오프셋, 줄 내용, 일치한 규칙(문맥 줄이면 None).
+Entry = namedtuple('Entry', ['offset', 'next_offset', 'line', 'rule'])
+
+# mission_computer_main.log에 사용하는 기본 규칙.
+DEFAULT_RULES = [
+    Rule('explosion', 'explosion', 'CRITICAL', False),
+    Rule('oxygen', r'oxygen\s+(tank|level)\s+(unstable|low|leak)', 'ERROR', True),
+    Rule('unstable', 'unstable', 'ERROR', False),
+    Rule('failure', r'\b(fail(ed|ure)?|malfunction|leak)\b', 'ERROR', True),
+    Rule('event_level', r'^[^,]*,(ERROR|CRITICAL|WARN(ING)?),', 'ERROR', True),
+    Rule('power_down', 'powered down', 'WARNING', False),
+]
+
+
+class RuleSet:
+    """
+    키워드/정규식 규칙을 심각도별로 이름 있는 그룹으로 묶은 정규식으로 컴파일한다.
+    심각한 단계부터 검사하므로, 덜 심각한 규칙이 같은 글자를 먼저 차지해도 가장 심각한 규칙을 반환한다.
+    """
+
+    def __init__(self, rules, min_severity='INFO', ignore_case=True):
+        self.rules = [rule for rule in rules
+                      if SEVERITY_LEVELS[rule.severity] >= SEVERITY_LEVELS[min_severity]]
+        if not self.rules:
+            raise ValueError('적용할 규칙이 없습니다.')
+        flags = re.IGNORECASE if ignore_case else 0
+        # [(심각도 단계의 정규식, 그룹 번호 → 규칙), ...]을 심각한 순서로 보관한다.
+        self._levels = []
+        for level in sorted(SEVERITY_LEVELS, key=SEVERITY_LEVELS.get, reverse=True):
+            level_rules = [rule for rule in self.rules if rule.severity == level]
+            if not level_rules:
+                continue
+            parts = []
+            for number, rule in enumerate(level_rules):
+                pattern = rule.pattern if rule.is_regex else re.escape(rule.pattern)
+                parts.append(f'(?P<r{number}>{pattern})')
+            self._levels.append((re.compile('|'.join(parts), flags), level_rules))
+
+    def match(self, line):
+        """일치한 규칙 중 가장 심각한 규칙을 반환한다(없으면 None)."""
+        for pattern, level_rules in self._levels:
+            found = pattern.search(line)
+            if found:
+                return level_rules[int(found.lastgroup[1:])]
+        return None
+
+
+def _context_start(file, position, count):
+    """position 이전 count줄의 시작 위치를 뒤로 거슬러 올라가 찾는다."""
+    if not count or not position:
+        return position
+    start = position
+    block = 4096
+    found = -1
+    while start > 0 and found < count:
+        start = max(0, start - block)
+        file.seek(start)
+        data = file.read(position - start)
+        # 마지막 개행은 position 바로 앞 줄의 끝이므로 제외하고 센다.
+        found = data[:-1].count(b'\n')
+    if found < count:
+        return 0
+    file.seek(start)
+    data = file.read(position - start)
+    index = len(data) - 1
+    for _ in range(count + 1):
+        index = data.rfind(b'\n', 0, index)
+    return start + index + 1
+
+
+def scan_range(path, rule_set, start=0, end=None, before=0, after=0, skip_header=True):
+    """
+    [start, end) 구간에서 시작하는 줄에 규칙을 적용해 일치한 줄과 앞뒤 문맥 줄을 Entry로 생성한다.
+    앞 문맥은 크기 before의 deque, 뒤 문맥은 남은 줄 수로만 관리하므로 메모리 사용량이 일정하다.
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        end = size if end is None else end
+        position = _context_start(file, start, before)
+        file.seek(position)
+        history = deque(maxlen=before)
+        after_left = 0
+
+        for raw in file:
+            offset = position
+            position += len(raw)
+            if offset >= end and not after_left:
+                break
+            if skip_header and offset == 0:
+                continue
+            line = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+            entry = Entry(offset, position, line, None)
+
+            rule = rule_set.match(line) if start <= offset < end else None
+            if rule:
+                yield from history
+                history.clear()
+                yield entry._replace(rule=rule)
+                after_left = after
+            elif after_left and offset >= start:
+                yield entry
+                after_left -= 1
+            elif before:
+                history.append(entry)
+
+
+def merge_entries(entries):
+    """
+    오프셋 순서의 Entry에서 중복 줄을 제거하고, 이어지지 않는 묶음 사이에 None(구분자)을 넣는다.
+    """
+    next_offset = None
+    for entry in entries:
+        if next_offset is not None and entry.offset < next_offset:
+            continue
+        if next_offset is not None and entry.offset > next_offset:
+            yield None
+        yield entry
+        next_offset = entry.next_offset
+
+
+def split_ranges(path, parts):
+    """파일을 줄 경계에 맞춰 parts개의 [start, end) 구간으로 나눈다."""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as file:
+        for number in range(1, parts):
+            file.seek(size * number // parts)
+            file.readline()
+            boundaries.append(max(file.tell(), boundaries[-1]))
+    boundaries.append(size)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(parts) if boundaries[i] < boundaries[i + 1]]
+
+
+def _scan_worker(args):
+    path, rules, min_severity, start, end, before, after = args
+    return list(scan_range(path, RuleSet(rules, min_severity), start, end, before, after))
+
+
+def extract_anomalies(path, rules=DEFAULT_RULES, min_severity='INFO', before=0, after=0, processes=1):
+    """
+    로그에서 규칙에 일치하는 줄과 문맥 줄을 오프셋 순서로 생성한다(구분자는 None).
+    processes가 2 이상이면 파일을 줄 경계로 나눠 여러 프로세스에서 검사한다.
+    """
+    if processes <= 1:
+        yield from merge_entries(scan_range(path, RuleSet(rules, min_severity), before=before, after=after))
+        return
+
+    tasks = [(path, rules, min_severity, start, end, before, after)
+             for start, end in split_ranges(path, processes)]
+    with Pool(processes) as pool:
+        # imap은 구간 순서대로 결과를 돌려주므로 순서가 유지된다.
+        chunks = pool.imap(_scan_worker, tasks)
+        yield from merge_entries(entry for chunk in chunks for entry in chunk)
+
+
+def write_anomalies(entries, output_path, header=None, separator='--'):
+    """
+    추출 결과를 파일에 바로바로 기록하고 심각도별 일치 줄 수를 반환한다.
+    문맥 묶음 사이에는 separator 줄을 넣는다.
+    """
+    counts = {level: 0 for level in SEVERITY_LEVELS}
+    with open(output_path, 'w', encoding='utf-8') as output:
+        if header:
+            output.write(header + '\n')
+        for entry in entries:
+            if entry is None:
+                output.write(separator + '\n')
+                continue
+            output.write(entry.line + '\n')
+            if entry.rule:
+                counts[entry.rule.severity] += 1
+                print(f'[{entry.rule.severity}] {entry.rule.name}: {entry.line}')
+    return counts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 로그 이상 징후 추출')
+    parser.add_argument('log', help='로그 파일 경로')
+    parser.add_argument('output', help='추출 결과를 저장할 파일 경로')
+    parser.add_argument('--keyword', action='append', default=[], help='키워드 규칙 (심각도:키워드, 예: ERROR:leak)')
+    parser.add_argument('--regex', action='append', default=[], help='정규식 규칙 (심각도:정규식)')
+    parser.add_argument('--min-severity', default='INFO', choices=list(SEVERITY_LEVELS))
+    parser.add_argument('-B', '--before', type=int, default=0, help='일치 줄 앞에 함께 저장할 줄 수')
+    parser.add_argument('-A', '--after', type=int, default=0, help='일치 줄 뒤에 함께 저장할 줄 수')
+    parser.add_argument('--processes', type=int, default=1, help='병렬 처리 프로세스 수')
+    args = parser.parse_args()
+
+    custom_rules = []
+    for is_regex, values in ((False, args.keyword), (True, args.regex)):
+        for value in values:
+            severity, separator, pattern = value.partition(':')
+            if not separator or severity.upper() not in SEVERITY_LEVELS or not pattern:
+                parser.error(f'규칙은 심각도:패턴 형식이어야 합니다 '
+                             f'(심각도: {", ".join(SEVERITY_LEVELS)}): {value}')
+            custom_rules.append(Rule(pattern, pattern, severity.upper(), is_regex))
+
+    with open(args.log, 'r', encoding='utf-8') as log_file:
+        log_header = log_file.readline().strip()
+    result = extract_anomalies(args.log, custom_rules or DEFAULT_RULES, args.min_severity,
+                               args.before, args.after, args.processes)
+    summary = write_anomalies(result, args.output, log_header)
+    print(', '.join(f'{level}: {count}' for level, count in summary.items()))
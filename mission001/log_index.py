@@ -0,0 +1,173 @@
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+# 색인 파일 확장자와 헤더(식별자, 색인한 로그 바이트 수, 로그 inode, 로그 앞부분 CRC32).
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'MLI2'
+INDEX_HEADER = struct.Struct('<4sQQI')
+# 로그 교체 여부를 판단하기 위해 지문(CRC32)을 계산하는 앞부분 바이트 수.
+FINGERPRINT_SIZE = 4096
+# 로그 한 줄의 timestamp 길이(YYYY-MM-DD HH:MM:SS).
+TIMESTAMP_LENGTH = 19
+EPOCH = datetime(1970, 1, 1)
+# 역방향 읽기 시 한 번에 읽는 바이트 수.
+REVERSE_BLOCK_SIZE = 64 * 1024
+
+
+def to_epoch(timestamp):
+    """'YYYY-MM-DD HH:MM:SS' 문자열 또는 datetime을 초 단위 정수로 변환한다."""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp[:TIMESTAMP_LENGTH])
+    return int((timestamp - EPOCH).total_seconds())
+
+
+class LogReader:
+    """
+    mission_computer_main.log 형식(timestamp,event,message)의 로그를 읽는 클래스.
+    timestamp → 바이트 오프셋 색인을 옆 파일(.idx)에 저장해 두고, 로그가 늘어나면 추가된 부분만 색인한다.
+    시간 범위 조회와 마지막 N줄 조회는 mmap에서 필요한 위치로 바로 이동해 읽는다.
+    """
+
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + INDEX_SUFFIX
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._size = stat.st_size
+        self._inode = stat.st_ino
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b''
+        self._timestamps = array('q')
+        self._offsets = array('q')
+        self._load_index()
+
+    def _load_index(self):
+        """
+        색인 파일을 읽고, 로그가 늘어났으면 추가된 줄만 색인해 저장한다.
+        로그가 교체되었으면(inode나 앞부분 지문이 다르거나 크기가 줄어듦) 처음부터 다시 색인한다.
+        """
+        indexed_size = 0
+        try:
+            with open(self.index_path, 'rb') as index:
+                magic, indexed_size, inode, fingerprint = INDEX_HEADER.unpack(index.read(INDEX_HEADER.size))
+                pairs = array('q')
+                pairs.frombytes(index.read())
+            # 색인 형식이 다르거나 손상되었으면 처음부터 다시 색인한다.
+            if magic != INDEX_MAGIC or len(pairs) % 2:
+                raise ValueError
+            if (inode != self._inode or indexed_size > self._size
+                    or fingerprint != self._fingerprint(indexed_size)):
+                print('로그 파일이 교체되어 색인을 다시 만듭니다:', self.path)
+                raise ValueError
+            self._timestamps = pairs[0::2]
+            self._offsets = pairs[1::2]
+        except (FileNotFoundError, ValueError, struct.error):
+            indexed_size = 0
+            self._timestamps = array('q')
+            self._offsets = array('q')
+
+        if indexed_size < self._size:
+            indexed_size = self._index_from(indexed_size)
+            self._save_index(indexed_size)
+
+    def _fingerprint(self, indexed_size):
+        """색인한 영역 중 앞부분 FINGERPRINT_SIZE 바이트의 CRC32를 반환한다."""
+        return zlib.crc32(self._map[:min(indexed_size, FINGERPRINT_SIZE)])
+
+    def _index_from(self, position):
+        """position부터 끝까지 완전한 줄(개행으로 끝나는 줄)을 색인하고 색인한 끝 위치를 반환한다."""
+        buffer = self._map
+        while position < self._size:
+            end = buffer.find(b'\n', position)
+            if end == -1:
+                # 아직 기록 중인 마지막 줄은 다음에 색인한다.
+                break
+            try:
+                epoch = to_epoch(buffer[position:position + TIMESTAMP_LENGTH].decode('ascii'))
+            except (ValueError, UnicodeDecodeError):
+                # 헤더 등 timestamp가 없는 줄은 색인하지 않는다.
+                epoch = None
+            if epoch is not None:
+                self._timestamps.append(epoch)
+                self._offsets.append(position)
+            position = end + 1
+        return position
+
+    def _save_index(self, indexed_size):
+        pairs = array('q', bytes(16 * len(self._offsets)))
+        pairs[0::2] = self._timestamps
+        pairs[1::2] = self._offsets
+        temp_path = self.index_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as index:
+                index.write(INDEX_HEADER.pack(INDEX_MAGIC, indexed_size, self._inode,
+                                              self._fingerprint(indexed_size)))
+                pairs.tofile(index)
+            os.replace(temp_path, self.index_path)
+        except OSError as error:
+            print('ERROR: 색인 파일을 저장할 수 없습니다: ', error)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    @property
+    def header(self):
+        """로그의 첫 줄(헤더)을 반환한다."""
+        end = self._map.find(b'\n')
+        return self._map[:end if end != -1 else self._size].decode('utf-8').rstrip('\r')
+
+    def _line_at(self, offset):
+        end = self._map.find(b'\n', offset)
+        return self._map[offset:end if end != -1 else self._size].decode('utf-8').rstrip('\r')
+
+    def between(self, start, end):
+        """start 이상 end 이하 시각의 줄을 시간 순서로 생성한다(timestamp 문자열 또는 datetime)."""
+        low = bisect_left(self._timestamps, to_epoch(start))
+        high = bisect_right(self._timestamps, to_epoch(end))
+        for number in range(low, high):
+            yield self._line_at(self._offsets[number])
+
+    def iter_reverse(self):
+        """
+        파일 끝에서부터 블록 단위로 거꾸로 읽어 마지막 줄부터 헤더 직전 줄까지 생성한다.
+        시간 순서로 기록되는 로그이므로 정렬 없이 최신순 출력이 된다.
+        """
+        header_end = self._map.find(b'\n') + 1 if self._size else 0
+        position = self._size
+        remainder = b''
+        while position > header_end:
+            start = max(header_end, position - REVERSE_BLOCK_SIZE)
+            block = self._map[start:position] + remainder
+            lines = block.split(b'\n')
+            # 블록의 첫 조각은 앞 블록과 이어질 수 있으므로 남겨둔다.
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.decode('utf-8').rstrip('\r')
+            position = start
+        if remainder.strip():
+            yield remainder.decode('utf-8').rstrip('\r')
+
+    def tail(self, count):
+        """마지막 count줄을 최신순으로 반환한다."""
+        lines = []
+        for line in self.iter_reverse():
+            if len(lines) >= count:
+                break
+            lines.append(line)
+        return lines
+
+    def close(self):
+        if self._size:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
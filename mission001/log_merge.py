@@ -0,0 +1,215 @@
+import argparse
+import heapq
+import json
+import os
+import time
+from log_anomaly import DEFAULT_RULES, RuleSet, SEVERITY_LEVELS
+from log_index import TIMESTAMP_LENGTH
+
+# 파일별 읽은 위치와 보고서 내용을 저장하는 상태 파일 경로.
+STATE_PATH = 'mission001/log_follow_state.json'
+# 사고 원인 보고서 경로.
+REPORT_PATH = 'mission001/log_analysis.md'
+# follow 모드에서 파일 변경을 확인하는 주기(초).
+POLL_INTERVAL = 1.0
+# 새로 추가된 부분을 한 번에 읽는 최대 바이트 수.
+READ_CHUNK_SIZE = 1024 * 1024
+# 상태 파일과 보고서에 보관하는 최근 이상 징후 수(심각도별 개수는 전체를 누적).
+MAX_ANOMALIES = 500
+
+
+def _timestamp(line):
+    """줄 앞의 'YYYY-MM-DD HH:MM:SS'를 정렬 키로 반환한다(문자열 비교로 시간 순서가 유지됨)."""
+    return line[:TIMESTAMP_LENGTH]
+
+
+def _is_header(line):
+    return not line[:4].isdigit()
+
+
+def iter_log(path):
+    """로그 파일을 한 줄씩 읽어 (timestamp, 파일 경로, 줄)을 생성한다. 헤더는 건너뛴다."""
+    with open(path, 'r', encoding='utf-8') as log_file:
+        for line in log_file:
+            line = line.rstrip('\r\n')
+            if line and not _is_header(line):
+                yield _timestamp(line), path, line
+
+
+def merge_logs(paths):
+    """
+    시간 순서로 기록된 여러 로그를 하나의 시간 순서 스트림으로 병합한다.
+    heapq.merge는 파일마다 한 줄만 들고 있으므로 파일 크기와 무관하게 메모리 사용량이 일정하다.
+    """
+    return heapq.merge(*(iter_log(path) for path in paths))
+
+
+class LogFollower:
+    """
+    로그 파일별로 마지막으로 읽은 바이트 위치를 상태 파일에 저장해 두고,
+    이후에는 새로 추가된 바이트만 읽는다. 파일이 교체(inode 변경)되거나 줄어들면 처음부터 읽는다.
+    """
+
+    def __init__(self, paths, state_path=STATE_PATH):
+        self.paths = list(paths)
+        self.state_path = state_path
+        self.state = self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as state_file:
+                state = json.load(state_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        state.setdefault('offsets', {})
+        state.setdefault('anomalies', [])
+        if 'counts' not in state:
+            # 개수를 따로 저장하기 전의 상태 파일이면 보관된 이상 징후로 센다.
+            state['counts'] = {level: 0 for level in SEVERITY_LEVELS}
+            for severity, *_ in state['anomalies']:
+                state['counts'][severity] += 1
+        del state['anomalies'][:-MAX_ANOMALIES]
+        return state
+
+    def save_state(self):
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as state_file:
+            json.dump(self.state, state_file, ensure_ascii=False)
+        os.replace(temp_path, self.state_path)
+
+    def read_new(self, path):
+        """
+        path에서 지난번 이후 추가된 완전한 줄(개행으로 끝나는 줄)을 (timestamp, 파일 경로, 줄)로 생성한다.
+        READ_CHUNK_SIZE 바이트씩 읽으므로 처음 읽거나 교체된 큰 파일도 메모리 사용량이 일정하며,
+        읽은 위치는 줄을 생성할 때마다 상태에 반영한다.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+        saved = self.state['offsets'].get(path, {'offset': 0, 'inode': stat.st_ino})
+        offset = saved['offset']
+        # 파일이 교체되었거나 잘렸으면 처음부터 다시 읽는다.
+        if saved['inode'] != stat.st_ino or stat.st_size < offset:
+            offset = 0
+        self.state['offsets'][path] = {'offset': offset, 'inode': stat.st_ino}
+
+        with open(path, 'rb') as log_file:
+            log_file.seek(offset)
+            remaining = stat.st_size - offset
+            pending = b''
+            while remaining > 0:
+                chunk = log_file.read(min(READ_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                pieces = (pending + chunk).split(b'\n')
+                # 마지막 조각은 다음 조각과 이어지거나 아직 기록 중인 줄이므로 남겨둔다.
+                pending = pieces.pop()
+                for raw in pieces:
+                    offset += len(raw) + 1
+                    self.state['offsets'][path]['offset'] = offset
+                    line = raw.decode('utf-8', errors='replace').rstrip('\r')
+                    if line and not _is_header(line):
+                        yield _timestamp(line), path, line
+
+    def poll(self):
+        """모든 파일의 새 줄을 시간 순서로 병합해 하나씩 생성한다(파일마다 한 조각만 메모리에 둠)."""
+        return heapq.merge(*(self.read_new(path) for path in self.paths))
+
+    def _signature(self):
+        signature = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return signature
+
+    def follow(self, interval=POLL_INTERVAL):
+        """
+        파일 상태(stat)를 주기적으로 확인해 변경이 있을 때만 새 줄 묶음(생성기)을 생성한다.
+        묶음은 다음 묶음을 요청하기 전에 끝까지 읽어야 한다. Ctrl+C로 종료할 때까지 반복한다.
+        """
+        last_signature = None
+        while True:
+            signature = self._signature()
+            if signature != last_signature:
+                last_signature = signature
+                yield self.poll()
+            time.sleep(interval)
+
+
+def update_report(state, batch, rule_set, report_path=REPORT_PATH):
+    """
+    새 줄 묶음에서만 이상 징후를 찾아 상태에 누적하고 보고서를 다시 만든다.
+    이전에 읽은 로그는 다시 읽지 않는다. 심각도별 개수는 전체를 누적하고,
+    이상 징후 줄은 최근 MAX_ANOMALIES개만 보관해 상태 파일 크기가 일정하다.
+    """
+    added = 0
+    anomalies = state['anomalies']
+    for _, path, line in batch:
+        rule = rule_set.match(line)
+        if rule:
+            anomalies.append([rule.severity, rule.name, path, line])
+            state['counts'][rule.severity] = state['counts'].get(rule.severity, 0) + 1
+            added += 1
+    del anomalies[:-MAX_ANOMALIES]
+    if added or not os.path.exists(report_path):
+        write_report(anomalies, report_path, state['counts'])
+    return added
+
+
+def write_report(anomalies, report_path=REPORT_PATH, counts=None):
+    """
+    이상 징후로 사고 원인 보고서(마크다운)를 작성한다.
+    counts(심각도별 전체 개수)가 없으면 anomalies에서 센다.
+    """
+    if counts is None:
+        counts = {level: 0 for level in SEVERITY_LEVELS}
+        for severity, *_ in anomalies:
+            counts[severity] += 1
+    try:
+        with open(report_path, 'w', encoding='utf-8') as report:
+            report.write('# 사고 원인 분석 보고서\n\n')
+            report.write(', '.join(f'{level}: {count}' for level, count in counts.items()) + '\n\n')
+            if sum(counts.values()) > len(anomalies):
+                report.write(f'최근 {len(anomalies)}건만 표시합니다.\n\n')
+            report.write('| 심각도 | 규칙 | 로그 파일 | 내용 |\n|---|---|---|---|\n')
+            for severity, name, path, line in anomalies:
+                report.write(f'| {severity} | {name} | {os.path.basename(path)} | {line} |\n')
+    except OSError as error:
+        print('ERROR: 보고서 생성 중 오류 발생: ', error)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='여러 미션 컴퓨터 로그 병합 및 추적')
+    parser.add_argument('logs', nargs='+', help='로그 파일 경로')
+    parser.add_argument('--follow', action='store_true', help='새로 추가되는 줄을 계속 추적')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='follow 모드 확인 주기(초)')
+    parser.add_argument('--state', default=STATE_PATH, help='읽은 위치를 저장할 상태 파일')
+    parser.add_argument('--report', default=REPORT_PATH, help='사고 원인 보고서 경로')
+    args = parser.parse_args()
+
+    if not args.follow:
+        for _, path, line in merge_logs(args.logs):
+            print(f'{os.path.basename(path)}: {line}')
+    else:
+        follower = LogFollower(args.logs, args.state)
+        rules = RuleSet(DEFAULT_RULES, min_severity='WARNING')
+
+        def echo(lines):
+            # 새 줄을 출력하면서 그대로 보고서 갱신에 넘긴다.
+            for item in lines:
+                print(f'{os.path.basename(item[1])}: {item[2]}')
+                yield item
+
+        try:
+            for new_lines in follower.follow(args.interval):
+                if update_report(follower.state, echo(new_lines), rules, args.report):
+                    print(f'보고서를 갱신했습니다: {args.report}')
+                follower.save_state()
+        except KeyboardInterrupt:
+            follower.save_state()
+            print('\n추적을 종료합니다.')
@@ -1,9 +1,8 @@
 # log 파일 읽기.
 try:
     with open('mission001/mission_computer_main.log', 'r', encoding='utf-8') as log_file:
-        # 효율적인 메모리 사용을 위해 readlines() 사용.
-        log_lines = log_file.readlines()
-        for line in log_lines:
+        # 효율적인 메모리 사용을 위해 파일 전체를 읽지 않고 한 줄씩 출력.
+        for line in log_file:
             print(line.strip())
 # 해당 경로에 파일이 존재하지 않을 경우,
 except FileNotFoundError:
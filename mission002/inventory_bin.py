@@ -0,0 +1,208 @@
+import mmap
+import struct
+import sys
+from array import array
+from inventory_stream import InventoryRecord
+
+# 파일 시작과 끝에 기록하는 식별자와 형식 버전.
+MAGIC = b'MBIV'
+VERSION = 1
+# 파일 헤더: 식별자, 버전, 바이트 순서(0: little, 1: big), 열 수, 행 수.
+FILE_HEADER = struct.Struct('<4sHBBQ')
+# 열 스키마: 열 종류('d': 실수 열, 's': 문자열 표 번호 열), 배열 형식 코드, 이름 길이(뒤에 UTF-8 이름).
+COLUMN_SCHEMA = struct.Struct('<ccH')
+# 인덱스 푸터의 구역 하나: 시작 위치, 길이.
+SECTION = struct.Struct('<QQ')
+# 파일 끝: 인덱스 푸터 시작 위치, 식별자.
+TRAILER = struct.Struct('<Q4s')
+# 열 구역의 정렬 단위(mmap 위에서 바로 배열로 해석하기 위함).
+ALIGNMENT = 8
+
+# 적재화물 열의 종류. 인화성만 실수이고 나머지는 'Various' 등이 섞여 있어 문자열 표로 저장.
+INVENTORY_TYPES = ('s', 's', 's', 's', 'd')
+# 문자열 표 번호 열의 배열 형식(문자열이 65,536개 미만이면 2바이트, 아니면 4바이트 부호 없는 정수).
+SMALL_INDEX_TYPECODE = 'H'
+INDEX_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+
+
+def _pad(file):
+    """현재 위치를 ALIGNMENT 배수로 맞추기 위해 0을 채운다."""
+    remainder = file.tell() % ALIGNMENT
+    if remainder:
+        file.write(b'\0' * (ALIGNMENT - remainder))
+
+
+def write_inventory_bin(path, header, records):
+    """
+    적재화물 행을 열 기반 이진 파일로 저장하고 저장한 행 수를 반환한다.
+    [헤더 + 스키마][열 구역...][문자열 표 오프셋][문자열 표 데이터][인덱스 푸터][트레일러] 순서로 기록한다.
+    """
+    names = header.split(',')
+    if len(names) != len(INVENTORY_TYPES):
+        raise ValueError(f'열 수가 스키마와 다릅니다: {header}')
+
+    # 실수 열은 array('d'), 문자열 열은 중복을 제거한 문자열 표의 번호로 저장한다.
+    columns = [array('d') if kind == 'd' else array(INDEX_TYPECODE) for kind in INVENTORY_TYPES]
+    string_ids = {}
+    strings = []
+    count = 0
+    for record in records:
+        for column, kind, value in zip(columns, INVENTORY_TYPES, record):
+            if kind == 'd':
+                column.append(value)
+            else:
+                string_id = string_ids.get(value)
+                if string_id is None:
+                    string_id = string_ids[value] = len(strings)
+                    strings.append(value.encode('utf-8'))
+                column.append(string_id)
+        count += 1
+
+    # 문자열 종류가 적으면 번호 열을 2바이트 정수로 줄인다.
+    if len(strings) <= 0xFFFF:
+        columns = [column if kind == 'd' else array(SMALL_INDEX_TYPECODE, column)
+                   for column, kind in zip(columns, INVENTORY_TYPES)]
+
+    string_offsets = array('Q', [0])
+    for encoded in strings:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+
+    byteorder = 0 if sys.byteorder == 'little' else 1
+    with open(path, 'wb') as save:
+        save.write(FILE_HEADER.pack(MAGIC, VERSION, byteorder, len(names), count))
+        for name, kind, column in zip(names, INVENTORY_TYPES, columns):
+            encoded = name.encode('utf-8')
+            save.write(COLUMN_SCHEMA.pack(kind.encode(), column.typecode.encode(), len(encoded)) + encoded)
+
+        sections = []
+        for data in columns + [string_offsets]:
+            _pad(save)
+            sections.append((save.tell(), len(data) * data.itemsize))
+            data.tofile(save)
+        _pad(save)
+        sections.append((save.tell(), string_offsets[-1]))
+        for encoded in strings:
+            save.write(encoded)
+
+        # 인덱스 푸터: 각 구역의 위치와 길이.
+        footer = save.tell()
+        for offset, length in sections:
+            save.write(SECTION.pack(offset, length))
+        save.write(TRAILER.pack(footer, MAGIC))
+    return count
+
+
+class InventoryBin:
+    """
+    write_inventory_bin으로 저장한 파일을 mmap으로 여는 읽기 전용 클래스.
+    파일 전체를 파싱하지 않고 필요한 열이나 N번째 행만 바로 읽는다.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f'빈 파일입니다: {path}')
+        self._views = []
+        try:
+            self._load_layout()
+        except Exception:
+            self.close()
+            raise
+
+    def _load_layout(self):
+        buffer = self._map
+        magic, version, byteorder, column_count, self._rows = FILE_HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('적재화물 이진 파일 형식이 아닙니다.')
+        if byteorder != (0 if sys.byteorder == 'little' else 1):
+            raise ValueError('바이트 순서가 다른 시스템에서 저장된 파일입니다.')
+
+        position = FILE_HEADER.size
+        self.names = []
+        self.types = []
+        typecodes = []
+        for _ in range(column_count):
+            kind, typecode, length = COLUMN_SCHEMA.unpack_from(buffer, position)
+            position += COLUMN_SCHEMA.size
+            self.names.append(bytes(buffer[position:position + length]).decode('utf-8'))
+            self.types.append(kind.decode())
+            typecodes.append(typecode.decode())
+            position += length
+
+        footer, trailer_magic = TRAILER.unpack_from(buffer, len(buffer) - TRAILER.size)
+        if trailer_magic != MAGIC:
+            raise ValueError('인덱스 푸터가 손상되었습니다.')
+        sections = [SECTION.unpack_from(buffer, footer + number * SECTION.size)
+                    for number in range(column_count + 2)]
+
+        # 각 구역을 복사 없이 배열처럼 읽을 수 있는 memoryview로 만든다.
+        self._columns = []
+        for (offset, length), typecode in zip(sections, typecodes):
+            self._columns.append(self._view(offset, length, typecode))
+        self._string_offsets = self._view(*sections[column_count], 'Q')
+        self._string_data_offset = sections[column_count + 1][0]
+        self._string_cache = {}
+
+    def _view(self, offset, length, typecode):
+        view = memoryview(self._map)[offset:offset + length].cast(typecode)
+        self._views.append(view)
+        return view
+
+    @property
+    def header(self):
+        return ','.join(self.names)
+
+    def __len__(self):
+        return self._rows
+
+    def _string(self, string_id):
+        """문자열 표의 string_id번째 문자열을 반환한다(한 번 읽은 문자열은 캐시)."""
+        text = self._string_cache.get(string_id)
+        if text is None:
+            start = self._string_data_offset + self._string_offsets[string_id]
+            end = self._string_data_offset + self._string_offsets[string_id + 1]
+            text = self._string_cache[string_id] = self._map[start:end].decode('utf-8')
+        return text
+
+    def column(self, name):
+        """
+        열 하나를 반환한다. 실수 열은 mmap 위의 memoryview(복사 없음),
+        문자열 열은 문자열 목록을 반환한다.
+        """
+        number = self.names.index(name)
+        view = self._columns[number]
+        if self.types[number] == 'd':
+            return view
+        return [self._string(string_id) for string_id in view]
+
+    def row(self, index):
+        """N번째 행을 InventoryRecord로 반환한다."""
+        if not -self._rows <= index < self._rows:
+            raise IndexError(index)
+        index %= self._rows
+        values = []
+        for kind, view in zip(self.types, self._columns):
+            values.append(view[index] if kind == 'd' else self._string(view[index]))
+        return InventoryRecord(*values)
+
+    def __iter__(self):
+        for index in range(self._rows):
+            yield self.row(index)
+
+    def close(self):
+        # mmap을 닫기 전에 memoryview를 모두 해제해야 한다.
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._columns = []
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
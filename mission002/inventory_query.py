@@ -0,0 +1,88 @@
+import argparse
+import heapq
+from inventory_stream import (FLAMMABILITY_THRESHOLD, read_header, read_records, filter_flammable,
+                              external_sort, flammability_key, format_record)
+from inventory_bin import InventoryBin
+
+
+def top_k(records, k):
+    """
+    인화성이 가장 높은 k개 행을 높은 순으로 반환한다.
+    전체를 정렬하지 않고 크기 k의 힙만 유지한다(O(n log k)). 같은 값은 입력 순서를 유지한다.
+    """
+    return heapq.nlargest(k, records, key=flammability_key)
+
+
+def above_threshold(records, threshold=FLAMMABILITY_THRESHOLD, limit=None):
+    """
+    인화성이 threshold 이상인 행을 높은 순으로 반환한다.
+    limit이 있으면 상위 limit개만 힙으로 골라 리스트로, 없으면 기준을 넘는 행을
+    외부 병합 정렬로 정렬해 생성기로 반환한다(메모리 예산을 넘으면 임시 파일 사용).
+    """
+    matches = filter_flammable(records, threshold)
+    if limit is not None:
+        return top_k(matches, limit)
+    return external_sort(matches)
+
+
+def top_k_bin(inventory, k, threshold=None):
+    """
+    열 기반 bin 파일(InventoryBin)에서 인화성 열만 읽어 상위 k개 행을 높은 순으로 반환한다.
+    선택된 행만 InventoryRecord로 만들고 나머지 행은 문자열 열을 읽지 않는다.
+    """
+    column = inventory.column('Flammability')
+    indexes = range(len(column))
+    if threshold is not None:
+        indexes = (index for index in indexes if column[index] >= threshold)
+    if k is None:
+        selected = sorted(indexes, key=column.__getitem__, reverse=True)
+    else:
+        selected = heapq.nlargest(k, indexes, key=column.__getitem__)
+    return [inventory.row(index) for index in selected]
+
+
+def query(path, threshold=None, k=None):
+    """
+    csv 또는 bin 파일에서 인화성 기준값 이상 및/또는 상위 k개 행을 높은 순으로 반환한다.
+    (헤더, 행 목록)을 반환한다.
+    """
+    if path.endswith('.bin'):
+        with InventoryBin(path) as inventory:
+            return inventory.header, top_k_bin(inventory, k, threshold)
+    records = read_records(path)
+    if threshold is not None:
+        return read_header(path), above_threshold(records, threshold, k)
+    if k is None:
+        raise ValueError('threshold 또는 k 중 하나는 지정해야 합니다.')
+    return read_header(path), top_k(records, k)
+
+
+def write_records_csv(path, header, records):
+    """행을 csv 파일에 하나씩 기록하고 기록한 행 수를 반환한다."""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as save:
+        save.write(header + '\n')
+        for record in records:
+            save.write(format_record(record) + '\n')
+            count += 1
+    return count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='적재화물 인화성 조회')
+    parser.add_argument('path', help='적재화물 csv 또는 bin 파일 경로')
+    parser.add_argument('--threshold', type=float, help='인화성 기준값 (예: 0.7)')
+    parser.add_argument('--top', type=int, help='인화성 상위 N개')
+    parser.add_argument('--output', help='결과를 저장할 csv 파일 경로 (생략하면 화면 출력)')
+    args = parser.parse_args()
+
+    if args.threshold is None and args.top is None:
+        args.threshold = FLAMMABILITY_THRESHOLD
+    header, result = query(args.path, args.threshold, args.top)
+    if args.output:
+        saved = write_records_csv(args.output, header, result)
+        print(f'{saved}개 행을 {args.output}에 저장했습니다.')
+    else:
+        print(header)
+        for record in result:
+            print(format_record(record))
@@ -0,0 +1,127 @@
+import csv
+import heapq
+import os
+import pickle
+import tempfile
+from collections import namedtuple
+
+# 인화성 수치가 들어 있는 열 번호와 고인화성 기준값.
+FLAMMABILITY_INDEX = 4
+FLAMMABILITY_THRESHOLD = 0.7
+# 메모리에 한 번에 올려 정렬할 최대 행 수(초과하면 임시 파일로 내보냄).
+MEMORY_BUDGET_ROWS = 100_000
+# 임시 파일에 한 번에 기록하는 행 수.
+SPILL_BLOCK_ROWS = 1_000
+
+# 적재화물 한 행(인화성만 실수, 나머지는 'Various' 등이 섞여 있어 문자열로 유지).
+InventoryRecord = namedtuple('InventoryRecord', ['substance', 'weight', 'specific_gravity', 'strength', 'flammability'])
+
+
+def parse_record(row):
+    """csv 행(List)을 InventoryRecord로 변환한다. 인화성 수치를 변환할 수 없으면 ValueError."""
+    return InventoryRecord(row[0], row[1], row[2], row[3], float(row[FLAMMABILITY_INDEX]))
+
+
+def format_flammability(value):
+    """
+    인화성 수치를 손실 없이 문자열로 변환한다.
+    repr()로 유효 숫자를 모두 유지하고, 정수 값은 원본처럼 '.0' 없이 쓴다.
+    """
+    text = repr(value)
+    return text[:-2] if text.endswith('.0') else text
+
+
+def format_record(record):
+    """InventoryRecord를 csv 한 줄(개행 제외)로 변환한다."""
+    return ','.join(record[:FLAMMABILITY_INDEX] + (format_flammability(record.flammability),))
+
+
+def read_header(path):
+    """csv 파일의 헤더 줄을 반환한다."""
+    with open(path, 'r', encoding='utf-8') as inventory:
+        return inventory.readline().strip()
+
+
+def read_records(path):
+    """
+    csv 파일을 한 줄씩 읽어 InventoryRecord를 하나씩 생성한다.
+    각 행은 한 번만 파싱하며, 인화성 수치를 변환할 수 없는 행은 건너뛴다.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as inventory:
+        reader = csv.reader(inventory)
+        # 헤더 영역은 건너뛴다.
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            try:
+                yield parse_record(row)
+            # 숫자를 변환할 수 없는 행일 경우 무시.
+            except (ValueError, IndexError):
+                continue
+
+
+def filter_flammable(records, threshold=FLAMMABILITY_THRESHOLD):
+    """인화성 수치가 threshold 이상인 행만 통과시키는 생성기."""
+    for record in records:
+        if record.flammability >= threshold:
+            yield record
+
+
+def flammability_key(record):
+    """정렬과 힙 선택에 쓰는 인화성 수치 키 함수."""
+    return record.flammability
+
+
+def _spill_run(records, directory):
+    """정렬된 행 목록을 임시 파일에 블록 단위로 기록하고 파일 경로를 반환한다."""
+    handle, path = tempfile.mkstemp(prefix='inventory_run_', suffix='.tmp', dir=directory)
+    with os.fdopen(handle, 'wb') as run:
+        for start in range(0, len(records), SPILL_BLOCK_ROWS):
+            pickle.dump(records[start:start + SPILL_BLOCK_ROWS], run, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    """임시 파일에 기록된 정렬된 행을 블록 단위로 읽어 하나씩 생성한다."""
+    with open(path, 'rb') as run:
+        while True:
+            try:
+                block = pickle.load(run)
+            except EOFError:
+                return
+            yield from block
+
+
+def external_sort(records, key=flammability_key, reverse=True, memory_budget=MEMORY_BUDGET_ROWS, directory=None):
+    """
+    행을 key 기준으로 정렬해 하나씩 생성한다(기본값: 인화성 내림차순).
+    memory_budget 행까지는 메모리에서 정렬하고, 넘으면 정렬된 구간(run)을 임시 파일로 내보낸 뒤
+    heapq.merge로 병합한다. 같은 값의 행은 입력 순서를 유지한다.
+    """
+    buffer = []
+    run_paths = []
+    try:
+        for record in records:
+            buffer.append(record)
+            if len(buffer) >= memory_budget:
+                buffer.sort(key=key, reverse=reverse)
+                run_paths.append(_spill_run(buffer, directory))
+                buffer = []
+        buffer.sort(key=key, reverse=reverse)
+
+        # 임시 파일로 내보낸 적이 없으면 메모리에서 바로 반환.
+        if not run_paths:
+            yield from buffer
+            return
+
+        runs = [_read_run(path) for path in run_paths]
+        runs.append(iter(buffer))
+        yield from heapq.merge(*runs, key=key, reverse=reverse)
+    finally:
+        for path in run_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
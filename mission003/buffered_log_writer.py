@@ -0,0 +1,106 @@
+import os
+import struct
+import time
+
+# 이진 기록 형식: timestamp(YYYY-MM-DD HH:MM:SS, 19바이트) + 환경 값 6개(float64).
+BINARY_RECORD = struct.Struct('<19s6d')
+# fsync 정책: 'never'(운영체제에 맡김), 'flush'(버퍼를 비울 때마다), 'close'(닫을 때 한 번).
+FSYNC_POLICIES = ('never', 'flush', 'close')
+
+
+class BufferedLogWriter:
+    """
+    센서 기록을 메모리에 모았다가 한 번에 파일로 쓰는 클래스.
+    파일은 한 번만 열어 두고, 기록 수(max_records), 크기(max_bytes), 시간(flush_interval초)
+    중 하나를 넘거나 close()/with 블록이 끝날 때 버퍼를 비운다.
+    """
+
+    def __init__(self, path, headers=None, binary=False, max_records=1000, max_bytes=64 * 1024,
+                 flush_interval=5.0, fsync='never'):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f'알 수 없는 fsync 정책입니다: {fsync}')
+        self.path = path
+        self.binary = binary
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._last_flush = time.monotonic()
+        self._file = open(path, 'ab')
+        # 텍스트 기록이고 파일이 처음 만들어졌으면 헤더 생성.
+        if not binary and headers and self._file.tell() == 0:
+            self._append((','.join(headers) + '\n').encode('utf-8'))
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def _append(self, data):
+        self._buffer.append(data)
+        self._buffer_bytes += len(data)
+
+    def write(self, timestamp, values):
+        """timestamp와 환경 값 목록을 기록 하나로 버퍼에 추가하고, 기준을 넘으면 파일로 쓴다."""
+        if self.binary:
+            self._append(BINARY_RECORD.pack(timestamp.encode('ascii'), *values))
+        else:
+            self._append((f'{timestamp},' + ','.join(f'{value:.2f}' for value in values) + '\n').encode('utf-8'))
+
+        if (len(self._buffer) >= self.max_records or self._buffer_bytes >= self.max_bytes
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def write_block(self, data):
+        """이미 형식에 맞게 만들어진 기록 묶음(bytes)을 버퍼를 거치지 않고 한 번의 write로 쓴다."""
+        # 기록 순서를 지키기 위해 버퍼에 남은 기록을 먼저 쓴다.
+        if self._buffer:
+            self._file.write(b''.join(self._buffer))
+            self._buffer.clear()
+            self._buffer_bytes = 0
+        self._file.write(data)
+        self._sync()
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """버퍼에 모인 기록을 한 번의 write로 파일에 쓴다."""
+        if self._buffer:
+            self._file.write(b''.join(self._buffer))
+            self._buffer.clear()
+            self._buffer_bytes = 0
+        self._sync()
+        self._last_flush = time.monotonic()
+
+    def _sync(self):
+        self._file.flush()
+        if self.fsync == 'flush':
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+            if self.fsync == 'close':
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_binary_log(path):
+    """이진 기록 파일을 읽어 (timestamp, 환경 값 튜플)을 하나씩 생성한다."""
+    with open(path, 'rb') as log:
+        while True:
+            chunk = log.read(BINARY_RECORD.size * 1024)
+            if not chunk:
+                break
+            for timestamp, *values in BINARY_RECORD.iter_unpack(chunk[:len(chunk) - len(chunk) % BINARY_RECORD.size]):
+                yield timestamp.decode('ascii'), tuple(values)
@@ -1,5 +1,6 @@
-# log 파일의 경로.
+# log 파일의 경로(텍스트 기록, 이진 기록).
 LOG_PATH = 'mission003/dummy_sensor_values.log'
+BINARY_LOG_PATH = 'mission003/dummy_sensor_values.bin'
 
 # 환경 변수명.
 IN_TEMP = 'mars_base_internal_temperature'
@@ -10,11 +11,18 @@ CO2 = 'mars_base_internal_co2'
 OXYGEN = 'mars_base_internal_oxygen'
 
 import random
+from datetime import datetime
+from buffered_log_writer import BufferedLogWriter
+from sensor_clock import SensorClock
+
+# 센서 시계의 시작 시각.
+START_TIME = datetime(2023, 8, 27, 12, 0, 0)
 
 # 테스트를 위해 생성하는 환경 정보 클래스.
 class DummySensor:
     # DummySensor 클래스 초기화.
-    def __init__(self):
+    # binary=True면 이진 기록, fsync는 'never', 'flush', 'close' 중 하나.
+    def __init__(self, log_path=None, binary=False, max_records=1000, flush_interval=5.0, fsync='never'):
         # 화성 기지의 내부, 외부의 온도, 습도, 광량, 이산화탄소 농도, 산소 농도 초기화.
         self._env_values = {
             IN_TEMP: 0.0,
@@ -34,125 +42,132 @@ class DummySensor:
             OXYGEN: (4, 7)
         }
 
-        # 날짜 및 시간 초기화.
-        self._year = 2023 
-        self._month = 8
-        self._day = 27
-        self._hour = 12
-        self._minute = 0
-        self._second = 0
+        # 날짜 및 시간 초기화(기준 시각부터의 초 하나로 관리).
+        self._clock = SensorClock(START_TIME)
 
-        # log 파일 초기화.
-        self._init_log()
+        # 센서가 소유하는 버퍼 기록기(파일은 한 번만 열고 기록을 모아서 씀).
+        self._log_writer = self._init_log(log_path or (BINARY_LOG_PATH if binary else LOG_PATH),
+                                          binary, max_records, flush_interval, fsync)
 
     # 각 변수에 주어진 범위 내의 랜덤 값 설정(random.uniform 사용).
     def set_env(self):
         # 각 환경 변수에 범위를 지정해 실수로 저장.
-        for key, range in self.__env_ranges.items():
-            self.__env_values[key] = random.uniform(*range)
+        for key, range in self._env_ranges.items():
+            self._env_values[key] = random.uniform(*range)
 
     # 랜덤 값으로 설정된 변수를 반환.
     def get_env(self):
         # timestamp 생성.
         timestamp = self._set_timestamp()
-        # 환경 값을 로그로 변환.
-        log_entity = f'{timestamp},' + ','.join(f'{value:.2f}' for value in self.__env_values.values()) + '\n'
-        
-        # log_entity를 log 파일에 저장.
+
+        # 환경 값을 버퍼에 추가(버퍼가 차거나 일정 시간이 지나면 파일에 한 번에 저장).
+        if self._log_writer:
+            try:
+                self._log_writer.write(timestamp, self._env_values.values())
+            # 파일에 대한 접근 권한이 없을 경우,
+            except PermissionError:
+                print('ERROR: 파일의 접근 권한이 없습니다.')
+            # 알 수 없는 오류가 발생할 경우,
+            except Exception as error:
+                print('ERROR: 알 수 없는 오류가 발생: ', error)
+
+        return self._env_values
+
+    # 환경값을 저장하는 log 기록기 생성(최초 파일 생성 시 헤더 생성).
+    def _init_log(self, path, binary, max_records, flush_interval, fsync):
         try:
-            with open(LOG_PATH, 'a', encoding='utf-8') as log:
-                log.write(log_entity)
+            headers = ['timestamp'] + list(self._env_values.keys())
+            return BufferedLogWriter(path, headers, binary=binary, max_records=max_records,
+                                     flush_interval=flush_interval, fsync=fsync)
         # 파일에 대한 접근 권한이 없을 경우,
         except PermissionError:
             print('ERROR: 파일의 접근 권한이 없습니다.')
-        # 파일을 인코딩할 수 없을 경우,
-        except UnicodeEncodeError:
-            print('파일을 읽을 수 없습니다.')
         # 알 수 없는 오류가 발생할 경우,
         except Exception as error:
             print('ERROR: 알 수 없는 오류가 발생: ', error)
+        return None
+
+    # 버퍼에 남은 기록을 저장하고 log 파일을 닫음.
+    def close(self):
+        if self._log_writer:
+            self._log_writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
-        return self.__env_values
+    # timestamp를 YYYY-MM-DD HH:MM:SS 형식으로 반환(날짜 부분은 날짜가 바뀔 때만 다시 만듦).
+    def _set_timestamp(self):
+        return self._clock.timestamp()
+
+    # 센서 시계를 주어진 기간만큼 건너뜀(기록은 생성하지 않음).
+    def jump(self, days=0, hours=0, minutes=0, seconds=0):
+        self._clock.jump(days, hours, minutes, seconds)
     
-    # 환경값을 저장하는 log 파일 초기화.
-    def _init_log(self):
+    # 측정 시간 및 간격으로 반복 실행(샘플을 한 번에 생성하는 generate_history 사용).
+    def _increment_time(self, duration, interval):
+        self.generate_history(duration, interval)
+        print('----로그 파일 생성을 완료했습니다.----')
+
+    # 현재 시각부터 duration초 동안 interval초 간격의 기록을 NumPy 배열로 한 번에 생성해 블록 단위로 저장.
+    # NumPy가 없으면 표준 라이브러리만으로 한 샘플씩 생성한다.
+    def generate_history(self, duration, interval, block_size=None, rng=None):
+        count = duration // interval
+        if count <= 0:
+            return 0
+        try:
+            # NumPy는 기록을 한 번에 생성할 때만 필요하므로 여기서 불러온다.
+            from sensor_history import generate_history
+        except ImportError:
+            return self._generate_history_per_tick(count, interval)
+
+        start = self._clock.to_datetime()
+        options = {'block_size': block_size} if block_size else {}
+        binary = self._log_writer.binary if self._log_writer else False
         try:
-            with open(LOG_PATH, 'a', encoding='utf-8') as log:
-                # 최초 파일 생성 시 헤더 생성.
-                if log.tell() == 0:
-                    headers = ['timestamp'] + list(self.__env_values.keys())
-                    log.write(','.join(headers) + '\n')
+            for block, last_values in generate_history(self._env_ranges, start, duration, interval,
+                                                       binary=binary, rng=rng, **options):
+                if self._log_writer:
+                    self._log_writer.write_block(block)
         # 파일에 대한 접근 권한이 없을 경우,
         except PermissionError:
             print('ERROR: 파일의 접근 권한이 없습니다.')
-        # 파일을 인코딩할 수 없을 경우,
-        except UnicodeEncodeError:
-            print('파일을 읽을 수 없습니다.')
+            return 0
         # 알 수 없는 오류가 발생할 경우,
         except Exception as error:
             print('ERROR: 알 수 없는 오류가 발생: ', error)
+            return 0
 
-    # timestamp를 YYYY-MM-DD HH:MM:SS 형식으로 반환.
-    def _set_timestamp(self):
-        return f'{self.__year:04}-{self.__month:02}-{self.__day:02} {self.__hour:02}:{self.__minute:02}:{self.__second:02}'
-    
-    # 측정 시간 및 간격으로 반복 실행.
-    def _increment_time(self, duration, interval):
-        for _ in range(duration // interval):   
+        # 마지막 샘플을 현재 환경 값으로, 시각은 마지막 샘플 다음 시각으로 설정.
+        self._env_values.update(zip(self._env_values, last_values.tolist()))
+        self._clock.advance(count * interval)
+        return count
+
+    # NumPy가 없을 때 사용하는 한 샘플씩 생성하는 경로(random.uniform 사용, rng는 무시).
+    def _generate_history_per_tick(self, count, interval):
+        for _ in range(count):
             self.set_env()
             self.get_env()
-            self.__second += interval
-            self.__update_time()
-
-        print('----로그 파일 생성을 완료했습니다.----')
-
-    # 시간 업데이트.
-    def _update_time(self):
-        if self.__second >= 60:
-            self.__minute += self.__second
-            self.__second %= 60
-        if self.__minute >= 60:
-            self.__hour += self.__minute
-            self.__minute %= 60
-        if self.__hour >= 24:
-            self.__hour %= 24
-            self.__update_day()
-
-    # 날짜 업데이트.
-    def _update_day(self):
-        # 월별 일수.
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-        # 윤년 계산식.
-        if (self.__year % 4 == 0 and self.__year % 100 != 0) or (self.__year % 400 == 0):
-            days_in_month[2] = 29
-
-        # 하루를 증가.
-        self.__day += 1
-
-        # 하루가 증가했을 때 매월 일수 비교.
-        if self.__day > days_in_month[self.__month - 1]:
-            self.__day = 1
-            self.__month += 1
-            if self.__month > 12:
-                self.__month = 1
-                self.__year += 1
+            self._clock.advance(interval)
+        return count
 
 
 # 실행 코드.
 if __name__ == '__main__':
-    # DummySensor 인스턴스 생성.
-    ds = DummySensor()
-    # 랜덤으로 생성되는 환경 변수 값 설정.
-    ds.set_env()
-    # 환경 변수 값 저장.
-    env_data = ds.get_env()
-    # 환경 변수 값 출력.
-    for key, value in env_data.items():
-        print(f"{key}: {value:.2f}")
-
-    # 측정 시간 및 간격을 입력.
-    duration = int(input('측정 시간을 초 단위로 입력하시오: '))
-    interval = int(input('측정 간격을 초 단위로 입력하시오: '))
-
-    ds._increment_time(duration, interval)
\ No newline at end of file
+    # DummySensor 인스턴스 생성(with 블록이 끝나면 남은 기록을 저장하고 파일을 닫음).
+    with DummySensor() as ds:
+        # 랜덤으로 생성되는 환경 변수 값 설정.
+        ds.set_env()
+        # 환경 변수 값 저장.
+        env_data = ds.get_env()
+        # 환경 변수 값 출력.
+        for key, value in env_data.items():
+            print(f"{key}: {value:.2f}")
+
+        # 측정 시간 및 간격을 입력.
+        duration = int(input('측정 시간을 초 단위로 입력하시오: '))
+        interval = int(input('측정 간격을 초 단위로 입력하시오: '))
+
+        ds._increment_time(duration, interval)
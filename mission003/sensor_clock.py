@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta
+
+# 기준 시각(1970-01-01 00:00:00)과 하루의 초.
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86_400
+
+
+class SensorClock:
+    """
+    센서 시각을 기준 시각부터의 초(정수) 하나로 관리하는 시계.
+    날짜 부분('YYYY-MM-DD ')은 날짜가 바뀔 때만 다시 만들고, 시각 이동은 더하기 한 번으로 끝난다.
+    """
+
+    def __init__(self, start):
+        self.epoch = int((start - EPOCH).total_seconds())
+        self._day = None
+        self._date_text = ''
+
+    def advance(self, seconds):
+        """시계를 seconds초만큼 이동한다(몇 초든, 며칠이든 O(1))."""
+        self.epoch += seconds
+
+    def jump(self, days=0, hours=0, minutes=0, seconds=0):
+        """일/시/분/초 단위로 시계를 이동한다."""
+        self.advance(int(timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds).total_seconds()))
+
+    def to_datetime(self):
+        return EPOCH + timedelta(seconds=self.epoch)
+
+    def timestamp(self):
+        """현재 시각을 YYYY-MM-DD HH:MM:SS 형식으로 반환한다."""
+        day, second = divmod(self.epoch, SECONDS_PER_DAY)
+        # 날짜가 바뀌었을 때만 날짜 문자열을 다시 만든다.
+        if day != self._day:
+            self._day = day
+            self._date_text = date.fromordinal(EPOCH_ORDINAL + day).isoformat() + ' '
+        hour, second = divmod(second, 3600)
+        minute, second = divmod(second, 60)
+        return f'{self._date_text}{hour:02}:{minute:02}:{second:02}'
@@ -0,0 +1,57 @@
+import numpy as np
+
+# 이진 기록 형식(buffered_log_writer.BINARY_RECORD와 같은 '<19s6d' 배치).
+BINARY_DTYPE = np.dtype([('timestamp', 'S19')] + [(f'value{number}', '<f8') for number in range(6)])
+# 한 번에 생성해 한 블록으로 쓰는 최대 샘플 수(1초 간격 기준 하루).
+BLOCK_SIZE = 86_400
+
+
+def generate_values(env_ranges, count, rng=None):
+    """환경 변수별 (최소, 최대) 범위로 count x 변수 수 크기의 균등 분포 난수 배열을 한 번에 만든다."""
+    rng = rng or np.random.default_rng()
+    lows = np.array([low for low, _ in env_ranges.values()], dtype=np.float64)
+    highs = np.array([high for _, high in env_ranges.values()], dtype=np.float64)
+    return rng.uniform(lows, highs, size=(count, len(lows)))
+
+
+def generate_timestamps(start, count, interval):
+    """start부터 interval초 간격의 timestamp count개를 'YYYY-MM-DD HH:MM:SS' 바이트 배열(S19)로 만든다."""
+    seconds = np.datetime64(start, 's') + np.arange(count, dtype=np.int64) * np.timedelta64(interval, 's')
+    text = np.datetime_as_string(seconds, unit='s').astype('S19')
+    # ISO 형식의 'T'를 공백으로 바꾼다(문자열을 바이트 배열로 보고 11번째 글자만 교체).
+    text.view(np.uint8).reshape(count, 19)[:, 10] = ord(' ')
+    return text
+
+
+def to_binary_block(timestamps, values):
+    """timestamp와 값 배열을 이진 기록 묶음(bytes)으로 변환한다."""
+    records = np.empty(len(timestamps), dtype=BINARY_DTYPE)
+    records['timestamp'] = timestamps
+    for number in range(values.shape[1]):
+        records[f'value{number}'] = values[:, number]
+    return records.tobytes()
+
+
+def to_csv_block(timestamps, values):
+    """timestamp와 값 배열을 csv 묶음(bytes)으로 변환한다(값은 소수점 둘째 자리)."""
+    line_format = '%s,' + ','.join(['%.2f'] * values.shape[1])
+    rows = zip(timestamps.astype('U19').tolist(), *values.T.tolist())
+    return ('\n'.join(line_format % row for row in rows) + '\n').encode('utf-8')
+
+
+def generate_history(env_ranges, start, duration, interval, block_size=BLOCK_SIZE, binary=False, rng=None):
+    """
+    start(datetime)부터 duration초 동안 interval초 간격의 샘플을 만들어
+    block_size개씩 (기록 묶음 bytes, 마지막 샘플의 값 배열)로 생성한다.
+    """
+    rng = rng or np.random.default_rng()
+    total = duration // interval
+    start = np.datetime64(start, 's')
+    for first in range(0, total, block_size):
+        count = min(block_size, total - first)
+        block_start = start + np.timedelta64(first * interval, 's')
+        timestamps = generate_timestamps(block_start, count, interval)
+        values = generate_values(env_ranges, count, rng)
+        block = to_binary_block(timestamps, values) if binary else to_csv_block(timestamps, values)
+        yield block, values[-1]
+
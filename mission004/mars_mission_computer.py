@@ -1,5 +1,16 @@
+import asyncio
+import os
+import threading
 import time
 from dummy_sensor import DummySensor
+from rolling_stats import RollingAggregator
+from sample_store import SampleStore
+from sensor_scheduler import LOG_PATH, ConsolePrinter, FileSink, SensorScheduler
+
+# 센서마다 메모리에 보관하는 최대 샘플 수(5초 간격 24시간).
+SAMPLE_CAPACITY = 17_280
+# 이동 구간 이름별 출력용 이름.
+WINDOW_LABELS = {'5m': '5분', '1h': '1시간', '24h': '24시간'}
 
 # 환경 변수명 정의
 IN_TEMP = 'mars_base_internal_temperature'
@@ -21,64 +32,116 @@ class MissionComputer:
             CO2: 0.0,
             OXYGEN: 0.0
         }
-        # 5분 동안 환경 변수의 평균 값을 계산하기 위한 List
-        self._data_log = []
+        # 센서별 환경 변수 누적 및 이동 구간(5분, 1시간, 24시간) 집계(메모리 사용량 일정).
+        self._aggregators = {}
+        # 센서별로 최근 측정값을 변수별 실수 배열로 보관하는 저장소(링 버퍼).
+        self._sample_stores = {}
         # 종료 플래그.
         self._stop_signal = False
 
-    # 5초마다 환경 값을 갱신하고 5분마다 평균 값을 출력하는 함수.
-    def get_sensor_data(self, sensor):
-        start_time = time.time()
-        
+    # 5초마다 환경 값을 갱신하고 5분마다 평균 값을 출력하는 함수(Enter 입력 또는 Ctrl+C로 종료).
+    def get_sensor_data(self, sensor, interval=5, log_path=None):
+        self.monitor({'dummy_sensor': (sensor, interval)}, log_path)
+
+    # 여러 센서를 센서별 주기로 동시에 측정하는 함수(센서 이름 → (센서, 측정 주기(초))).
+    def monitor(self, sensors, log_path=None, duration=None):
         try:
-            while not self._stop_signal:
-                sensor.set_env(self._env_values)
-                self._env_values = sensor.get_env()
-
-                print("{")
-                for key, value in self._env_values.items():
-                    print(f'    "{key}": {value:.2f},')
-                print("}")
-
-                # 데이터 저장
-                self._data_log.append(self._env_values.copy())
-
-                # 5분(300초) 경과 시 평균값 출력
-                if time.time() - start_time >= 300:
-                    self.print_five_minute_average()
-                    self._data_log.clear()
-                    start_time = time.time()
-                # 5초 대기
-                time.sleep(5)
-        except KeyboardInterrupt:   
+            asyncio.run(self._monitor(sensors, log_path, duration))
+        except KeyboardInterrupt:
             # 반복 중단 (Ctrl+C 입력 시 실행)
             print('\nSystem stopped....')
 
-    # 5분 동안 수집된 데이터를 환경 변수별로 평균 값을 계산하고 출력하는 함수.
-    def print_five_minute_average(self):
-        if not self._data_log:
-            print('측정 간격이 5분이 되지 않아 평균값을 출력할 수 없습니다.')
-            return
+    async def _monitor(self, sensors, log_path, duration):
+        scheduler = SensorScheduler()
+        for name, (sensor, interval) in sensors.items():
+            scheduler.add_sensor(name, self._reader(sensor), interval)
+        scheduler.subscribe(ConsolePrinter())
+        scheduler.subscribe(self._record)
+        sink = FileSink(log_path) if log_path else None
+        if sink:
+            scheduler.subscribe(sink)
+
+        # Enter 입력을 기다리는 스레드(입력되면 스케줄러를 멈춤).
+        self._stop_signal = False
+        threading.Thread(target=self._check_stop, args=(scheduler.stop,), daemon=True).start()
+        self._start_time = time.time()
+        try:
+            await scheduler.run(duration)
+        finally:
+            if sink:
+                sink.close()
 
-        avg_values = {key: 0.0 for key in self._env_values}
-        total_entries = len(self._data_log)
+    # 센서에서 환경 값을 읽는 함수를 만듦(센서마다 별도의 값 딕셔너리 사용).
+    def _reader(self, sensor):
+        values = dict(self._env_values)
 
-        for data in self._data_log:
-            for key in avg_values:
-                avg_values[key] += data[key]
+        def read():
+            sensor.set_env(values)
+            return sensor.get_env()
+        return read
 
-        for key in avg_values:
-            avg_values[key] /= total_entries
+    # 측정값을 센서별로 집계하고 5분(300초) 경과 시 평균값을 출력하는 구독자.
+    # 센서마다 측정하는 값이 다를 수 있으므로 집계와 저장소는 처음 측정값의 변수로 센서별로 만든다.
+    def _record(self, reading):
+        self._env_values = reading.values
+        if reading.sensor not in self._aggregators:
+            self._aggregators[reading.sensor] = RollingAggregator(reading.values.keys())
+            self._sample_stores[reading.sensor] = SampleStore(reading.values.keys(), SAMPLE_CAPACITY)
+        self._aggregators[reading.sensor].add(reading.values, reading.timestamp)
+        self._sample_stores[reading.sensor].append(reading.values, reading.timestamp)
+        if reading.timestamp - self._start_time >= 300:
+            self.print_five_minute_average()
+            self._start_time = reading.timestamp
 
-        print("{")
-        for key, value in avg_values.items():
-            print(f'    {key}: {value:.2f}')
-        print("}")
+    # 최근 5분 동안 수집된 데이터의 환경 변수별 평균 값을 출력하는 함수.
+    def print_five_minute_average(self):
+        self.print_average('5m')
+
+    # 이동 구간(5m, 1h, 24h) 동안의 환경 변수별 평균 값을 센서별로 출력하는 함수(sensor를 주면 그 센서만).
+    def print_average(self, window, sensor=None):
+        label = WINDOW_LABELS.get(window, window)
+        names = [sensor] if sensor else list(self._aggregators)
+        for name in names:
+            aggregator = self._aggregators.get(name)
+            avg_values = aggregator.averages(window) if aggregator else {}
+            if not avg_values:
+                print(f'{name}: 측정 간격이 {label}이 되지 않아 평균값을 출력할 수 없습니다.')
+                continue
+
+            print(f'{name} ({label} 평균) {{')
+            for key, value in avg_values.items():
+                print(f'    {key}: {value:.2f}')
+            print("}")
+        if not names:
+            print(f'측정 간격이 {label}이 되지 않아 평균값을 출력할 수 없습니다.')
+
+    # 보관 중인 측정값을 log 파일(csv 또는 이진)로 저장하는 함수.
+    # 센서가 여럿이면 센서마다 파일 이름 뒤에 센서 이름을 붙여 따로 저장한다.
+    def save_log(self, path=LOG_PATH, binary=False):
+        try:
+            root, extension = os.path.splitext(path)
+            for name, samples in self._sample_stores.items():
+                sensor_path = path if len(self._sample_stores) == 1 else f'{root}_{name}{extension}'
+                if binary:
+                    samples.to_binary(sensor_path)
+                else:
+                    samples.to_csv(sensor_path)
+        # 파일에 대한 접근 권한이 없을 경우,
+        except PermissionError:
+            print('ERROR: 파일의 접근 권한이 없습니다.')
+        # 알 수 없는 오류가 발생할 경우,
+        except Exception as error:
+            print('ERROR: 알 수 없는 오류가 발생: ', error)
 
     # 사용자가 특정 값(Enter)을 입력하면 반복문을 종료하는 함수.
-    def _check_stop(self):
-        input("중지하려면 Enter 키를 입력하세요...\n")
+    def _check_stop(self, on_stop=None):
+        try:
+            input("중지하려면 Enter 키를 입력하세요...\n")
+        except EOFError:
+            return
         self._stop_signal = True
+        if on_stop:
+            on_stop()
 
 
 # 실행 코드
@@ -87,3 +150,4 @@ if __name__ == '__main__':
     run_computer = MissionComputer()
 
     run_computer.get_sensor_data(ds)
+    run_computer.save_log()
@@ -0,0 +1,140 @@
+import math
+import time
+
+# 기본 구간: 이름 → (구간 길이(초), 버킷 길이(초)). 구간마다 버킷은 60개.
+DEFAULT_WINDOWS = {
+    '5m': (300, 5),
+    '1h': (3600, 60),
+    '24h': (86400, 1440),
+}
+
+
+class RunningStats:
+    """
+    값 하나를 추가할 때마다 O(1)로 개수, 합, 최솟값, 최댓값, 평균, 분산을 갱신한다(Welford 방식).
+    merge()로 다른 RunningStats를 합칠 수 있어 버킷별 부분 집계를 모아 구간 집계를 만들 수 있다.
+    """
+
+    __slots__ = ('count', 'total', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other):
+        """other의 집계를 더한다(Chan의 병렬 분산 합산식)."""
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self):
+        """표본 분산(값이 2개 미만이면 0)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+    def as_dict(self):
+        return {'count': self.count, 'sum': self.total, 'mean': self.mean, 'min': self.minimum,
+                'max': self.maximum, 'variance': self.variance}
+
+
+class RollingWindow:
+    """
+    최근 window초의 집계를 bucket초 단위 부분 집계의 링 버퍼로 유지한다.
+    버킷 수(window // bucket)만큼만 메모리를 사용하고, 오래된 버킷은 자리를 재사용할 때 버린다.
+    """
+
+    def __init__(self, keys, window, bucket):
+        if window % bucket:
+            raise ValueError('구간 길이는 버킷 길이의 배수여야 합니다.')
+        self.keys = list(keys)
+        self.window = window
+        self.bucket = bucket
+        self._size = window // bucket
+        self._bucket_ids = [None] * self._size
+        self._buckets = [None] * self._size
+        self._latest = None
+
+    def add(self, timestamp, values):
+        bucket_id = int(timestamp // self.bucket)
+        slot = bucket_id % self._size
+        if self._bucket_ids[slot] != bucket_id:
+            self._bucket_ids[slot] = bucket_id
+            self._buckets[slot] = {key: RunningStats() for key in self.keys}
+        stats = self._buckets[slot]
+        for key in self.keys:
+            stats[key].add(values[key])
+        if self._latest is None or bucket_id > self._latest:
+            self._latest = bucket_id
+
+    def stats(self, now=None):
+        """구간 안 버킷들을 합친 변수별 RunningStats를 반환한다(now가 없으면 마지막 기록 시각 기준)."""
+        result = {key: RunningStats() for key in self.keys}
+        if self._latest is None:
+            return result
+        latest = self._latest if now is None else int(now // self.bucket)
+        for bucket_id, stats in zip(self._bucket_ids, self._buckets):
+            if bucket_id is not None and latest - self._size < bucket_id <= latest:
+                for key in self.keys:
+                    result[key].merge(stats[key])
+        return result
+
+
+class RollingAggregator:
+    """
+    변수별 전체 누적 집계와 여러 이동 구간(기본 5분, 1시간, 24시간) 집계를 함께 유지한다.
+    가동 시간과 무관하게 메모리 사용량이 일정하다.
+    """
+
+    def __init__(self, keys, windows=None):
+        self.keys = list(keys)
+        self.totals = {key: RunningStats() for key in self.keys}
+        self.windows = {name: RollingWindow(self.keys, window, bucket)
+                        for name, (window, bucket) in (windows or DEFAULT_WINDOWS).items()}
+
+    def add(self, values, timestamp=None):
+        """환경 값 하나(변수명 → 값)를 모든 집계에 추가한다."""
+        timestamp = time.time() if timestamp is None else timestamp
+        for key in self.keys:
+            self.totals[key].add(values[key])
+        for window in self.windows.values():
+            window.add(timestamp, values)
+
+    def stats(self, window=None, now=None):
+        """window 이름의 구간 집계(없으면 전체 누적 집계)를 변수별 RunningStats로 반환한다."""
+        if window is None:
+            return self.totals
+        return self.windows[window].stats(now)
+
+    def averages(self, window=None, now=None):
+        """구간 안 값의 변수별 평균을 반환한다(값이 없으면 빈 딕셔너리)."""
+        stats = self.stats(window, now)
+        if not any(item.count for item in stats.values()):
+            return {}
+        return {key: item.mean for key, item in stats.items()}
@@ -0,0 +1,134 @@
+import struct
+import time
+from array import array
+
+# 이진 내보내기 파일 헤더(식별자, 변수 수, 샘플 수). 변수명은 헤더 뒤에 줄바꿈으로 구분해 저장.
+BINARY_MAGIC = b'MSS1'
+BINARY_HEADER = struct.Struct('<4sII')
+
+
+class SampleStore:
+    """
+    고정된 변수 목록의 측정값을 변수별 array('d') 열(column)로 저장하는 클래스.
+    capacity가 주어지면 미리 할당한 링 버퍼로 동작해 가장 오래된 샘플을 덮어쓴다(추가는 O(1)).
+    샘플 하나에 실수 (변수 수 + 1)개 분량의 메모리만 사용한다.
+    """
+
+    def __init__(self, fields, capacity=None):
+        self.fields = list(fields)
+        self.capacity = capacity
+        size = capacity or 0
+        self._timestamps = array('d', bytes(8 * size))
+        self._columns = {field: array('d', bytes(8 * size)) for field in self.fields}
+        # 링 버퍼에서 다음에 쓸 위치와 저장된 샘플 수.
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, values, timestamp=None):
+        """측정값 하나(변수명 → 값)를 추가한다."""
+        timestamp = time.time() if timestamp is None else timestamp
+        if self.capacity is None:
+            self._timestamps.append(timestamp)
+            for field in self.fields:
+                self._columns[field].append(values[field])
+            self._count += 1
+            return
+        position = self._next
+        self._timestamps[position] = timestamp
+        for field in self.fields:
+            self._columns[field][position] = values[field]
+        self._next = (position + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _views(self, column):
+        """열을 시간 순서의 memoryview 조각(1개 또는 2개)으로 반환한다(복사 없음)."""
+        view = memoryview(column)
+        if self.capacity is None or self._count < self.capacity:
+            return [view[:self._count]]
+        return [view[self._next:], view[:self._next]]
+
+    def column_views(self, field):
+        """변수 field의 값을 시간 순서의 memoryview 조각 목록으로 반환한다(복사 없음)."""
+        return self._views(self._columns[field])
+
+    def timestamp_views(self):
+        return self._views(self._timestamps)
+
+    def column(self, field):
+        """변수 field의 값을 시간 순서의 array('d')로 복사해 반환한다."""
+        result = array('d')
+        for view in self.column_views(field):
+            result.frombytes(view.cast('B'))
+        return result
+
+    def timestamps(self):
+        result = array('d')
+        for view in self.timestamp_views():
+            result.frombytes(view.cast('B'))
+        return result
+
+    def averages(self):
+        """변수별 평균을 반환한다(값이 없으면 빈 딕셔너리)."""
+        if not self._count:
+            return {}
+        return {field: sum(sum(view) for view in self.column_views(field)) / self._count
+                for field in self.fields}
+
+    def clear(self):
+        if self.capacity is None:
+            self._timestamps = array('d')
+            self._columns = {field: array('d') for field in self.fields}
+        self._next = 0
+        self._count = 0
+
+    def _rows(self):
+        """timestamp와 변수 값을 한 행씩 번갈아 놓은 array('d')를 만든다(열 단위 슬라이스 대입)."""
+        width = len(self.fields) + 1
+        rows = array('d', bytes(8 * width * self._count))
+        rows[0::width] = self.timestamps()
+        for number, field in enumerate(self.fields, 1):
+            rows[number::width] = self.column(field)
+        return rows
+
+    def to_csv(self, path, mode='w'):
+        """timestamp(YYYY-MM-DD HH:MM:SS)와 변수 값을 csv 형식으로 저장한다."""
+        width = len(self.fields) + 1
+        rows = self._rows()
+        with open(path, mode, encoding='utf-8') as file:
+            if mode == 'w' or file.tell() == 0:
+                file.write(','.join(['timestamp'] + self.fields) + '\n')
+            for start in range(0, len(rows), width):
+                timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(rows[start]))
+                file.write(timestamp + ',' + ','.join(f'{value:.2f}' for value in rows[start + 1:start + width]) + '\n')
+
+    def to_binary(self, path):
+        """헤더, 변수명, 행 단위 float64(timestamp, 변수 값...) 순서로 저장한다."""
+        with open(path, 'wb') as file:
+            file.write(BINARY_HEADER.pack(BINARY_MAGIC, len(self.fields), self._count))
+            file.write(('\n'.join(self.fields) + '\n').encode('utf-8'))
+            self._rows().tofile(file)
+
+    @classmethod
+    def from_binary(cls, path, capacity=None):
+        """to_binary()로 저장한 파일을 읽어 SampleStore를 만든다."""
+        with open(path, 'rb') as file:
+            magic, field_count, count = BINARY_HEADER.unpack(file.read(BINARY_HEADER.size))
+            if magic != BINARY_MAGIC:
+                raise ValueError('샘플 저장 파일 형식이 아닙니다.')
+            fields = [file.readline().decode('utf-8').rstrip('\n') for _ in range(field_count)]
+            rows = array('d')
+            rows.frombytes(file.read())
+        width = field_count + 1
+        store = cls(fields, capacity)
+        if capacity is None:
+            # 행 단위 배열을 열 단위로 나눠 그대로 사용한다.
+            store._timestamps = rows[0::width]
+            store._columns = {field: rows[number::width] for number, field in enumerate(fields, 1)}
+            store._count = count
+            return store
+        for start in range(0, count * width, width):
+            store.append(dict(zip(fields, rows[start + 1:start + width])), rows[start])
+        return store
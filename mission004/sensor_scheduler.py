@@ -0,0 +1,135 @@
+import asyncio
+import inspect
+import time
+from collections import namedtuple
+
+# 구독자별 대기열 크기(가득 차면 가장 오래된 측정값을 버림).
+QUEUE_SIZE = 100
+# 환경 값 로그 파일 경로.
+LOG_PATH = 'mission004/mars_env_values.log'
+
+# 측정값 하나: 센서 이름, 측정 시각(epoch 초), 환경 값(변수명 → 값).
+Reading = namedtuple('Reading', ['sensor', 'timestamp', 'values'])
+
+
+class SensorScheduler:
+    """
+    여러 센서를 센서별 주기로 동시에 측정하는 asyncio 스케줄러.
+    측정 시각은 '작업 후 sleep'이 아니라 절대 기한(시작 시각 + n * 주기)으로 계산해 오차가 누적되지 않는다.
+    측정값은 구독자마다 크기가 제한된 대기열로 전달된다.
+    """
+
+    def __init__(self, queue_size=QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._sensors = []
+        self._subscribers = []
+        self._stop_event = None
+        self._loop = None
+        self.dropped = 0
+
+    def add_sensor(self, name, read, interval):
+        """read()는 환경 값 딕셔너리를 반환하는 함수(일반 함수 또는 코루틴 함수)."""
+        if interval <= 0:
+            raise ValueError('측정 주기는 0보다 커야 합니다.')
+        self._sensors.append((name, read, interval))
+
+    def subscribe(self, handler):
+        """handler(reading)를 측정값마다 호출한다(일반 함수 또는 코루틴 함수)."""
+        self._subscribers.append(handler)
+
+    def publish(self, reading, queues):
+        for queue in queues:
+            # 대기열이 가득 차면 가장 오래된 측정값을 버리고 최신 값을 넣는다.
+            if queue.full():
+                queue.get_nowait()
+                queue.task_done()
+                self.dropped += 1
+            queue.put_nowait(reading)
+
+    async def _sample(self, name, read, interval, queues):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            try:
+                values = read()
+                if inspect.isawaitable(values):
+                    values = await values
+                self.publish(Reading(name, time.time(), dict(values)), queues)
+            # 측정에 실패해도 이 센서의 작업은 멈추지 않고 다음 기한에 다시 측정한다.
+            except Exception as error:
+                print(f'ERROR: {name} 센서 측정 중 오류 발생: ', error)
+
+            deadline += interval
+            now = loop.time()
+            # 측정이 늦어져 기한을 넘겼으면 지난 기한은 건너뛰고 다음 기한에 맞춘다.
+            if deadline < now:
+                deadline += (now - deadline) // interval * interval + interval
+            await asyncio.sleep(deadline - now)
+
+    async def _consume(self, handler, queue):
+        while True:
+            reading = await queue.get()
+            try:
+                result = handler(reading)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as error:
+                print('ERROR: 측정값 처리 중 오류 발생: ', error)
+            finally:
+                queue.task_done()
+
+    def stop(self):
+        """스케줄러를 멈춘다(다른 스레드에서 호출해도 안전)."""
+        if self._loop and self._stop_event:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+
+    async def run(self, duration=None):
+        """
+        stop()이 호출되거나 duration초가 지날 때까지 측정한다.
+        종료 시 측정 작업을 먼저 취소하고, 대기열에 남은 측정값을 모두 처리한 뒤 구독자 작업을 취소한다.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        queues = [asyncio.Queue(self.queue_size) for _ in self._subscribers]
+        consumers = [asyncio.create_task(self._consume(handler, queue))
+                     for handler, queue in zip(self._subscribers, queues)]
+        samplers = [asyncio.create_task(self._sample(name, read, interval, queues))
+                    for name, read, interval in self._sensors]
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in samplers:
+                task.cancel()
+            await asyncio.gather(*samplers, return_exceptions=True)
+            await asyncio.gather(*(queue.join() for queue in queues))
+            for task in consumers:
+                task.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+
+
+class ConsolePrinter:
+    """측정값을 화면에 출력하는 구독자."""
+
+    def __call__(self, reading):
+        print(f'{reading.sensor} {{')
+        for key, value in reading.values.items():
+            print(f'    "{key}": {value:.2f},')
+        print('}')
+
+
+class FileSink:
+    """측정값을 csv 형식(timestamp,sensor,값...)으로 로그 파일에 추가하는 구독자."""
+
+    def __init__(self, path=LOG_PATH):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def __call__(self, reading):
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(reading.timestamp))
+        self._file.write(f'{timestamp},{reading.sensor},'
+                         + ','.join(f'{value:.2f}' for value in reading.values.values()) + '\n')
+
+    def close(self):
+        self._file.close()
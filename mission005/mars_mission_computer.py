@@ -1,11 +1,23 @@
+import json
 import platform
+import time
 import psutil
+from metrics_collector import HISTORY_SIZE, SAMPLE_INTERVAL, MetricsCollector
 
 # 설정 파일의 경로.
 FILE_PATH = 'mission005/setting.txt'
+# 수집할 디스크, 네트워크 누적 카운터 항목.
+DISK_COUNTERS = ('read_bytes', 'write_bytes', 'read_count', 'write_count')
+NETWORK_COUNTERS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv')
+
+
+def _counters(counters, fields):
+    return {field: getattr(counters, field) for field in fields}
+
 
 class MissionComputer:
-    def __init__(self, file_path):
+    # interval초마다 사용량을 백그라운드에서 수집하고, 시스템 정보는 시작할 때 한 번만 계산한다.
+    def __init__(self, file_path, interval=SAMPLE_INTERVAL, history=HISTORY_SIZE):
         self._path = file_path
         self._source = {
             'system_info': {
@@ -16,12 +28,27 @@ class MissionComputer:
                 'Memory': lambda: int(round(psutil.virtual_memory().total / (1024 ** 3), 0))
             },
             'usage_info': {
-                'CPU usage': lambda: psutil.cpu_percent(interval=1),
-                'Memory usage': lambda: psutil.virtual_memory().percent
+                # 직전 호출 이후의 사용률(기다리지 않음).
+                'CPU usage': lambda: psutil.cpu_percent(interval=None),
+                'Memory usage': lambda: psutil.virtual_memory().percent,
+                'CPU per core': lambda: psutil.cpu_percent(interval=None, percpu=True),
+                'Disk usage': lambda: psutil.disk_usage('/').percent,
+                # 누적 카운터(바이트 수, 횟수).
+                'Disk I/O': lambda: _counters(psutil.disk_io_counters(), DISK_COUNTERS),
+                'Network I/O': lambda: _counters(psutil.net_io_counters(), NETWORK_COUNTERS)
             }
         }
 
         self._settings = self._load_settings()
+        # 바뀌지 않는 시스템 정보는 한 번만 계산해 둔다.
+        self._system_info = self._extract_info_by_section('system_info')
+
+        # 설정에서 켜진 사용량 항목만 수집한다.
+        usage_sources = {key: func for key, func in self._source['usage_info'].items()
+                         if self._settings['usage_info'].get(key, False)}
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._collector = MetricsCollector(usage_sources, interval, history).start()
 
     def _load_settings(self):
         settings = {section: {} for section in self._source}
@@ -62,25 +89,42 @@ class MissionComputer:
         return result
 
     def get_mission_computer_info(self):
-        return self._extract_info_by_section('system_info')
+        return dict(self._system_info)
 
+    # 마지막으로 수집한 사용량을 바로 반환한다.
     def get_mission_computer_load(self):
-        return self._extract_info_by_section('usage_info')
+        sample = self._collector.latest()
+        return dict(sample.values) if sample else {}
+
+    # 보관 중인 사용량 샘플을 오래된 순서로 반환한다.
+    def get_load_history(self):
+        return self._collector.history()
+
+    # 사용량이 수집될 때마다 listener(sample)를 호출한다(등록 즉시 마지막 샘플로 한 번 호출).
+    def subscribe(self, listener):
+        self._collector.add_listener(listener)
+        sample = self._collector.latest()
+        if sample:
+            listener(sample)
+
+    def close(self):
+        self._collector.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def format_as_json(self, data, indent=4):
-        json_str = "{\n"
-        for i, (key, value) in enumerate(data.items()):
-            # 문자열은 큰따옴표로 감싸고, 숫자는 그대로 표시
-            value_str = f'"{value}"' if isinstance(value, str) else value
-            comma = ',' if i < len(data) - 1 else ''
-            json_str += " " * indent + f'"{key}": {value_str}{comma}\n'
-        json_str += "}"
-        return json_str
+        return json.dumps(data, indent=indent, ensure_ascii=False)
 
 if __name__ == '__main__':
-    run_computer = MissionComputer(FILE_PATH)
-    info = run_computer.get_mission_computer_info()
-    load = run_computer.get_mission_computer_load()
+    with MissionComputer(FILE_PATH) as run_computer:
+        # 첫 주기의 사용량이 수집될 때까지 기다린다.
+        time.sleep(SAMPLE_INTERVAL)
+        info = run_computer.get_mission_computer_info()
+        load = run_computer.get_mission_computer_load()
 
     print("=== System Info ===")
     print(run_computer.format_as_json(info))
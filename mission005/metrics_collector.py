@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+# 기본 수집 주기(초)와 보관할 샘플 수.
+SAMPLE_INTERVAL = 1.0
+HISTORY_SIZE = 300
+# 연속으로 이 횟수만큼 실패한 항목은 더 이상 수집하지 않는다.
+MAX_FAILURES = 10
+
+# 수집 결과 하나: 수집 시각(epoch 초)과 항목별 값.
+Sample = namedtuple('Sample', ['timestamp', 'values'])
+
+
+class MetricsCollector:
+    """
+    항목별 수집 함수를 백그라운드 스레드에서 interval초마다 실행해 링 버퍼(deque)에 보관한다.
+    호출하는 쪽은 latest()로 마지막 샘플을 기다림 없이 가져간다.
+    실패한 항목은 처음 실패할 때만 오류를 출력하고, max_failures번 연속 실패하면 수집을 중단한다.
+    """
+
+    def __init__(self, sources, interval=SAMPLE_INTERVAL, history=HISTORY_SIZE, max_failures=MAX_FAILURES):
+        self.sources = dict(sources)
+        self.interval = interval
+        self.max_failures = max_failures
+        # 항목별 연속 실패 횟수와 수집을 중단한 항목.
+        self._failures = {}
+        self.disabled = set()
+        self._samples = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        # 샘플이 추가될 때마다 호출할 함수 목록(sample을 인자로 받음).
+        self._listeners = []
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def collect(self):
+        """모든 항목을 한 번 수집해 링 버퍼에 추가하고 샘플을 반환한다."""
+        values = {}
+        for key, func in self.sources.items():
+            if key in self.disabled:
+                values[key] = 'Unknown'
+                continue
+            try:
+                values[key] = func()
+            except Exception as error:
+                values[key] = 'Unknown'
+                self._record_failure(key, error)
+            else:
+                if self._failures.pop(key, 0):
+                    print(f"[INFO] {key} 항목 수집이 복구되었습니다.")
+        sample = Sample(time.time(), values)
+        with self._lock:
+            self._samples.append(sample)
+        for listener in self._listeners:
+            try:
+                listener(sample)
+            except Exception as error:
+                print(f"[ERROR] 수집 결과 처리 실패: {error}")
+        return sample
+
+    def _record_failure(self, key, error):
+        """실패 횟수를 세고, 처음 실패할 때와 수집을 중단할 때만 오류를 출력한다."""
+        count = self._failures.get(key, 0) + 1
+        self._failures[key] = count
+        if count == 1:
+            print(f"[ERROR] {key} 항목 수집 실패: {error}")
+        if count >= self.max_failures:
+            self.disabled.add(key)
+            print(f"[ERROR] {key} 항목이 {count}번 연속 실패해 수집을 중단합니다.")
+
+    def _run(self):
+        deadline = time.monotonic()
+        while True:
+            deadline += self.interval
+            # 수집에 걸린 시간과 무관하게 일정한 주기를 유지한다(밀린 주기는 건너뜀).
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                deadline -= delay
+                delay = 0
+            if self._stop_event.wait(delay):
+                break
+            self.collect()
+
+    def start(self):
+        """첫 샘플을 바로 수집한 뒤 백그라운드 수집을 시작한다."""
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self.collect()
+        self._thread = threading.Thread(target=self._run, name='metrics-collector', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def latest(self):
+        """마지막 샘플을 반환한다(아직 없으면 None)."""
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    def history(self):
+        """보관 중인 샘플을 오래된 순서로 반환한다."""
+        with self._lock:
+            return list(self._samples)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,148 @@
+import argparse
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from mars_mission_computer import FILE_PATH, MissionComputer
+from metrics_collector import SAMPLE_INTERVAL
+
+# 메트릭 이름 접두사와 기본 포트.
+METRIC_PREFIX = 'mars'
+DEFAULT_PORT = 9100
+# 응답 형식별 Content-Type.
+TEXT_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+# 항목 이름별 메트릭 이름(없으면 항목 이름으로 만듦).
+METRIC_NAMES = {
+    'CPU usage': 'mars_cpu_usage_percent',
+    'CPU per core': 'mars_cpu_core_usage_percent',
+    'Memory usage': 'mars_memory_usage_percent',
+    'Disk usage': 'mars_disk_usage_percent',
+    'Disk I/O': 'mars_disk',
+    'Network I/O': 'mars_network',
+}
+
+
+def metric_name(key):
+    """'Memory usage' 같은 항목 이름을 'mars_memory_usage_percent' 형식의 메트릭 이름으로 바꾼다."""
+    if key in METRIC_NAMES:
+        return METRIC_NAMES[key]
+    return f"{METRIC_PREFIX}_{re.sub(r'[^0-9a-zA-Z]+', '_', key).strip('_').lower()}"
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_text(system_info, sample):
+    """
+    시스템 정보와 사용량 샘플을 텍스트 노출 형식(Prometheus exposition format)으로 만든다.
+    숫자는 gauge, 목록은 core 레이블을 붙인 gauge, 딕셔너리(누적 카운터)는 항목별 counter로 쓴다.
+    """
+    lines = []
+    if system_info:
+        labels = ','.join(f'{re.sub(r"[^0-9a-zA-Z]+", "_", key).lower()}="{_label_value(value)}"'
+                          for key, value in system_info.items())
+        lines += [f'# TYPE {METRIC_PREFIX}_system_info gauge', f'{METRIC_PREFIX}_system_info{{{labels}}} 1']
+
+    for key, value in sample.values.items():
+        name = metric_name(key)
+        if isinstance(value, bool) or value == 'Unknown':
+            continue
+        if isinstance(value, (int, float)):
+            lines += [f'# TYPE {name} gauge', f'{name} {value}']
+        elif isinstance(value, list):
+            lines.append(f'# TYPE {name} gauge')
+            lines += [f'{name}{{core="{core}"}} {item}' for core, item in enumerate(value)]
+        elif isinstance(value, dict):
+            for field, item in value.items():
+                counter = f'{name}_{field}_total'
+                lines += [f'# TYPE {counter} counter', f'{counter} {item}']
+
+    lines += [f'# TYPE {METRIC_PREFIX}_sample_timestamp_seconds gauge',
+              f'{METRIC_PREFIX}_sample_timestamp_seconds {sample.timestamp:.3f}']
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def render_json(system_info, sample):
+    data = {'timestamp': sample.timestamp, 'system_info': system_info, 'usage_info': sample.values}
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+class MetricsExporter:
+    """
+    사용량이 수집될 때마다 텍스트/JSON 응답을 미리 만들어 두고, 요청에는 만들어 둔 응답을 그대로 보낸다.
+    요청 수와 무관하게 응답 생성은 수집 주기마다 한 번이다.
+    """
+
+    def __init__(self, computer):
+        self._system_info = computer.get_mission_computer_info()
+        # (텍스트, JSON) 응답. 튜플을 통째로 교체하므로 읽는 쪽은 잠금이 필요 없다.
+        self._responses = (b'', b'{}')
+        computer.subscribe(self.render)
+
+    def render(self, sample):
+        self._responses = (render_text(self._system_info, sample), render_json(self._system_info, sample))
+
+    @property
+    def text(self):
+        return self._responses[0]
+
+    @property
+    def json(self):
+        return self._responses[1]
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics(텍스트 형식), GET /metrics.json(JSON)을 처리한다."""
+
+    exporter = None
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            self._send(200, TEXT_CONTENT_TYPE, self.exporter.text)
+        elif path == '/metrics.json':
+            self._send(200, JSON_CONTENT_TYPE, self.exporter.json)
+        else:
+            self._send(404, TEXT_CONTENT_TYPE, b'not found\n')
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 요청마다 출력하지 않는다.
+        pass
+
+
+def serve_metrics(computer, host='0.0.0.0', port=DEFAULT_PORT):
+    """메트릭 HTTP 서버를 만들어 백그라운드 스레드에서 실행하고 서버를 반환한다(shutdown()으로 종료)."""
+    handler = type('BoundMetricsHandler', (MetricsHandler,), {'exporter': MetricsExporter(computer)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 메트릭 HTTP 서버')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--interval', type=float, default=SAMPLE_INTERVAL, help='수집 주기(초)')
+    parser.add_argument('--settings', default=FILE_PATH, help='설정 파일 경로')
+    args = parser.parse_args()
+
+    with MissionComputer(args.settings, args.interval) as run_computer:
+        metrics_server = serve_metrics(run_computer, args.host, args.port)
+        print(f'http://{args.host}:{args.port}/metrics 에서 메트릭을 제공합니다. (Ctrl+C로 종료)')
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print('\n서버를 종료합니다.')
+        finally:
+            metrics_server.shutdown()
+            metrics_server.server_close()
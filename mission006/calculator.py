@@ -1,13 +1,16 @@
 from PyQt5.QtWidgets import QApplication, QWidget, QGridLayout, QPushButton, QLineEdit, QVBoxLayout
 from PyQt5.QtCore import Qt
+from expression_engine import evaluate, format_number
 
 
 class Calculator(QWidget):
-    def __init__(self):
+    # number_type: None이면 int/float, Decimal 또는 Fraction이면 정확한 계산.
+    def __init__(self, number_type=None):
         super().__init__()
         self.setWindowTitle('Calculator')
         self.setFixedSize(300, 400)
         self.expression = ''
+        self.number_type = number_type
         self.create_ui()
 
     def create_ui(self):
@@ -80,9 +83,7 @@ class Calculator(QWidget):
 
     def calculate_result(self):
         try:
-            expression = self.expression.replace('×', '*').replace('÷', '/').replace('−', '-')
-            result = str(eval(expression))
-            self.expression = result
+            self.expression = format_number(evaluate(self.expression, self.number_type))
         except Exception:
             self.expression = 'Error'
 
@@ -92,7 +93,7 @@ class Calculator(QWidget):
 
     def calculate_percentage(self):
         try:
-            self.expression = str(eval(self.expression) / 100)
+            self.expression = format_number(evaluate(self.expression, self.number_type) / 100)
         except Exception:
             self.expression = 'Error'
 
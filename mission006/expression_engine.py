@@ -0,0 +1,130 @@
+import operator
+import re
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+# 컴파일한 식을 보관하는 LRU 캐시 크기.
+CACHE_SIZE = 1024
+
+# 계산기 화면 기호 → 연산자.
+SYMBOLS = {'×': '*', '÷': '/', '−': '-'}
+# 이항 연산자: 우선순위와 계산 함수.
+BINARY_OPERATORS = {
+    '+': (1, operator.add),
+    '-': (1, operator.sub),
+    '*': (2, operator.mul),
+    '/': (2, operator.truediv),
+}
+# 단항 연산자(부호)는 이항 연산자보다 먼저 계산한다.
+UNARY_OPERATORS = {'+': operator.pos, '-': operator.neg}
+
+# 숫자는 float 표기(1e-05, 2.5E+3)의 지수부까지 하나의 토큰으로 읽는다.
+TOKEN_PATTERN = re.compile(r'\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(.))')
+
+# 후위 표기 프로그램의 명령 종류.
+PUSH, UNARY, BINARY = range(3)
+
+
+class ExpressionError(ValueError):
+    """식의 문법이 잘못되었을 때 발생하는 예외."""
+
+
+def tokenize(expression):
+    """식을 숫자 문자열과 연산자/괄호 문자로 나눈다(계산기 기호 ×, ÷, −도 처리)."""
+    tokens = []
+    for number, symbol in TOKEN_PATTERN.findall(expression):
+        if number:
+            tokens.append(number)
+        elif symbol:
+            symbol = SYMBOLS.get(symbol, symbol)
+            if symbol not in BINARY_OPERATORS and symbol not in '()':
+                raise ExpressionError(f'알 수 없는 문자입니다: {symbol}')
+            tokens.append(symbol)
+    return tokens
+
+
+def _parse_number(text, number_type):
+    if number_type is None:
+        # eval과 같은 규칙: 소수점이나 지수부가 없으면 int, 있으면 float.
+        return float(text) if '.' in text or 'e' in text.lower() else int(text)
+    return number_type(text)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expression, number_type=None):
+    """
+    식을 shunting-yard 방식으로 후위 표기 프로그램((명령, 값) 튜플)으로 컴파일한다.
+    숫자는 컴파일할 때 number_type(None이면 int/float, Decimal, Fraction)으로 변환해 둔다.
+    """
+    program = []
+    stack = []
+    expect_operand = True
+    for token in tokenize(expression):
+        if token[0].isdigit() or token[0] == '.':
+            if not expect_operand:
+                raise ExpressionError('연산자 없이 숫자가 이어집니다.')
+            program.append((PUSH, _parse_number(token, number_type)))
+            expect_operand = False
+        elif token == '(':
+            if not expect_operand:
+                raise ExpressionError('괄호 앞에 연산자가 없습니다.')
+            stack.append(token)
+        elif token == ')':
+            while stack and stack[-1] != '(':
+                program.append(stack.pop()[1:])
+            if not stack or expect_operand:
+                raise ExpressionError('괄호가 맞지 않습니다.')
+            stack.pop()
+        elif expect_operand:
+            # 피연산자 자리에 온 +, -는 부호(단항 연산자).
+            if token not in UNARY_OPERATORS:
+                raise ExpressionError(f'피연산자가 필요한 자리입니다: {token}')
+            stack.append(('unary', UNARY, UNARY_OPERATORS[token]))
+        else:
+            precedence, function = BINARY_OPERATORS[token]
+            while stack and stack[-1] != '(' and (
+                    stack[-1][0] == 'unary' or BINARY_OPERATORS[stack[-1][0]][0] >= precedence):
+                program.append(stack.pop()[1:])
+            stack.append((token, BINARY, function))
+            expect_operand = True
+    if expect_operand:
+        raise ExpressionError('식이 연산자로 끝납니다.')
+    while stack:
+        item = stack.pop()
+        if item == '(':
+            raise ExpressionError('괄호가 맞지 않습니다.')
+        program.append(item[1:])
+    return tuple(program)
+
+
+def run(program):
+    """후위 표기 프로그램을 스택으로 계산한다."""
+    stack = []
+    for kind, value in program:
+        if kind == PUSH:
+            stack.append(value)
+        elif kind == UNARY:
+            stack.append(value(stack.pop()))
+        else:
+            right = stack.pop()
+            stack.append(value(stack.pop(), right))
+    return stack[0]
+
+
+def evaluate(expression, number_type=None):
+    """
+    식을 계산한다. number_type이 None이면 eval과 같은 int/float 계산,
+    Decimal 또는 Fraction이면 정확한 십진수/분수 계산을 한다.
+    0으로 나누면 ZeroDivisionError가 발생한다.
+    """
+    return run(compile_expression(expression, number_type))
+
+
+def format_number(value):
+    """계산 결과를 화면에 표시할 문자열로 바꾼다(분수는 분자/분모, 정수 값 Decimal은 소수점 없이)."""
+    if isinstance(value, Fraction):
+        return str(value.numerator) if value.denominator == 1 else f'{value.numerator}/{value.denominator}'
+    if isinstance(value, Decimal):
+        return format(value.to_integral_value() if value == value.to_integral_value() else value.normalize(), 'f')
+    return str(value)
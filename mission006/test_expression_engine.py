@@ -0,0 +1,28 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from expression_engine import ExpressionError, evaluate, format_number
+
+
+class ExpressionEngineTest(unittest.TestCase):
+
+    def test_exponent_numbers(self):
+        self.assertEqual(evaluate('1e-05+1'), 1.00001)
+        self.assertEqual(evaluate('2.5E+3×2'), 5000.0)
+        self.assertEqual(evaluate('1e3', Decimal), Decimal('1e3'))
+        self.assertEqual(evaluate('1e-2', Fraction), Fraction(1, 100))
+        with self.assertRaises(ExpressionError):
+            evaluate('2e+')
+
+    def test_format_number_round_trip(self):
+        # 화면에 표시한 결과에 이어서 계산할 수 있어야 함.
+        for number_type in (None, Decimal, Fraction):
+            for expression in ('1÷100000', '1÷3', '2×10000000000000000', '0.1+0.2', '−7÷4', '10÷4'):
+                value = evaluate(expression, number_type)
+                shown = format_number(value)
+                self.assertEqual(evaluate(shown, number_type), value, f'{expression} → {shown}')
+                self.assertEqual(evaluate(shown + '+1', number_type), value + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import time
+import numpy as np
+from calculator_batch import OPERATORS, evaluate_batch, evaluate_scalar
+
+# 비교에 사용할 레코드 수.
+RECORDS = 1_000_000
+
+
+def make_records(count, seed=0):
+    """무작위 레코드(피연산자 두 개와 연산자)를 만듭니다. 두 번째 피연산자의 약 1%는 0입니다."""
+    rng = np.random.default_rng(seed)
+    operand1 = rng.uniform(-1000, 1000, count).round(2)
+    operand2 = rng.uniform(-1000, 1000, count).round(2)
+    operand2[rng.random(count) < 0.01] = 0
+    operators = np.array(OPERATORS)[rng.integers(0, len(OPERATORS), count)]
+    return operand1, operators, operand2
+
+
+def bench_scalar(operand1, operators, operand2):
+    """레코드마다 CalculatorLogic 메서드를 호출하는 방식으로 계산하고 (소요 시간, 결과, 상태)를 반환합니다."""
+    records = list(zip(operand1.tolist(), operators.tolist(), operand2.tolist()))
+    start = time.perf_counter()
+    results, status = evaluate_scalar(records)
+    return time.perf_counter() - start, np.array(results), np.array(status)
+
+
+def bench_batch(operand1, operators, operand2):
+    """배열 단위로 한 번에 계산하고 (소요 시간, 결과, 상태)를 반환합니다."""
+    start = time.perf_counter()
+    results, status = evaluate_batch(operand1, operators, operand2)
+    return time.perf_counter() - start, results, status
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    data = make_records(count)
+
+    old_time, old_results, old_status = bench_scalar(*data)
+    new_time, new_results, new_status = bench_batch(*data)
+    same = np.array_equal(old_status, new_status) and np.allclose(old_results, new_results, equal_nan=True)
+
+    print(f'레코드 수: {count:,}')
+    print(f'메서드 호출 방식: {old_time:.3f}초 ({count / old_time:,.0f} 레코드/초)')
+    print(f'배열 계산 방식: {new_time:.3f}초 ({count / new_time:,.0f} 레코드/초)')
+    print(f'속도 향상: {old_time / new_time:.1f}배, 결과 일치: {same}')
@@ -0,0 +1,252 @@
+import heapq
+import mmap
+import os
+import shutil
+import struct
+from collections import namedtuple
+from calculator_logic import CalculatorLogic
+
+# 계산 기록 파일 경로.
+HISTORY_PATH = 'mission007/calculation_history.bin'
+# 파일 시작의 식별자(형식 버전 포함).
+FILE_MAGIC = b'MCH2'
+# 기록 하나의 헤더: 항목 번호, 연산자, 플래그, 참조 항목 번호 2개, 값 문자열 길이 3개(피연산자 2개, 결과).
+# 헤더 뒤에 UTF-8 값 문자열이 이어진다. 같은 번호의 기록이 다시 추가되면 마지막 기록이 유효하다.
+RECORD_HEADER = struct.Struct('<IcBIIIII')
+FLAG_ERROR = 1
+# 손상된 기록 파일을 잘라내기 전에 원본을 보관하는 파일 확장자.
+CORRUPT_SUFFIX = '.corrupt'
+
+# 다른 항목의 결과를 피연산자로 사용할 때의 참조.
+Ref = namedtuple('Ref', ['entry_id'])
+# 계산 기록 항목 하나. 오류(0으로 나누기 등)가 발생하면 result는 None, error는 True.
+HistoryEntry = namedtuple('HistoryEntry', ['entry_id', 'operand1', 'operator', 'operand2', 'result', 'error'])
+
+
+class CalculationHistory:
+    """
+    계산 기록을 의존성 그래프로 관리하는 클래스입니다.
+    피연산자로 이전 항목의 결과(Ref)를 참조할 수 있고, 항목을 수정하면 그 항목에 의존하는 항목만 다시 계산합니다.
+    모든 변경은 기록 파일 끝에 추가만 하며, 다시 열 때는 파일을 mmap으로 읽어 저장된 결과를 그대로 복원합니다.
+    """
+
+    def __init__(self, path=HISTORY_PATH, logic=None):
+        """
+        CalculationHistory 클래스의 생성자입니다.
+        기록 파일이 있으면 읽어서 항목과 의존 관계를 복원합니다.
+
+        Args:
+            path (str): 기록 파일 경로.
+            logic (CalculatorLogic): 계산에 사용할 계산 로직 객체(정밀 계산 모드 포함).
+        """
+        self.path = path
+        self.logic = logic or CalculatorLogic()
+        self._methods = {'+': self.logic.add, '-': self.logic.subtract,
+                         '*': self.logic.multiply, '/': self.logic.divide}
+        self._entries = {}
+        # 항목 번호 → 그 항목의 결과를 참조하는 항목 번호 집합.
+        self._dependents = {}
+        # 다음에 기록할 항목 번호.
+        self._next_id = 1
+        self._load()
+        self._file = open(path, 'ab')
+        if not self._file.tell():
+            self._file.write(FILE_MAGIC)
+            self._file.flush()
+
+    def _load(self):
+        """
+        기록 파일을 mmap으로 읽어 항목별 마지막 기록을 복원합니다.
+        값을 해석할 수 없는 기록(손상된 숫자, 알 수 없는 연산자, 없는 항목 참조)은 건너뛰고,
+        기록의 경계를 알 수 없게 되면(식별자 불일치, 중간에 끊긴 기록) 원본을 보관한 뒤 그 앞까지 잘라냅니다.
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return
+        if not size:
+            return
+        skipped = 0
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(FILE_MAGIC)] != FILE_MAGIC:
+                valid_size = 0
+            else:
+                offset = valid_size = len(FILE_MAGIC)
+                while offset + RECORD_HEADER.size <= size:
+                    entry_id, operator, flags, ref1, ref2, *lengths = RECORD_HEADER.unpack_from(data, offset)
+                    offset += RECORD_HEADER.size
+                    if offset + sum(lengths) > size:
+                        # 기록 중에 중단된 마지막 기록입니다.
+                        break
+                    texts = []
+                    for length in lengths:
+                        texts.append(data[offset:offset + length])
+                        offset += length
+                    valid_size = offset
+                    entry = self._parse_record(entry_id, operator, flags, ref1, ref2, texts)
+                    if entry is None:
+                        skipped += 1
+                    else:
+                        self._set(entry)
+
+        if skipped:
+            print(f'ERROR: 해석할 수 없는 계산 기록 {skipped}개를 건너뛰었습니다: {self.path}')
+        if valid_size < size:
+            backup_path = self.path + CORRUPT_SUFFIX
+            print(f'ERROR: 계산 기록 파일이 손상되어 {valid_size} 바이트 이후를 잘라냅니다(원본: {backup_path}).')
+            shutil.copyfile(self.path, backup_path)
+            os.truncate(self.path, valid_size)
+
+    def _parse_record(self, entry_id, operator, flags, ref1, ref2, texts):
+        """기록 하나를 HistoryEntry로 변환합니다. 해석할 수 없으면 None을 반환합니다."""
+        try:
+            if not entry_id:
+                raise ValueError('항목 번호는 1부터 시작합니다.')
+            operator = operator.decode('ascii')
+            texts = [text.decode('utf-8') for text in texts]
+            operand1 = Ref(ref1) if ref1 else self.logic.parse(texts[0])
+            operand2 = Ref(ref2) if ref2 else self.logic.parse(texts[1])
+            error = bool(flags & FLAG_ERROR)
+            result = None if error else self.logic.parse(texts[2])
+            self._check(entry_id, operand1, operator, operand2)
+        except (UnicodeDecodeError, ValueError):
+            return None
+        return HistoryEntry(entry_id, operand1, operator, operand2, result, error)
+
+    def _set(self, entry):
+        """항목을 저장하고 의존 관계를 갱신합니다."""
+        old = self._entries.get(entry.entry_id)
+        if old:
+            for operand in (old.operand1, old.operand2):
+                if isinstance(operand, Ref):
+                    self._dependents.get(operand.entry_id, set()).discard(entry.entry_id)
+        self._entries[entry.entry_id] = entry
+        self._next_id = max(self._next_id, entry.entry_id + 1)
+        for operand in (entry.operand1, entry.operand2):
+            if isinstance(operand, Ref):
+                self._dependents.setdefault(operand.entry_id, set()).add(entry.entry_id)
+
+    def _append(self, entry):
+        """항목을 기록 파일 끝에 추가합니다."""
+        texts = [b'' if isinstance(operand, Ref) else str(operand).encode('utf-8')
+                 for operand in (entry.operand1, entry.operand2)]
+        texts.append(b'' if entry.error else str(entry.result).encode('utf-8'))
+        refs = [operand.entry_id if isinstance(operand, Ref) else 0 for operand in (entry.operand1, entry.operand2)]
+        header = RECORD_HEADER.pack(entry.entry_id, entry.operator.encode('ascii'),
+                                    FLAG_ERROR if entry.error else 0, *refs, *map(len, texts))
+        self._file.write(header + b''.join(texts))
+
+    def _value(self, operand):
+        """피연산자 값을 반환합니다. 참조한 항목이 오류면 None을 반환합니다."""
+        if isinstance(operand, Ref):
+            return self._entries[operand.entry_id].result
+        return operand
+
+    def _evaluate(self, entry_id, operand1, operator, operand2):
+        """피연산자와 연산자로 결과를 계산해 항목을 만듭니다."""
+        value1 = self._value(operand1)
+        value2 = self._value(operand2)
+        result = None
+        if value1 is not None and value2 is not None:
+            try:
+                result = self._methods[operator](value1, value2)
+            except ZeroDivisionError:
+                result = None
+        return HistoryEntry(entry_id, operand1, operator, operand2, result, result is None)
+
+    def _check(self, entry_id, operand1, operator, operand2):
+        if operator not in self._methods:
+            raise ValueError(f'알 수 없는 연산자입니다: {operator}')
+        for operand in (operand1, operand2):
+            if isinstance(operand, Ref) and (operand.entry_id not in self._entries or
+                                             (entry_id is not None and operand.entry_id >= entry_id)):
+                raise ValueError(f'참조할 수 없는 항목입니다: {operand.entry_id}')
+
+    def record(self, operand1, operator, operand2):
+        """
+        새 계산을 기록하고 결과를 계산합니다.
+
+        Args:
+            operand1 (float or Ref): 첫 번째 피연산자(값 또는 이전 항목 참조).
+            operator (str): 연산자 (+, -, *, /).
+            operand2 (float or Ref): 두 번째 피연산자(값 또는 이전 항목 참조).
+
+        Returns:
+            HistoryEntry: 기록된 항목.
+
+        Raises:
+            ValueError: 알 수 없는 연산자이거나 없는 항목을 참조한 경우 발생합니다.
+        """
+        self._check(None, operand1, operator, operand2)
+        entry = self._evaluate(self._next_id, operand1, operator, operand2)
+        self._set(entry)
+        self._append(entry)
+        self._file.flush()
+        return entry
+
+    def edit(self, entry_id, operand1=None, operator=None, operand2=None):
+        """
+        기존 항목의 피연산자나 연산자를 수정하고, 이 항목에 의존하는 항목만 번호 순서로 다시 계산합니다.
+
+        Args:
+            entry_id (int): 수정할 항목 번호.
+            operand1 (float or Ref): 새 첫 번째 피연산자(None이면 유지).
+            operator (str): 새 연산자(None이면 유지).
+            operand2 (float or Ref): 새 두 번째 피연산자(None이면 유지).
+
+        Returns:
+            list: 다시 계산된 항목 번호 목록(수정한 항목 포함).
+
+        Raises:
+            KeyError: 없는 항목 번호인 경우 발생합니다.
+            ValueError: 알 수 없는 연산자이거나 이후 항목을 참조한 경우 발생합니다.
+        """
+        old = self._entries[entry_id]
+        operand1 = old.operand1 if operand1 is None else operand1
+        operator = old.operator if operator is None else operator
+        operand2 = old.operand2 if operand2 is None else operand2
+        # 참조는 앞 번호만 가능하므로 순환이 생기지 않습니다.
+        self._check(entry_id, operand1, operator, operand2)
+
+        updated = []
+        pending = [entry_id]
+        queued = {entry_id}
+        while pending:
+            current = heapq.heappop(pending)
+            entry = self._entries[current]
+            if current == entry_id:
+                new = self._evaluate(current, operand1, operator, operand2)
+            else:
+                new = self._evaluate(current, entry.operand1, entry.operator, entry.operand2)
+            changed = (new.result, new.error) != (entry.result, entry.error)
+            if current == entry_id or changed:
+                self._set(new)
+                self._append(new)
+                updated.append(current)
+            # 결과가 바뀐 항목의 의존 항목만 다시 계산합니다.
+            if changed:
+                for dependent in self._dependents.get(current, ()):
+                    if dependent not in queued:
+                        queued.add(dependent)
+                        heapq.heappush(pending, dependent)
+        self._file.flush()
+        return updated
+
+    def __getitem__(self, entry_id):
+        return self._entries[entry_id]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        """항목을 번호 순서로 반환합니다."""
+        return (self._entries[entry_id] for entry_id in sorted(self._entries))
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,142 +1,67 @@
 from PyQt5.QtWidgets import (QApplication, QWidget, QGridLayout,
                             QVBoxLayout, QPushButton, QLineEdit)
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QFont, QFontMetrics
+from functools import lru_cache
 import locale
+from decimal import Decimal
+from calculator_logic import CalculatorLogic
+from calculation_history import HISTORY_PATH, CalculationHistory, Ref
 
-class CalculatorLogic:
-    """
-    계산기의 핵심 로직을 담당하는 클래스입니다.
-    사칙연산, 음수/양수 전환, 퍼센트 계산 등의 기능을 제공합니다.
-    """
-    def __init__(self):
-        """
-        CalculatorLogic 클래스의 생성자입니다.
-        계산 상태를 초기화합니다.
-        """
-        self.reset()
-
-    def reset(self):
-        """
-        계산 상태를 초기화합니다.
-        첫 번째 피연산자(operand1)와 연산자(operator)를 None으로 설정합니다.
-        """
-        self.operand1 = None
-        self.operator = None
-
-    def set_operand(self, operand):
-        """
-        첫 번째 피연산자를 설정합니다.
-        새로운 숫자가 입력되거나 연산자 버튼이 눌렸을 때 호출됩니다.
-
-        Args:
-            operand (float): 첫 번째 피연산자 값.
-        """
-        self.operand1 = operand
-
-    def set_operator(self, operator):
-        """
-        수행할 연산자를 설정합니다.
-        +, -, *, / 중 하나의 값이 할당됩니다.
-
-        Args:
-            operator (str): 수행할 연산자 (+, -, *, /).
-        """
-        self.operator = operator
-
-    def add(self, operand1, operand2):
-        """
-        두 수를 더합니다.
-
-        Args:
-            operand1 (float): 첫 번째 피연산자.
-            operand2 (float): 두 번째 피연산자.
-
-        Returns:
-            float: 두 수의 합.
-        """
-        return operand1 + operand2
-
-    def subtract(self, operand1, operand2):
-        """
-        두 수를 뺍니다.
-
-        Args:
-            operand1 (float): 첫 번째 피연산자.
-            operand2 (float): 두 번째 피연산자.
-
-        Returns:
-            float: 첫 번째 피연산자에서 두 번째 피연산자를 뺀 결과.
-        """
-        return operand1 - operand2
-
-    def multiply(self, operand1, operand2):
-        """
-        두 수를 곱합니다.
-
-        Args:
-            operand1 (float): 첫 번째 피연산자.
-            operand2 (float): 두 번째 피연산자.
-
-        Returns:
-            float: 두 수의 곱.
-        """
-        return operand1 * operand2
-
-    def divide(self, operand1, operand2):
-        """
-        두 수를 나눕니다.
-
-        Args:
-            operand1 (float): 첫 번째 피연산자.
-            operand2 (float): 두 번째 피연산자.
+# 정밀 계산 모드의 기본 유효 자릿수.
+DEFAULT_PRECISION = 50
+# 출력 창 폰트 크기(최대, 최소).
+INITIAL_FONT_SIZE = 60
+MIN_FONT_SIZE = 12
 
-        Returns:
-            float: 첫 번째 피연산자를 두 번째 피연산자로 나눈 결과.
-
-        Raises:
-            ZeroDivisionError: 두 번째 피연산자가 0인 경우 발생합니다.
-        """
-        if operand2 == 0:
-            raise ZeroDivisionError
-        return operand1 / operand2
-
-    def negate(self, operand):
-        """
-        주어진 숫자의 부호를 반전시킵니다. (양수를 음수로, 음수를 양수로)
 
-        Args:
-            operand (float): 부호를 반전할 숫자.
+@lru_cache(maxsize=1024)
+def format_with_commas(text):
+    """
+    주어진 숫자 문자열에 세 자리마다 콤마를 추가합니다.
+    같은 문자열은 다시 계산하지 않도록 결과를 캐시합니다.
 
-        Returns:
-            float: 부호가 반전된 숫자.
-        """
-        return -operand
+    Args:
+        text (str): 콤마를 추가할 숫자 문자열.
 
-    def to_percentage(self, operand):
-        """
-        주어진 숫자를 백분율로 변환합니다. (100으로 나눔)
-
-        Args:
-            operand (float): 백분율로 변환할 숫자.
+    Returns:
+        str: 콤마가 추가된 숫자 문자열.
+    """
+    if '.' in text:
+        integer_part, decimal_part = text.split('.', 1)
+        try:
+            # '-0.5'처럼 정수 부분이 -0인 경우 부호를 유지합니다.
+            sign = '-' if integer_part.startswith('-') else ''
+            formatted_integer = locale.format_string("%d", abs(int(integer_part)), grouping=True)
+            return f"{sign}{formatted_integer}.{decimal_part}"
+        except ValueError:
+            return text
+    try:
+        return locale.format_string("%d", int(text), grouping=True)
+    except ValueError:
+        return text
 
-        Returns:
-            float: 백분율 값.
-        """
-        return operand / 100.0
 
 class Calculator(QWidget):
     """
     PyQt5를 이용하여 GUI 기반의 계산기 위젯을 구현하는 클래스입니다.
     화면 구성, 사용자 입력 처리, 결과 표시 등의 역할을 담당합니다.
     """
-    def __init__(self):
+    def __init__(self, precision=None, history_path=None):
         """
         Calculator 클래스의 생성자입니다.
         UI를 초기화하고, 계산 로직 객체를 생성하며, 입력 중 상태 플래그를 초기화합니다.
+
+        Args:
+            precision (int): 정밀 계산 모드의 유효 자릿수. None이면 float로 계산합니다.
+            history_path (str): 계산 기록 파일 경로. None이면 기록하지 않습니다.
         """
         super().__init__()
-        self.calc = CalculatorLogic()  # 계산 로직 객체 생성
+        self.calc = CalculatorLogic(precision)  # 계산 로직 객체 생성
+        self.history = CalculationHistory(history_path, self.calc) if history_path else None
+        self._current_entry = None    # 현재 피연산자가 결과인 계산 기록 항목 번호
+        self._shown_entry = None      # 출력 창에 결과가 그대로 표시된 계산 기록 항목 번호
+        self._font_sizes = {}         # (텍스트 길이, 출력 창 너비) → 폰트 크기 캐시
         self.is_typing = False        # 현재 숫자 버튼을 누르고 있는지 여부를 나타내는 플래그
         self.current_operand = None   # 현재 입력 또는 계산된 피연산자
         self.pending_operation = None # 보류 중인 연산자
@@ -206,7 +131,7 @@ class Calculator(QWidget):
 
     def _format_with_commas(self, text):
         """
-        주어진 숫자 문자열에 세 자리마다 콤마를 추가합니다.
+        주어진 숫자 문자열에 세 자리마다 콤마를 추가합니다(캐시된 format_with_commas 사용).
 
         Args:
             text (str): 콤마를 추가할 숫자 문자열.
@@ -214,44 +139,35 @@ class Calculator(QWidget):
         Returns:
             str: 콤마가 추가된 숫자 문자열.
         """
-        if '.' in text:
-            integer_part, decimal_part = text.split('.')
-            try:
-                formatted_integer = locale.format_string("%d", int(integer_part), grouping=True)
-                return f"{formatted_integer}.{decimal_part}"
-            except ValueError:
-                return text
-        else:
-            try:
-                formatted_integer = locale.format_string("%d", int(text), grouping=True)
-                return formatted_integer
-            except ValueError:
-                return text
+        return format_with_commas(text)
 
     def _adjust_font_size(self, text):
         """
         표시되는 텍스트의 길이에 따라 폰트 크기를 동적으로 조정하여 텍스트가 출력 창을 넘치지 않도록 합니다.
         화면 크기에 대한 상대적인 비율로 폰트 크기를 조정합니다.
+        같은 텍스트 길이와 출력 창 너비에 대한 폰트 크기는 한 번만 계산합니다.
 
         Args:
             text (str): 출력 창에 표시될 텍스트.
         """
         font = self.display.font()
-        initial_font_size = 60
-        min_font_size = 12
-        font.setPointSize(initial_font_size)
-
         available_width = self.display.width() - 20
-        text_width = self.display.fontMetrics().width(text)
-
-        if text_width > available_width:
-            overflow_ratio = available_width / text_width
-            new_font_size = int(initial_font_size * overflow_ratio * 0.9)
-            if new_font_size < min_font_size:
-                new_font_size = min_font_size
-            font.setPointSize(new_font_size)
-
-        self.display.setFont(font)
+        key = (len(text), available_width)
+        font_size = self._font_sizes.get(key)
+
+        if font_size is None:
+            font_size = INITIAL_FONT_SIZE
+            font.setPointSize(INITIAL_FONT_SIZE)
+            text_width = QFontMetrics(font).width(text)
+            if text_width > available_width:
+                overflow_ratio = available_width / text_width
+                font_size = max(int(INITIAL_FONT_SIZE * overflow_ratio * 0.9), MIN_FONT_SIZE)
+            self._font_sizes[key] = font_size
+
+        # 측정용으로 바꾼 font가 아니라 실제로 적용된 폰트 크기와 비교한다.
+        if self.display.font().pointSize() != font_size:
+            font.setPointSize(font_size)
+            self.display.setFont(font)
 
     def update_display(self, value):
         """
@@ -271,7 +187,7 @@ class Calculator(QWidget):
         소수점 아래 불필요한 0을 제거하고, 정수 형태일 경우 소수점을 표시하지 않습니다.
 
         Args:
-            value (float or int): 포맷팅할 값.
+            value (float or int or Decimal): 포맷팅할 값.
 
         Returns:
             str: 포맷팅된 문자열.
@@ -281,6 +197,9 @@ class Calculator(QWidget):
                 return str(int(round(value)))
             else:
                 return "{:.6f}".format(value).rstrip('0').rstrip('.')
+        if isinstance(value, Decimal):
+            # 정밀 계산 모드의 소수는 지수 표기 없이 모든 자릿수를 표시합니다.
+            return format(value.normalize(self.calc.context), 'f')
         return str(value)
 
     def reset_display(self):
@@ -291,15 +210,35 @@ class Calculator(QWidget):
         self.is_typing = False
         self.current_operand = None
         self.pending_operation = None
+        self._current_entry = None
+        self._shown_entry = None
         self._adjust_font_size('0') # 폰트 크기도 초기화
 
+    def _record_history(self, operand1, operator, operand2):
+        """
+        수행한 연산을 계산 기록에 추가합니다.
+        첫 번째 피연산자가 직전 계산의 결과이면 값 대신 그 항목에 대한 참조로 기록합니다.
+        float 모드에서는 출력 창 값이 반올림되므로 값 비교가 아니라 항목 번호로 연결합니다.
+
+        Args:
+            operand1 (float or int or Decimal): 첫 번째 피연산자.
+            operator (str): 연산자 (+, -, *, /).
+            operand2 (float or int or Decimal): 두 번째 피연산자.
+        """
+        if self.history is None:
+            return
+        if self._current_entry is not None:
+            operand1 = Ref(self._current_entry)
+        self._current_entry = self._shown_entry = self.history.record(operand1, operator, operand2).entry_id
+
     def negative_positive(self):
         """
         현재 출력 창에 표시된 숫자의 부호를 변경합니다.
         """
+        self._shown_entry = None
         try:
             current_text = self.display.text().replace(',', '')
-            current_value = float(current_text)
+            current_value = self.calc.parse(current_text)
             self.update_display(self.calc.negate(current_value))
         except ValueError:
             self.display.setText('Error')
@@ -310,9 +249,10 @@ class Calculator(QWidget):
         """
         현재 출력 창에 표시된 숫자를 백분율로 변환합니다.
         """
+        self._shown_entry = None
         try:
             current_text = self.display.text().replace(',', '')
-            current_value = float(current_text)
+            current_value = self.calc.parse(current_text)
             self.update_display(self.calc.to_percentage(current_value))
         except ValueError:
             self.display.setText('Error')
@@ -325,7 +265,8 @@ class Calculator(QWidget):
         """
         if self.pending_operation is not None and self.current_operand is not None:
             try:
-                second_operand = float(self.display.text().replace(',', ''))
+                first_operand = self.current_operand
+                second_operand = self.calc.parse(self.display.text())
                 if self.pending_operation == '+':
                     self.current_operand = self.calc.add(self.current_operand, second_operand)
                 elif self.pending_operation == '-':
@@ -338,8 +279,10 @@ class Calculator(QWidget):
                         self._adjust_font_size('Error: Division by zero')
                         self.current_operand = None
                         self.pending_operation = None
+                        self._current_entry = self._shown_entry = None
                         return
                     self.current_operand = self.calc.divide(self.current_operand, second_operand)
+                self._record_history(first_operand, self.pending_operation, second_operand)
                 self.update_display(self.current_operand)
                 self.pending_operation = None
                 self.is_typing = False
@@ -348,6 +291,7 @@ class Calculator(QWidget):
                 self._adjust_font_size('Error')
                 self.current_operand = None
                 self.pending_operation = None
+                self._current_entry = self._shown_entry = None
 
     def button_clicked(self):
         """
@@ -362,6 +306,7 @@ class Calculator(QWidget):
             current_text = self.display.text().replace(',', '')
             if current_text == '0' and button_text == '0':
                 return
+            self._shown_entry = None
             if not self.is_typing or current_text == '0':
                 self.display.setText(button_text)
             else:
@@ -373,6 +318,7 @@ class Calculator(QWidget):
         # 소수점 버튼 클릭 처리
         elif button_text == '.':
             if '.' not in self.display.text():
+                self._shown_entry = None
                 self.display.setText(self.display.text() + '.')
                 self.is_typing = True
                 self._adjust_font_size(self.display.text())
@@ -389,12 +335,15 @@ class Calculator(QWidget):
         # 사칙연산 버튼 클릭 처리
         elif button_text in ['+', '-', '*', '/']:
             try:
-                operand = float(self.display.text().replace(',', ''))
+                operand = self.calc.parse(self.display.text())
                 if self.current_operand is None:
                     self.current_operand = operand
+                    self._current_entry = None
                 else:
                     self.perform_operation()
-                    self.current_operand = float(self.display.text().replace(',', ''))
+                    self.current_operand = self.calc.parse(self.display.text())
+                    # 출력 창에 직전 결과가 그대로 있으면 다음 연산은 그 항목을 참조합니다.
+                    self._current_entry = self._shown_entry
                 self.pending_operation = button_text
                 self.is_typing = False
             except ValueError:
@@ -413,5 +362,5 @@ if __name__ == '__main__':
         locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
 
     app = QApplication([])
-    calc_ui = Calculator()
+    calc_ui = Calculator(DEFAULT_PRECISION, HISTORY_PATH)
     app.exec_()
\ No newline at end of file
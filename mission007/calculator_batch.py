@@ -0,0 +1,174 @@
+import argparse
+import numpy as np
+from calculator_logic import CalculatorLogic
+
+# 지원하는 연산자와 연산 코드(배열에서는 코드로 저장).
+OPERATORS = ('+', '-', '*', '/')
+OPERATOR_CODES = {operator: code for code, operator in enumerate(OPERATORS)}
+# ASCII 코드 → 연산 코드 표(연산자가 아니면 -1).
+_CODE_TABLE = np.full(128, -1, dtype=np.int8)
+for _operator, _code in OPERATOR_CODES.items():
+    _CODE_TABLE[ord(_operator)] = _code
+
+# 행별 계산 상태.
+STATUS_OK = 0
+STATUS_DIVISION_BY_ZERO = 1
+STATUS_UNKNOWN_OPERATOR = 2
+STATUS_MESSAGES = {
+    STATUS_OK: '',
+    STATUS_DIVISION_BY_ZERO: 'Error: Division by zero',
+    STATUS_UNKNOWN_OPERATOR: 'Error: Unknown operator',
+}
+
+# csv 입력 형식: operand1,operator,operand2 (첫 줄은 헤더).
+RECORD_DTYPE = np.dtype([('operand1', 'f8'), ('operator', 'U1'), ('operand2', 'f8')])
+
+
+def encode_operators(operators):
+    """
+    연산자 문자열 배열을 연산 코드 배열(int8)로 변환합니다. 알 수 없는 연산자는 -1이 됩니다.
+
+    Args:
+        operators (array-like): '+', '-', '*', '/' 문자열 배열.
+
+    Returns:
+        numpy.ndarray: 연산 코드 배열.
+    """
+    operators = np.asarray(operators)
+    if operators.dtype == np.dtype('U1'):
+        # 한 글자 문자열은 유니코드 코드 포인트(uint32)로 보고 표에서 바로 찾는다.
+        points = operators.view(np.uint32)
+        return np.where(points < len(_CODE_TABLE), _CODE_TABLE[np.minimum(points, len(_CODE_TABLE) - 1)], -1)
+    codes = np.full(operators.shape, -1, dtype=np.int8)
+    for operator, code in OPERATOR_CODES.items():
+        codes[operators == operator] = code
+    return codes
+
+
+def evaluate_batch(operand1, operators, operand2):
+    """
+    (operand1, operator, operand2) 레코드 배열을 한 번에 계산합니다.
+    0으로 나누는 행은 예외를 발생시키지 않고 결과를 nan, 상태를 STATUS_DIVISION_BY_ZERO로 표시합니다.
+
+    Args:
+        operand1 (array-like): 첫 번째 피연산자 배열.
+        operators (array-like): 연산자 문자열 배열 또는 연산 코드 배열.
+        operand2 (array-like): 두 번째 피연산자 배열.
+
+    Returns:
+        tuple: (결과 배열(float64), 상태 코드 배열(int8)).
+    """
+    operand1 = np.asarray(operand1, dtype=np.float64)
+    operand2 = np.asarray(operand2, dtype=np.float64)
+    codes = np.asarray(operators)
+    if codes.dtype.kind in 'US':
+        codes = encode_operators(codes)
+
+    results = np.full(operand1.shape, np.nan)
+    status = np.full(operand1.shape, STATUS_UNKNOWN_OPERATOR, dtype=np.int8)
+
+    for code, function in enumerate((np.add, np.subtract, np.multiply)):
+        mask = codes == code
+        function(operand1, operand2, out=results, where=mask)
+        status[mask] = STATUS_OK
+
+    divide = codes == OPERATOR_CODES['/']
+    zero = divide & (operand2 == 0)
+    np.divide(operand1, operand2, out=results, where=divide & ~zero)
+    status[divide] = STATUS_OK
+    status[zero] = STATUS_DIVISION_BY_ZERO
+    return results, status
+
+
+def evaluate_scalar(records, logic=None):
+    """
+    CalculatorLogic의 메서드를 레코드마다 호출해 계산합니다(벤치마크 비교용 기준 경로).
+
+    Args:
+        records (iterable): (operand1, operator, operand2) 튜플.
+        logic (CalculatorLogic): 사용할 계산 로직 객체.
+
+    Returns:
+        tuple: (결과 목록, 상태 코드 목록).
+    """
+    logic = logic or CalculatorLogic()
+    methods = {'+': logic.add, '-': logic.subtract, '*': logic.multiply, '/': logic.divide}
+    results = []
+    status = []
+    for operand1, operator, operand2 in records:
+        method = methods.get(operator)
+        if method is None:
+            results.append(float('nan'))
+            status.append(STATUS_UNKNOWN_OPERATOR)
+            continue
+        try:
+            results.append(method(operand1, operand2))
+            status.append(STATUS_OK)
+        except ZeroDivisionError:
+            results.append(float('nan'))
+            status.append(STATUS_DIVISION_BY_ZERO)
+    return results, status
+
+
+def read_records(path):
+    """
+    csv 파일(operand1,operator,operand2)을 레코드 배열로 읽습니다.
+
+    Args:
+        path (str): csv 파일 경로.
+
+    Returns:
+        numpy.ndarray: RECORD_DTYPE 구조의 배열.
+    """
+    return np.atleast_1d(np.loadtxt(path, dtype=RECORD_DTYPE, delimiter=',', skiprows=1))
+
+
+def write_results(path, records, results, status):
+    """
+    레코드와 계산 결과, 오류 메시지를 csv 파일로 저장합니다.
+
+    Args:
+        path (str): 저장할 csv 파일 경로.
+        records (numpy.ndarray): RECORD_DTYPE 구조의 배열.
+        results (numpy.ndarray): 결과 배열.
+        status (numpy.ndarray): 상태 코드 배열.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('operand1,operator,operand2,result,error\n')
+        rows = zip(records['operand1'].tolist(), records['operator'].tolist(), records['operand2'].tolist(),
+                   results.tolist(), status.tolist())
+        for operand1, operator, operand2, result, code in rows:
+            value = '' if code != STATUS_OK else repr(result)
+            file.write(f'{operand1!r},{operator},{operand2!r},{value},{STATUS_MESSAGES[code]}\n')
+
+
+def evaluate_file(input_path, output_path):
+    """
+    csv 파일의 레코드를 한 번에 계산해 결과 파일로 저장하고 상태별 행 수를 반환합니다.
+
+    Args:
+        input_path (str): 입력 csv 파일 경로.
+        output_path (str): 결과 csv 파일 경로.
+
+    Returns:
+        dict: 상태 코드별 행 수.
+    """
+    records = read_records(input_path)
+    results, status = evaluate_batch(records['operand1'], records['operator'], records['operand2'])
+    write_results(output_path, records, results, status)
+    counts = np.bincount(status, minlength=len(STATUS_MESSAGES))
+    return {code: int(count) for code, count in enumerate(counts)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='계산기 일괄 계산 (operand1,operator,operand2 csv)')
+    parser.add_argument('input', help='입력 csv 파일 경로')
+    parser.add_argument('output', help='결과 csv 파일 경로')
+    args = parser.parse_args()
+
+    try:
+        summary = evaluate_file(args.input, args.output)
+        print(f'정상: {summary[STATUS_OK]:,}행, 0으로 나누기: {summary[STATUS_DIVISION_BY_ZERO]:,}행, '
+              f'알 수 없는 연산자: {summary[STATUS_UNKNOWN_OPERATOR]:,}행')
+    except (OSError, ValueError) as error:
+        print('ERROR: 일괄 계산 중 오류 발생: ', error)
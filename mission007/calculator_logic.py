@@ -0,0 +1,195 @@
+from decimal import Context, Decimal, InvalidOperation
+
+
+class CalculatorLogic:
+    """
+    계산기의 핵심 로직을 담당하는 클래스입니다.
+    사칙연산, 음수/양수 전환, 퍼센트 계산 등의 기능을 제공합니다.
+    precision을 지정하면 decimal.Decimal 기반의 정밀 계산 모드로 동작하며,
+    정수끼리의 덧셈, 뺄셈, 곱셈과 나누어떨어지는 나눗셈은 자릿수 제한 없는 int로 계산합니다.
+    """
+    def __init__(self, precision=None, rounding=None):
+        """
+        CalculatorLogic 클래스의 생성자입니다.
+        계산 상태를 초기화합니다.
+
+        Args:
+            precision (int): 정밀 계산 모드의 유효 자릿수. None이면 float로 계산합니다.
+            rounding (str): 정밀 계산 모드의 반올림 방식(decimal.ROUND_HALF_EVEN 등).
+        """
+        self.context = Context(prec=precision, rounding=rounding) if precision else None
+        self.reset()
+
+    @property
+    def precise(self):
+        """
+        정밀 계산 모드 여부를 반환합니다.
+
+        Returns:
+            bool: 정밀 계산 모드이면 True.
+        """
+        return self.context is not None
+
+    def parse(self, text):
+        """
+        숫자 문자열을 계산에 사용할 값으로 변환합니다.
+        float 모드에서는 float, 정밀 계산 모드에서는 정수면 int, 소수면 Decimal로 변환합니다.
+
+        Args:
+            text (str): 변환할 숫자 문자열(콤마 포함 가능).
+
+        Returns:
+            float or int or Decimal: 변환된 값.
+
+        Raises:
+            ValueError: 숫자가 아닌 문자열인 경우 발생합니다.
+        """
+        text = text.replace(',', '')
+        if not self.precise:
+            return float(text)
+        try:
+            value = Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f'숫자가 아닙니다: {text}')
+        if not value.is_finite():
+            raise ValueError(f'숫자가 아닙니다: {text}')
+        # 소수점과 지수가 없는 정수 문자열은 int로 계산합니다.
+        if value == value.to_integral_value() and '.' not in text and 'e' not in text.lower():
+            return int(text)
+        return value
+
+    def _normalize(self, value):
+        """
+        정밀 계산 모드의 결과를 정리합니다. 정수 값이면 int로, 그 외에는 Decimal로 반환합니다.
+
+        Args:
+            value (int or Decimal): 계산 결과.
+
+        Returns:
+            int or Decimal: 정리된 결과.
+        """
+        if isinstance(value, Decimal) and value == value.to_integral_value():
+            return int(value)
+        return value
+
+    def reset(self):
+        """
+        계산 상태를 초기화합니다.
+        첫 번째 피연산자(operand1)와 연산자(operator)를 None으로 설정합니다.
+        """
+        self.operand1 = None
+        self.operator = None
+
+    def set_operand(self, operand):
+        """
+        첫 번째 피연산자를 설정합니다.
+        새로운 숫자가 입력되거나 연산자 버튼이 눌렸을 때 호출됩니다.
+
+        Args:
+            operand (float): 첫 번째 피연산자 값.
+        """
+        self.operand1 = operand
+
+    def set_operator(self, operator):
+        """
+        수행할 연산자를 설정합니다.
+        +, -, *, / 중 하나의 값이 할당됩니다.
+
+        Args:
+            operator (str): 수행할 연산자 (+, -, *, /).
+        """
+        self.operator = operator
+
+    def add(self, operand1, operand2):
+        """
+        두 수를 더합니다.
+
+        Args:
+            operand1 (float): 첫 번째 피연산자.
+            operand2 (float): 두 번째 피연산자.
+
+        Returns:
+            float: 두 수의 합.
+        """
+        if self.precise and not (isinstance(operand1, int) and isinstance(operand2, int)):
+            return self._normalize(self.context.add(Decimal(operand1), Decimal(operand2)))
+        return operand1 + operand2
+
+    def subtract(self, operand1, operand2):
+        """
+        두 수를 뺍니다.
+
+        Args:
+            operand1 (float): 첫 번째 피연산자.
+            operand2 (float): 두 번째 피연산자.
+
+        Returns:
+            float: 첫 번째 피연산자에서 두 번째 피연산자를 뺀 결과.
+        """
+        if self.precise and not (isinstance(operand1, int) and isinstance(operand2, int)):
+            return self._normalize(self.context.subtract(Decimal(operand1), Decimal(operand2)))
+        return operand1 - operand2
+
+    def multiply(self, operand1, operand2):
+        """
+        두 수를 곱합니다.
+
+        Args:
+            operand1 (float): 첫 번째 피연산자.
+            operand2 (float): 두 번째 피연산자.
+
+        Returns:
+            float: 두 수의 곱.
+        """
+        if self.precise and not (isinstance(operand1, int) and isinstance(operand2, int)):
+            return self._normalize(self.context.multiply(Decimal(operand1), Decimal(operand2)))
+        return operand1 * operand2
+
+    def divide(self, operand1, operand2):
+        """
+        두 수를 나눕니다.
+
+        Args:
+            operand1 (float): 첫 번째 피연산자.
+            operand2 (float): 두 번째 피연산자.
+
+        Returns:
+            float: 첫 번째 피연산자를 두 번째 피연산자로 나눈 결과.
+
+        Raises:
+            ZeroDivisionError: 두 번째 피연산자가 0인 경우 발생합니다.
+        """
+        if operand2 == 0:
+            raise ZeroDivisionError
+        if self.precise:
+            # 정수끼리 나누어떨어지면 int로 정확히 계산합니다.
+            if isinstance(operand1, int) and isinstance(operand2, int) and operand1 % operand2 == 0:
+                return operand1 // operand2
+            return self._normalize(self.context.divide(Decimal(operand1), Decimal(operand2)))
+        return operand1 / operand2
+
+    def negate(self, operand):
+        """
+        주어진 숫자의 부호를 반전시킵니다. (양수를 음수로, 음수를 양수로)
+
+        Args:
+            operand (float): 부호를 반전할 숫자.
+
+        Returns:
+            float: 부호가 반전된 숫자.
+        """
+        return -operand
+
+    def to_percentage(self, operand):
+        """
+        주어진 숫자를 백분율로 변환합니다. (100으로 나눔)
+
+        Args:
+            operand (float): 백분율로 변환할 숫자.
+
+        Returns:
+            float: 백분율 값.
+        """
+        if self.precise:
+            return self.divide(operand, 100)
+        return operand / 100.0
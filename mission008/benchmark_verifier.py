@@ -0,0 +1,42 @@
+import sys
+import time
+import zipfile
+from door_hacking import zip_file, DEFAULT_GENERATOR, try_password
+from zip_verifier import ZipCryptoVerifier
+
+# 비교에 사용할 후보 비밀번호 수.
+CANDIDATES = 20_000
+
+
+def bench_zipfile(path, candidates):
+    """기존 zf.open(..., pwd=...) 방식으로 후보를 검증하고 (소요 시간, 일치 수)를 반환한다."""
+    zf = zipfile.ZipFile(path, 'r')
+    fname = zf.namelist()[0]
+    start = time.perf_counter()
+    hits = sum(1 for password in candidates if try_password(zf, fname, password))
+    elapsed = time.perf_counter() - start
+    zf.close()
+    return elapsed, hits
+
+
+def bench_verifier(path, candidates):
+    """암호화 헤더 검증 경로로 후보를 검증하고 (소요 시간, 일치 수)를 반환한다."""
+    verifier = ZipCryptoVerifier(path)
+    encoded = [password.encode() for password in candidates]
+    start = time.perf_counter()
+    hits = sum(1 for password in encoded if verifier.verify(password))
+    return time.perf_counter() - start, hits
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else zip_file
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else CANDIDATES
+    candidates = list(DEFAULT_GENERATOR.iter_range(0, count))
+
+    old_time, old_hits = bench_zipfile(path, candidates)
+    new_time, new_hits = bench_verifier(path, candidates)
+
+    print(f'후보 수: {count:,}')
+    print(f'zipfile 방식: {old_time:.3f}초 ({count / old_time:,.0f} 후보/초), 일치 {old_hits}')
+    print(f'헤더 검증 방식: {new_time:.3f}초 ({count / new_time:,.0f} 후보/초), 일치 {new_hits}')
+    print(f'속도 향상: {old_time / new_time:.1f}배')
@@ -0,0 +1,330 @@
+import string
+from array import array
+
+# 마스크 패턴에서 사용하는 기본 문자 집합(?l, ?u, ?d, ?s, ?a).
+MASK_CHARSETS = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': string.punctuation + ' ',
+}
+MASK_CHARSETS['a'] = MASK_CHARSETS['l'] + MASK_CHARSETS['u'] + MASK_CHARSETS['d'] + MASK_CHARSETS['s']
+
+
+class CandidateGenerator:
+    """
+    후보 비밀번호 생성기의 기본 클래스.
+    모든 생성기는 전체 후보 수(len)와 N번째 후보(candidate)를 제공하므로
+    키 공간을 미리 만들지 않고도 [start, end) 범위를 워커에게 나눠줄 수 있다.
+    """
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def candidate(self, index):
+        """index번째 후보를 반환한다."""
+        raise NotImplementedError
+
+    def iter_range(self, start, end):
+        """[start, end) 범위의 후보를 순서대로 생성한다."""
+        for index in range(start, min(end, len(self))):
+            yield self.candidate(index)
+
+    def __iter__(self):
+        return self.iter_range(0, len(self))
+
+
+class MaskGenerator(CandidateGenerator):
+    """
+    ?l?l?d?d?d?d 같은 마스크 패턴으로 후보를 생성한다.
+    ?1~?9는 custom_charsets로 지정한 문자 집합, ??는 '?' 문자, 그 외 문자는 그대로 사용한다.
+    """
+
+    def __init__(self, mask, custom_charsets=None):
+        self.mask = mask
+        self._positions = parse_mask(mask, custom_charsets or {})
+        self._size = 1
+        for chars in self._positions:
+            self._size *= len(chars)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f'MaskGenerator({self.mask!r}, {"".join(self._positions)!r})'
+
+    def _digits(self, index):
+        """index를 자리별 문자 위치 목록으로 변환한다(혼합 진법)."""
+        digits = [0] * len(self._positions)
+        for position in range(len(self._positions) - 1, -1, -1):
+            index, digits[position] = divmod(index, len(self._positions[position]))
+        return digits
+
+    def candidate(self, index):
+        return ''.join(chars[digit] for chars, digit in zip(self._positions, self._digits(index)))
+
+    def iter_range(self, start, end):
+        # 시작 위치만 계산하고 이후에는 주행 거리계처럼 마지막 자리부터 증가시킨다.
+        end = min(end, self._size)
+        if start >= end:
+            return
+        positions = self._positions
+        digits = self._digits(start)
+        current = [chars[digit] for chars, digit in zip(positions, digits)]
+        last = len(positions) - 1
+        for _ in range(end - start):
+            yield ''.join(current)
+            position = last
+            while position >= 0:
+                digits[position] += 1
+                if digits[position] < len(positions[position]):
+                    current[position] = positions[position][digits[position]]
+                    break
+                digits[position] = 0
+                current[position] = positions[position][0]
+                position -= 1
+
+
+def parse_mask(mask, custom_charsets):
+    """마스크 문자열을 자리별 문자 집합 목록으로 변환한다."""
+    positions = []
+    index = 0
+    while index < len(mask):
+        char = mask[index]
+        if char == '?' and index + 1 < len(mask):
+            token = mask[index + 1]
+            if token == '?':
+                positions.append('?')
+            elif token in MASK_CHARSETS:
+                positions.append(MASK_CHARSETS[token])
+            elif token in custom_charsets:
+                positions.append(custom_charsets[token])
+            else:
+                raise ValueError(f'알 수 없는 마스크 기호입니다: ?{token}')
+            index += 2
+        else:
+            positions.append(char)
+            index += 1
+    return positions
+
+
+class ChainGenerator(CandidateGenerator):
+    """여러 생성기를 순서대로 이어 붙인다(가능성 높은 후보를 먼저 시도할 때 사용)."""
+
+    def __init__(self, generators):
+        self.generators = list(generators)
+        # 각 생성기의 시작 인덱스(누적 합)를 저장해 N번째 후보를 바로 찾는다.
+        self._offsets = [0]
+        for generator in self.generators:
+            self._offsets.append(self._offsets[-1] + len(generator))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def __repr__(self):
+        return f'ChainGenerator({self.generators!r})'
+
+    def _locate(self, index):
+        """전체 index가 속한 생성기 번호를 반환한다."""
+        for number in range(len(self.generators)):
+            if index < self._offsets[number + 1]:
+                return number
+        raise IndexError(index)
+
+    def candidate(self, index):
+        number = self._locate(index)
+        return self.generators[number].candidate(index - self._offsets[number])
+
+    def iter_range(self, start, end):
+        end = min(end, len(self))
+        while start < end:
+            number = self._locate(start)
+            offset = self._offsets[number]
+            stop = min(end, self._offsets[number + 1])
+            yield from self.generators[number].iter_range(start - offset, stop - offset)
+            start = stop
+
+
+class LengthRangeGenerator(ChainGenerator):
+    """문자 집합 하나로 min_length부터 max_length까지 길이를 바꿔가며 후보를 생성한다."""
+
+    def __init__(self, charset, min_length, max_length):
+        self.charset = charset
+        self.min_length = min_length
+        self.max_length = max_length
+        custom = {'1': charset}
+        super().__init__(MaskGenerator('?1' * length, custom) for length in range(min_length, max_length + 1))
+
+    def __repr__(self):
+        return f'LengthRangeGenerator({self.charset!r}, {self.min_length}, {self.max_length})'
+
+
+class WordlistGenerator(CandidateGenerator):
+    """
+    단어 목록 파일에서 한 줄씩 후보를 읽는다.
+    파일 전체를 메모리에 올리지 않고 줄의 시작 위치(바이트 오프셋)만 색인해 N번째 단어로 바로 이동한다.
+    """
+
+    def __init__(self, path, encoding='utf-8'):
+        self.path = path
+        self.encoding = encoding
+        self._offsets = array('Q')
+        with open(path, 'rb') as file:
+            offset = 0
+            for line in file:
+                if line.strip():
+                    self._offsets.append(offset)
+                offset += len(line)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __repr__(self):
+        return f'WordlistGenerator({self.path!r}, {len(self)})'
+
+    def candidate(self, index):
+        with open(self.path, 'rb') as file:
+            file.seek(self._offsets[index])
+            return file.readline().rstrip(b'\r\n').decode(self.encoding, errors='replace')
+
+    def iter_range(self, start, end):
+        end = min(end, len(self))
+        if start >= end:
+            return
+        with open(self.path, 'rb') as file:
+            file.seek(self._offsets[start])
+            count = end - start
+            for line in file:
+                word = line.rstrip(b'\r\n')
+                # 색인 시 건너뛴 빈 줄은 후보에서도 제외한다.
+                if not word.strip():
+                    continue
+                yield word.decode(self.encoding, errors='replace')
+                count -= 1
+                if count == 0:
+                    break
+
+
+def compile_rule(rule):
+    """
+    hashcat 형식을 단순화한 변형 규칙을 함수로 변환한다.
+    ':' 그대로, 'l' 소문자, 'u' 대문자, 'c' 첫 글자 대문자, 'r' 뒤집기, 'd' 두 번 반복,
+    '$X' 끝에 X 추가, '^X' 앞에 X 추가, 'sXY' X를 Y로 치환. 여러 규칙을 이어 쓸 수 있다.
+    """
+    steps = []
+    index = 0
+    while index < len(rule):
+        op = rule[index]
+        if op == ':':
+            pass
+        elif op == 'l':
+            steps.append(str.lower)
+        elif op == 'u':
+            steps.append(str.upper)
+        elif op == 'c':
+            steps.append(str.capitalize)
+        elif op == 'r':
+            steps.append(lambda word: word[::-1])
+        elif op == 'd':
+            steps.append(lambda word: word + word)
+        elif op == '$' and index + 1 < len(rule):
+            steps.append(lambda word, char=rule[index + 1]: word + char)
+            index += 1
+        elif op == '^' and index + 1 < len(rule):
+            steps.append(lambda word, char=rule[index + 1]: char + word)
+            index += 1
+        elif op == 's' and index + 2 < len(rule):
+            steps.append(lambda word, old=rule[index + 1], new=rule[index + 2]: word.replace(old, new))
+            index += 2
+        elif op != ' ':
+            raise ValueError(f'알 수 없는 규칙입니다: {rule!r}')
+        index += 1
+
+    def apply(word):
+        for step in steps:
+            word = step(word)
+        return word
+    return apply
+
+
+class RuleGenerator(CandidateGenerator):
+    """단어 생성기의 각 단어에 변형 규칙을 모두 적용한다(단어 하나당 규칙 수만큼 후보)."""
+
+    def __init__(self, words, rules):
+        self.words = words
+        self.rules = list(rules)
+        self._compiled = None
+
+    def __len__(self):
+        return len(self.words) * len(self.rules)
+
+    def __repr__(self):
+        return f'RuleGenerator({self.words!r}, {self.rules!r})'
+
+    def __getstate__(self):
+        # 람다로 만든 규칙 함수는 pickle할 수 없으므로 워커에서 다시 컴파일한다.
+        state = self.__dict__.copy()
+        state['_compiled'] = None
+        return state
+
+    def _rule_functions(self):
+        if self._compiled is None:
+            self._compiled = [compile_rule(rule) for rule in self.rules]
+        return self._compiled
+
+    def candidate(self, index):
+        word_index, rule_index = divmod(index, len(self.rules))
+        return self._rule_functions()[rule_index](self.words.candidate(word_index))
+
+    def iter_range(self, start, end):
+        end = min(end, len(self))
+        if start >= end:
+            return
+        functions = self._rule_functions()
+        rule_count = len(functions)
+        first_word, rule_index = divmod(start, rule_count)
+        last_word = (end - 1) // rule_count
+        index = start
+        for word in self.words.iter_range(first_word, last_word + 1):
+            while rule_index < rule_count and index < end:
+                yield functions[rule_index](word)
+                rule_index += 1
+                index += 1
+            rule_index = 0
+
+
+class HybridGenerator(CandidateGenerator):
+    """단어 뒤(또는 앞)에 마스크 후보를 붙인다. 예: 단어 + ?d?d."""
+
+    def __init__(self, words, mask, prepend=False):
+        self.words = words
+        self.mask = mask
+        self.prepend = prepend
+
+    def __len__(self):
+        return len(self.words) * len(self.mask)
+
+    def __repr__(self):
+        return f'HybridGenerator({self.words!r}, {self.mask!r}, {self.prepend})'
+
+    def _join(self, word, suffix):
+        return suffix + word if self.prepend else word + suffix
+
+    def candidate(self, index):
+        word_index, mask_index = divmod(index, len(self.mask))
+        return self._join(self.words.candidate(word_index), self.mask.candidate(mask_index))
+
+    def iter_range(self, start, end):
+        end = min(end, len(self))
+        if start >= end:
+            return
+        mask_size = len(self.mask)
+        first_word, mask_start = divmod(start, mask_size)
+        last_word = (end - 1) // mask_size
+        index = start
+        for word in self.words.iter_range(first_word, last_word + 1):
+            mask_end = min(mask_size, mask_start + end - index)
+            for suffix in self.mask.iter_range(mask_start, mask_end):
+                yield self._join(word, suffix)
+            index += mask_end - mask_start
+            mask_start = 0
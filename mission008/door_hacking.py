@@ -1,71 +1,293 @@
+import os
+import argparse
 import time
+import signal
+import zlib
+import queue
 import zipfile
-import io
-from multiprocessing import Pool, current_process
+from multiprocessing import Process, Queue, Event, cpu_count, current_process
+from zip_verifier import ZipCryptoVerifier
+from candidate_generator import (ChainGenerator, MaskGenerator, LengthRangeGenerator,
+                                 WordlistGenerator, RuleGenerator, HybridGenerator)
 
 # 전역 변수 설정
 charset = 'abcdefghijklmnopqrstuvwxyz0123456789'
-re_charset = '9876543210zyxwvutsrqponmlkjihgfedcba'
 #zip_file = 'aaa.zip'
 zip_file = 'mission008/file/emergency_storage_key.zip'
 
-def try_password(args):
-    """각 프로세스가 시도할 비밀번호 조합"""
-    c1, start_time = args
+# 기본 탐색 순서: 가능성이 높은 '영문 4자리 + 숫자 2자리'를 먼저 시도한 뒤 전체 6자리 a-z0-9를 탐색.
+DEFAULT_GENERATOR = ChainGenerator([
+    MaskGenerator('?l?l?l?l?d?d'),
+    MaskGenerator('?1?1?1?1?1?1', {'1': charset}),
+])
+# 작업 단위(청크) 하나에 포함되는 후보 비밀번호 수.
+CHUNK_SIZE = 200_000
+# 완료된 청크 목록을 저장하는 체크포인트 파일 경로.
+CHECKPOINT_PATH = 'mission008/checkpoint.txt'
+# 체크포인트 저장 및 진행률 출력 주기(초).
+CHECKPOINT_INTERVAL = 10
+# 워커가 정답 발견 여부를 확인하는 후보 간격.
+CANCEL_CHECK_INTERVAL = 1024
 
-    # 현재 process ID 출력
-    print(f'process({current_process().pid}) start with {c1}')
 
-    # ZIP 파일을 메모리로 로딩
-    with open(zip_file, 'rb') as f:
-        zip_data = io.BytesIO(f.read())
+def try_password(zf, fname, password):
+    """비밀번호로 파일 전체를 읽어 CRC 검증까지 통과하면 True를 반환한다."""
+    try:
+        with zf.open(fname, 'r', pwd=password.encode()) as file:
+            # 끝까지 읽어야 CRC 검사가 수행되어 잘못된 비밀번호가 걸러진다.
+            file.read()
+        return True
+    except (RuntimeError, zipfile.BadZipFile, zlib.error, ValueError):
+        return False
 
-    # ZIP 파일 열기
-    zf = zipfile.ZipFile(zip_data, 'r')
 
-    # 압축 파일 이름 목록(첫 번쨰 파일 이름) 
-    fname = zf.namelist()[0]
+def load_checkpoint(path, signature):
+    """체크포인트 파일에서 이미 완료된 청크 번호 집합을 읽어 반환한다."""
+    done_chunks = set()
+    try:
+        with open(path, 'r', encoding='utf-8') as checkpoint:
+            # 첫 줄은 키 공간 서명(청크 수와 생성기 정보), 키 공간이 바뀌었으면 체크포인트를 무시한다.
+            header = checkpoint.readline().rstrip('\n')
+            if header != signature:
+                print('체크포인트의 키 공간이 달라 처음부터 탐색합니다.')
+                return done_chunks
+            for line in checkpoint:
+                line = line.strip()
+                if line:
+                    done_chunks.add(int(line))
+    except FileNotFoundError:
+        pass
+    except ValueError:
+        print('ERROR: 체크포인트 파일이 손상되어 처음부터 탐색합니다.')
+        done_chunks.clear()
+    return done_chunks
 
-    # 6자리 비밀번호 시도
-    for c2 in charset:
-        for c3 in charset:
-            for c4 in charset:
-                for c5 in re_charset:
-                    for c6 in re_charset:
-                        password = f"{c1}{c2}{c3}{c4}{c5}{c6}"
-                        try:
-                            # 파일 열기 시도
-                            with zf.open(fname, 'r', pwd=password.encode()) as file:
-                                file.read(1)  # 파일이 정상인지 최소 1바이트 읽기
-                                print(f"정답 찾음: {password}")
 
-                                # 찾은 password를 password.txt에 저장장
-                                with open("password.txt", "w") as f:
-                                    f.write(password)
+def save_checkpoint(path, signature, done_chunks):
+    """완료된 청크 번호를 임시 파일에 쓴 뒤 교체해 체크포인트를 저장한다."""
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as checkpoint:
+            checkpoint.write(f'{signature}\n')
+            for chunk_id in sorted(done_chunks):
+                checkpoint.write(f'{chunk_id}\n')
+        # 저장 도중 종료되어도 기존 체크포인트가 깨지지 않도록 원자적으로 교체.
+        os.replace(temp_path, path)
+    except OSError as error:
+        print('ERROR: 체크포인트 저장 실패: ', error)
 
-                                print(f"총 소요 시간: {time.time() - start_time}")
-                                return password
-                        except :
-                            continue
-    return None
 
+def open_target(zip_path):
+    """
+    ZIP 파일을 확인하고 (첫 항목 이름, 헤더 검증기)를 반환한다.
+    ZipCrypto 항목이 아니면 검증기는 None이고, ZIP 파일을 열 수 없으면 예외가 발생한다.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        names = zf.namelist()
+    if not names:
+        raise zipfile.BadZipFile('ZIP 파일에 항목이 없습니다.')
+    # ZipCrypto 항목이면 암호화 헤더 검증 값으로 대부분의 후보를 빠르게 걸러낸다.
+    try:
+        verifier = ZipCryptoVerifier(zip_path, names[0])
+    except ValueError as error:
+        print(f'헤더 검증을 사용할 수 없어 zipfile로 검증합니다: {error}')
+        verifier = None
+    return names[0], verifier
 
-def unlock_zip():
+
+def search_worker(zip_path, fname, verifier, generator, chunk_size, task_queue, result_queue, found_event):
+    """공유 큐에서 청크 번호를 받아 해당 범위의 비밀번호를 시도하는 워커 프로세스."""
+    # Ctrl+C는 메인 프로세스가 처리하고 워커는 found_event로 종료한다.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # ZIP 파일은 워커당 한 번만 연다(검증과 검증기 생성은 메인 프로세스에서 한 번만 수행).
+    zf = zipfile.ZipFile(zip_path, 'r')
+    total = len(generator)
+
+    while not found_event.is_set():
+        try:
+            chunk_id = task_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        # None은 더 이상 처리할 청크가 없다는 신호.
+        if chunk_id is None:
+            break
+
+        start = chunk_id * chunk_size
+        end = min(start + chunk_size, total)
+        chunk_start_time = time.time()
+        cancelled = False
+
+        for index, password in enumerate(generator.iter_range(start, end), start):
+            # 다른 워커가 정답을 찾으면 즉시 중단한다.
+            if index % CANCEL_CHECK_INTERVAL == 0 and found_event.is_set():
+                cancelled = True
+                break
+            if verifier:
+                matched = verifier.verify(password.encode())
+            else:
+                matched = try_password(zf, fname, password)
+            if matched:
+                found_event.set()
+                result_queue.put(('found', chunk_id, password))
+                cancelled = True
+                break
+
+        # 끝까지 탐색한 청크만 완료로 보고한다.
+        if not cancelled:
+            result_queue.put(('done', chunk_id, end - start, time.time() - chunk_start_time))
+
+    zf.close()
+    result_queue.put(('exit', current_process().pid))
+
+
+def print_progress(done_count, total_chunks, tried, elapsed, workers):
+    """진행률과 처리량(초당 후보 수, 코어당 초당 후보 수)을 출력한다."""
+    rate = tried / elapsed if elapsed > 0 else 0.0
+    print(f'진행률: {done_count}/{total_chunks} 청크 ({done_count / total_chunks * 100:.2f}%), '
+          f'{rate:,.0f} 후보/초, 코어당 {rate / workers:,.0f} 후보/초')
+
+
+def unlock_zip(zip_path=zip_file, generator=DEFAULT_GENERATOR, chunk_size=CHUNK_SIZE,
+               checkpoint_path=CHECKPOINT_PATH, workers=None):
     # 시작 시간 측정
     start_time = time.time()
     print('시작 시간:', start_time)
 
-    # 멀티프로세싱 Pool 생성, 시스템 CPU cor 수 만큼 프로세스 생성성
-    with Pool() as pool:
-        # charset의 첫 번째 문자 기준으로 멀티프로세싱 분배
-        tasks = [(c, start_time) for c in charset]
-        results  = pool.map(try_password, tasks)
-        print('---', results)
+    # 워커를 시작하기 전에 ZIP 파일을 한 번만 확인하고 헤더 검증기를 만든다.
+    try:
+        fname, verifier = open_target(zip_path)
+    except (OSError, zipfile.BadZipFile) as error:
+        print('ERROR: ZIP 파일을 열 수 없습니다: ', error)
+        return None
+
+    workers = workers or cpu_count()
+    total = len(generator)
+    total_chunks = (total + chunk_size - 1) // chunk_size
+    signature = f'{total_chunks} {chunk_size} {generator!r}'
 
+    # 이전 실행에서 완료된 청크는 건너뛴다.
+    done_chunks = load_checkpoint(checkpoint_path, signature)
+    if done_chunks:
+        print(f'체크포인트에서 재개: {len(done_chunks)}/{total_chunks} 청크 완료됨')
+
+    task_queue = Queue()
+    result_queue = Queue()
+    found_event = Event()
+    # 남은 청크가 큐에 있어도 종료 시 대기하지 않도록 설정.
+    task_queue.cancel_join_thread()
+    for chunk_id in range(total_chunks):
+        if chunk_id not in done_chunks:
+            task_queue.put(chunk_id)
+    for _ in range(workers):
+        task_queue.put(None)
+
+    # 시스템 CPU core 수 만큼 워커 프로세스 생성
+    processes = [
+        Process(target=search_worker,
+                args=(zip_path, fname, verifier, generator, chunk_size, task_queue, result_queue, found_event))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    password = None
+    tried = 0
+    running = workers
+    last_report = time.time()
+    try:
+        while running:
+            try:
+                message = result_queue.get(timeout=1)
+            except queue.Empty:
+                # 종료를 알리지 못하고 죽은 워커가 있어도 무한히 기다리지 않는다.
+                if not any(process.is_alive() for process in processes):
+                    print('ERROR: 모든 워커 프로세스가 종료되었습니다.')
+                    break
+                message = None
+
+            if message is not None:
+                kind = message[0]
+                if kind == 'done':
+                    done_chunks.add(message[1])
+                    tried += message[2]
+                elif kind == 'found':
+                    password = message[2]
+                    print(f'정답 찾음: {password}')
+                elif kind == 'exit':
+                    running -= 1
+
+            # 주기적으로 진행률을 출력하고 체크포인트를 저장한다.
+            if time.time() - last_report >= CHECKPOINT_INTERVAL:
+                print_progress(len(done_chunks), total_chunks, tried, time.time() - start_time, workers)
+                save_checkpoint(checkpoint_path, signature, done_chunks)
+                last_report = time.time()
+    except KeyboardInterrupt:
+        # 중단 시 모든 워커를 멈추고 현재까지의 진행 상황을 저장한다.
+        print('\n탐색을 중단합니다. 체크포인트를 저장합니다.')
+        found_event.set()
+    finally:
+        # 워커가 종료되는 동안 보낸 결과까지 모두 받아 완료된 청크를 체크포인트에 반영한다.
+        while running:
+            try:
+                message = result_queue.get(timeout=1)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            kind = message[0]
+            if kind == 'done':
+                done_chunks.add(message[1])
+                tried += message[2]
+            elif kind == 'found' and password is None:
+                password = message[2]
+                print(f'정답 찾음: {password}')
+            elif kind == 'exit':
+                running -= 1
+        for process in processes:
+            process.join()
+
+    if password:
+        # 찾은 password를 password.txt에 저장
+        with open('password.txt', 'w') as f:
+            f.write(password)
+        # 탐색이 끝났으므로 체크포인트를 삭제한다.
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+    else:
+        save_checkpoint(checkpoint_path, signature, done_chunks)
+
+    print_progress(len(done_chunks), total_chunks, tried, time.time() - start_time, workers)
     print('최종 종료 시간:', time.time())
     print('총 소요 시간:', time.time() - start_time)
-    return None
+    return password
+
+
+def build_generator(args):
+    """명령행 인자로 후보 생성기를 구성한다. 지정하지 않으면 기본 생성기를 사용한다."""
+    custom = {'1': charset}
+    if args.wordlist:
+        generator = WordlistGenerator(args.wordlist)
+        if args.rules:
+            generator = RuleGenerator(generator, args.rules)
+        if args.mask:
+            generator = HybridGenerator(generator, MaskGenerator(args.mask, custom))
+        return generator
+    if args.mask:
+        return MaskGenerator(args.mask, custom)
+    if args.min_length and args.max_length:
+        return LengthRangeGenerator(charset, args.min_length, args.max_length)
+    return DEFAULT_GENERATOR
 
 
 if __name__ == "__main__":
-    unlock_zip()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='ZIP 비밀번호 탐색기')
+    parser.add_argument('--zip', default=zip_file, help='대상 ZIP 파일 경로')
+    parser.add_argument('--mask', help='마스크 패턴 (예: ?l?l?d?d?d?d, ?1은 a-z0-9), 단어 목록과 함께 쓰면 접미사')
+    parser.add_argument('--min-length', type=int, help='a-z0-9 길이 범위 탐색의 최소 길이')
+    parser.add_argument('--max-length', type=int, help='a-z0-9 길이 범위 탐색의 최대 길이')
+    parser.add_argument('--wordlist', help='단어 목록 파일 경로')
+    parser.add_argument('--rules', nargs='+', help='단어 변형 규칙 (예: : c u $1 sa@)')
+    parser.add_argument('--workers', type=int, help='워커 프로세스 수 (기본값: CPU 코어 수)')
+    args = parser.parse_args()
+
+    unlock_zip(args.zip, build_generator(args), workers=args.workers)
@@ -0,0 +1,140 @@
+import struct
+import zlib
+import zipfile
+
+# ZipCrypto 키 초기값.
+INIT_KEYS = (0x12345678, 0x23456789, 0x34567890)
+# 암호화 헤더의 길이(바이트).
+ENCRYPTION_HEADER_SIZE = 12
+# 로컬 파일 헤더의 고정 영역 구조와 시그니처.
+LOCAL_HEADER_STRUCT = struct.Struct('<4s5H3L2H')
+LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+
+def _make_crc_table():
+    """ZipCrypto 키 갱신에 사용하는 CRC32 테이블을 생성한다."""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+CRC_TABLE = _make_crc_table()
+
+
+def update_keys(keys, byte):
+    """평문 1바이트로 ZipCrypto 키 세 개를 갱신해 반환한다."""
+    key0, key1, key2 = keys
+    key0 = (key0 >> 8) ^ CRC_TABLE[(key0 ^ byte) & 0xFF]
+    key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+    key2 = (key2 >> 8) ^ CRC_TABLE[(key2 ^ (key1 >> 24)) & 0xFF]
+    return key0, key1, key2
+
+
+def init_keys(password, keys=INIT_KEYS):
+    """비밀번호 바이트로 키를 초기화한다(keys를 주면 이어서 갱신)."""
+    for byte in password:
+        keys = update_keys(keys, byte)
+    return keys
+
+
+def decrypt(keys, data):
+    """키로 data를 복호화해 (평문, 갱신된 키)를 반환한다."""
+    key0, key1, key2 = keys
+    table = CRC_TABLE
+    plain = bytearray(len(data))
+    for i, byte in enumerate(data):
+        temp = (key2 | 2) & 0xFFFF
+        byte ^= ((temp * (temp ^ 1)) >> 8) & 0xFF
+        plain[i] = byte
+        key0 = (key0 >> 8) ^ table[(key0 ^ byte) & 0xFF]
+        key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        key2 = (key2 >> 8) ^ table[(key2 ^ (key1 >> 24)) & 0xFF]
+    return bytes(plain), (key0, key1, key2)
+
+
+class ZipCryptoVerifier:
+    """
+    ZipCrypto로 암호화된 ZIP 항목의 비밀번호를 빠르게 검증하는 클래스.
+    로컬 파일 헤더를 한 번만 파싱해 12바이트 암호화 헤더를 메모리에 보관하고,
+    마지막 바이트(검증 값)로 틀린 비밀번호의 약 255/256을 걸러낸 뒤
+    통과한 후보만 전체 복호화와 CRC32 비교로 확정한다.
+    """
+
+    def __init__(self, zip_path, member=None):
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            info = zf.getinfo(member) if member else zf.infolist()[0]
+
+        # 암호화되지 않았거나 강력한 암호화(AES 등)는 지원하지 않는다.
+        if not info.flag_bits & 0x1 or info.flag_bits & 0x40:
+            raise ValueError(f'ZipCrypto로 암호화된 항목이 아닙니다: {info.filename}')
+        if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise ValueError(f'지원하지 않는 압축 방식입니다: {info.compress_type}')
+
+        with open(zip_path, 'rb') as file:
+            file.seek(info.header_offset)
+            fields = LOCAL_HEADER_STRUCT.unpack(file.read(LOCAL_HEADER_STRUCT.size))
+            if fields[0] != LOCAL_HEADER_SIGNATURE:
+                raise ValueError('로컬 파일 헤더가 올바르지 않습니다.')
+            mod_time = fields[4]
+            name_length, extra_length = fields[9], fields[10]
+            file.seek(name_length + extra_length, 1)
+            payload = file.read(info.compress_size)
+
+        self.filename = info.filename
+        self._header = payload[:ENCRYPTION_HEADER_SIZE]
+        self._body = payload[ENCRYPTION_HEADER_SIZE:]
+        self._crc = info.CRC
+        self._file_size = info.file_size
+        self._compress_type = info.compress_type
+        # 데이터 디스크립터 사용 시 검증 값은 로컬 헤더 수정 시각의 상위 바이트, 아니면 CRC 상위 바이트.
+        if info.flag_bits & 0x8:
+            self._check_byte = (mod_time >> 8) & 0xFF
+        else:
+            self._check_byte = (info.CRC >> 24) & 0xFF
+
+        # 접두사가 같은 후보가 연속되므로 마지막 접두사의 키를 재사용한다.
+        self._prefix = None
+        self._prefix_keys = INIT_KEYS
+
+    def _keys_for(self, password):
+        """비밀번호의 키를 계산하되 마지막 한 글자 전까지는 캐시를 사용한다."""
+        prefix = password[:-1]
+        if prefix != self._prefix:
+            self._prefix = prefix
+            self._prefix_keys = init_keys(prefix)
+        return update_keys(self._prefix_keys, password[-1]) if password else INIT_KEYS
+
+    def check_header(self, password):
+        """암호화 헤더의 검증 값만 비교해 후보가 통과하면 True를 반환한다."""
+        key0, key1, key2 = self._keys_for(password)
+        table = CRC_TABLE
+        # 헤더 11바이트는 키 갱신에만 사용하고 마지막 바이트만 비교한다.
+        for byte in self._header[:-1]:
+            temp = (key2 | 2) & 0xFFFF
+            byte ^= ((temp * (temp ^ 1)) >> 8) & 0xFF
+            key0 = (key0 >> 8) ^ table[(key0 ^ byte) & 0xFF]
+            key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+            key2 = (key2 >> 8) ^ table[(key2 ^ (key1 >> 24)) & 0xFF]
+        temp = (key2 | 2) & 0xFFFF
+        return self._header[-1] ^ (((temp * (temp ^ 1)) >> 8) & 0xFF) == self._check_byte
+
+    def verify(self, password):
+        """
+        비밀번호(bytes)가 맞으면 True를 반환한다.
+        헤더 검증 값을 통과한 후보만 전체 복호화, 압축 해제, CRC32 비교를 수행한다.
+        """
+        if not self.check_header(password):
+            return False
+
+        _, keys = decrypt(self._keys_for(password), self._header)
+        data, _ = decrypt(keys, self._body)
+        if self._compress_type == zipfile.ZIP_DEFLATED:
+            try:
+                data = zlib.decompress(data, -15)
+            except zlib.error:
+                return False
+        return len(data) == self._file_size and zlib.crc32(data) == self._crc
@@ -0,0 +1,84 @@
+import os
+import sys
+
+# 알파벳 수.
+ALPHABET_COUNT = 26
+LOWERCASE = 'abcdefghijklmnopqrstuvwxyz'
+UPPERCASE = LOWERCASE.upper()
+
+
+def _build_decode_table(shift):
+    """shift만큼 알파벳을 되돌리는 str.translate용 변환표를 만든다."""
+    shifted_lower = LOWERCASE[-shift:] + LOWERCASE[:-shift] if shift else LOWERCASE
+    shifted_upper = shifted_lower.upper()
+    return str.maketrans(LOWERCASE + UPPERCASE, shifted_lower + shifted_upper)
+
+
+# 26개 shift의 변환표는 한 번만 만들어 재사용한다.
+DECODE_TABLES = [_build_decode_table(shift) for shift in range(ALPHABET_COUNT)]
+
+
+def decode_shift(text, shift):
+    """text를 shift만큼 되돌려 해독한 문자열을 반환한다."""
+    return text.translate(DECODE_TABLES[shift % ALPHABET_COUNT])
+
+
+def decode_all_shifts(text):
+    """text를 26개 shift로 모두 해독해 shift 순서의 리스트로 반환한다."""
+    return [text.translate(table) for table in DECODE_TABLES]
+
+
+def iter_ciphertexts(path):
+    """
+    파일(한 줄에 암호문 하나) 또는 디렉토리 안의 모든 파일에서
+    (파일 경로, 줄 번호, 암호문)을 하나씩 생성한다. 파일 전체를 메모리에 올리지 않는다.
+    """
+    if os.path.isdir(path):
+        paths = sorted(os.path.join(path, name) for name in os.listdir(path))
+        paths = [file_path for file_path in paths if os.path.isfile(file_path)]
+    else:
+        paths = [path]
+
+    for file_path in paths:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line_number, line in enumerate(file, 1):
+                    text = line.rstrip('\r\n')
+                    if text:
+                        yield file_path, line_number, text
+        except UnicodeDecodeError:
+            print(f'ERROR: 텍스트 파일이 아니므로 건너뜁니다: {file_path}')
+        except PermissionError:
+            print(f'ERROR: 파일의 접근 권한이 없습니다: {file_path}')
+
+
+def batch_decode(path):
+    """암호문마다 (파일 경로, 줄 번호, 암호문, 26개 해독 결과)를 하나씩 생성한다."""
+    for file_path, line_number, text in iter_ciphertexts(path):
+        yield file_path, line_number, text, decode_all_shifts(text)
+
+
+def write_batch_results(path, output):
+    """
+    batch_decode 결과를 output 스트림에 '파일:줄<TAB>shift<TAB>해독문' 형식으로 바로 기록한다.
+    처리한 암호문 수를 반환한다.
+    """
+    count = 0
+    for file_path, line_number, _, candidates in batch_decode(path):
+        source = f'{file_path}:{line_number}'
+        output.writelines(f'{source}\t{shift}\t{decoded}\n' for shift, decoded in enumerate(candidates))
+        count += 1
+    return count
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('사용법: python caesar_batch.py <암호문 파일 또는 디렉토리> [출력 파일]')
+        sys.exit(1)
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w', encoding='utf-8') as result_file:
+            total = write_batch_results(sys.argv[1], result_file)
+        print(f'{total}개의 암호문을 해독해 {sys.argv[2]}에 저장했습니다.')
+    else:
+        write_batch_results(sys.argv[1], sys.stdout)
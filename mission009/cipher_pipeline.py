@@ -0,0 +1,238 @@
+import sys
+from multiprocessing import Pool
+from caesar_batch import ALPHABET_COUNT, LOWERCASE, UPPERCASE, decode_all_shifts, iter_ciphertexts
+from cipher_scorer import ENGLISH_FREQUENCIES, CipherScorer
+
+# 영어 문장과 무작위 문자열의 일치 지수(Index of Coincidence) 기대값.
+ENGLISH_IOC = 0.0667
+RANDOM_IOC = 1 / 26
+# Vigenère 키 길이 추정 범위와 점수화할 후보 키 길이 수.
+MAX_KEY_LENGTH = 20
+KEY_LENGTH_CANDIDATES = 3
+# 열 하나에 필요한 최소 글자 수. 이보다 짧은 열은 shift 추정이 불안정해 키 길이 후보에서 제외한다.
+MIN_COLUMN_LETTERS = 12
+# 가장 높은 평균 일치 지수에 대해 이 비율 이상이면 영어에 가까운 키 길이로 본다.
+IOC_RATIO = 0.9
+# 열마다 추가로 시도할 차순위 shift 수.
+SHIFT_ALTERNATIVES = 2
+# 여러 암호문을 처리할 때 프로세스 하나에 한 번에 넘기는 암호문 수.
+POOL_CHUNK_SIZE = 16
+
+
+class CaesarCracker:
+    """26개 shift를 모두 후보로 만드는 시저 암호 해독기."""
+    name = 'caesar'
+
+    def candidates(self, text):
+        return enumerate(decode_all_shifts(text))
+
+
+class AffineCracker:
+    """
+    아핀 암호(E(x) = a*x + b mod 26) 해독기.
+    26과 서로소인 a 12개 x b 26개 = 312개 키의 변환표를 한 번만 만들어 재사용한다.
+    """
+    name = 'affine'
+
+    def __init__(self):
+        self._tables = []
+        for a in range(1, ALPHABET_COUNT):
+            if _gcd(a, ALPHABET_COUNT) != 1:
+                continue
+            a_inverse = pow(a, -1, ALPHABET_COUNT)
+            for b in range(ALPHABET_COUNT):
+                plain = ''.join(LOWERCASE[(a_inverse * (index - b)) % ALPHABET_COUNT]
+                                for index in range(ALPHABET_COUNT))
+                table = str.maketrans(LOWERCASE + UPPERCASE, plain + plain.upper())
+                self._tables.append(((a, b), table))
+
+    def candidates(self, text):
+        return ((key, text.translate(table)) for key, table in self._tables)
+
+
+class VigenereCracker:
+    """
+    Vigenère 암호 해독기.
+    일치 지수로 키 길이를 추정하고, 열마다 영어 빈도와의 상관이 가장 큰 shift를 골라 키를 복원한다.
+    차순위 shift를 한 열씩 바꾼 키도 후보로 내고 최종 선택은 점수기에 맡긴다.
+    """
+    name = 'vigenere'
+
+    def __init__(self, max_key_length=MAX_KEY_LENGTH, length_candidates=KEY_LENGTH_CANDIDATES):
+        self.max_key_length = max_key_length
+        self.length_candidates = length_candidates
+
+    def estimate_key_lengths(self, letters):
+        """
+        열별 평균 일치 지수로 키 길이 후보를 반환한다.
+        열마다 MIN_COLUMN_LETTERS 글자 이상 남는 길이만 고려하며, 글자가 부족하면 빈 리스트를 반환한다.
+        실제 키 길이의 배수도 일치 지수가 높게 나오므로, 최댓값에 가까운 길이 중 짧은 것부터 고르고
+        부족하면 영어 기대값과의 차이가 작은 순서로 채운다.
+        """
+        limit = min(self.max_key_length, len(letters) // MIN_COLUMN_LETTERS)
+        averages = {}
+        for length in range(1, limit + 1):
+            columns = [letters[offset::length] for offset in range(length)]
+            averages[length] = sum(index_of_coincidence(column) for column in columns) / length
+        if not averages:
+            return []
+
+        threshold = max((ENGLISH_IOC + RANDOM_IOC) / 2, IOC_RATIO * max(averages.values()))
+        lengths = [length for length, average in averages.items() if average >= threshold]
+        for length in sorted(averages, key=lambda length: abs(averages[length] - ENGLISH_IOC)):
+            if length not in lengths:
+                lengths.append(length)
+        return lengths[:self.length_candidates]
+
+    def column_shifts(self, letters, length):
+        """
+        열마다 영어 빈도와의 상관이 큰(영어다운) 순서로 shift 상위 후보를 반환한다.
+        짧은 열에서는 카이제곱이 드문 글자(z, x 등) 하나에 크게 흔들리므로 상관 점수를 사용한다.
+        """
+        shifts = []
+        for offset in range(length):
+            column = letters[offset::length]
+            counts = [column.count(char) for char in LOWERCASE]
+
+            def correlation(shift):
+                return sum(counts[(index + shift) % ALPHABET_COUNT] * frequency
+                           for index, frequency in enumerate(ENGLISH_FREQUENCIES))
+
+            ranked = sorted(range(ALPHABET_COUNT), key=correlation, reverse=True)
+            shifts.append(ranked[:SHIFT_ALTERNATIVES + 1])
+        return shifts
+
+    def candidates(self, text):
+        letters = ''.join(char for char in text.lower() if 'a' <= char <= 'z')
+        if not letters:
+            return
+        for length in self.estimate_key_lengths(letters):
+            shifts = self.column_shifts(letters, length)
+            key = [LOWERCASE[ranked[0]] for ranked in shifts]
+            yield ''.join(key), vigenere_decode(text, key)
+            # 열이 짧으면 1순위 shift가 틀릴 수 있으므로 한 열만 차순위 shift로 바꾼 키도 후보로 낸다.
+            for offset, ranked in enumerate(shifts):
+                for shift in ranked[1:]:
+                    variant = key[:offset] + [LOWERCASE[shift]] + key[offset + 1:]
+                    yield ''.join(variant), vigenere_decode(text, variant)
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def index_of_coincidence(letters):
+    """소문자 알파벳 문자열의 일치 지수를 반환한다."""
+    length = len(letters)
+    if length < 2:
+        return 0.0
+    counts = [letters.count(char) for char in LOWERCASE]
+    return sum(count * (count - 1) for count in counts) / (length * (length - 1))
+
+
+def vigenere_decode(text, key):
+    """키로 Vigenère 암호문을 해독한다. 알파벳이 아닌 문자는 그대로 두고 키도 진행하지 않는다."""
+    shifts = [ord(char) - ord('a') for char in ''.join(key).lower()]
+    result = []
+    position = 0
+    for char in text:
+        if 'a' <= char <= 'z' or 'A' <= char <= 'Z':
+            base = ord('a') if char >= 'a' else ord('A')
+            result.append(chr((ord(char) - base - shifts[position % len(shifts)]) % ALPHABET_COUNT + base))
+            position += 1
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+# 이름으로 선택할 수 있는 해독기 목록.
+CRACKERS = {
+    CaesarCracker.name: CaesarCracker,
+    AffineCracker.name: AffineCracker,
+    VigenereCracker.name: VigenereCracker,
+}
+
+
+def check_cipher_names(cipher_names):
+    """알 수 없는 암호 종류가 있으면 ValueError를 발생시킨다."""
+    unknown = [name for name in cipher_names if name not in CRACKERS]
+    if unknown:
+        raise ValueError(f'알 수 없는 암호 종류: {", ".join(unknown)} (가능: {", ".join(CRACKERS)})')
+
+
+class CipherPipeline:
+    """
+    여러 고전 암호 해독기의 후보를 같은 점수기로 평가해 가장 영어다운 해독 결과를 고른다.
+    """
+
+    def __init__(self, cipher_names=tuple(CRACKERS), scorer=None):
+        check_cipher_names(cipher_names)
+        self.crackers = [CRACKERS[name]() for name in cipher_names]
+        self.scorer = scorer or CipherScorer()
+
+    def crack(self, text):
+        """
+        모든 해독기의 후보를 점수 순으로 정렬해 [(점수, (암호 종류, 키), 해독문), ...]과 신뢰도를 반환한다.
+        """
+        candidates = (((cracker.name, key), plain)
+                      for cracker in self.crackers
+                      for key, plain in cracker.candidates(text))
+        return self.scorer.rank(candidates)
+
+    def best(self, text):
+        """
+        가장 점수가 높은 (점수, (암호 종류, 키), 해독문, 신뢰도)를 반환한다.
+        해독기가 후보를 하나도 만들지 못하면(예: 글자가 없거나 너무 짧은 Vigenère 암호문) None을 반환한다.
+        """
+        ranked, confidence = self.crack(text)
+        if not ranked:
+            return None
+        return (*ranked[0], confidence)
+
+
+# 워커 프로세스마다 한 번만 만드는 파이프라인(Aho–Corasick 오토마톤 생성 비용 절감).
+_worker_pipeline = None
+
+
+def _init_worker(cipher_names):
+    global _worker_pipeline
+    _worker_pipeline = CipherPipeline(cipher_names)
+
+
+def _crack_record(record):
+    file_path, line_number, text = record
+    return file_path, line_number, text, _worker_pipeline.best(text)
+
+
+def crack_many(path, cipher_names=tuple(CRACKERS), processes=None):
+    """
+    파일 또는 디렉토리의 암호문을 여러 프로세스에 나눠 해독하고
+    (파일 경로, 줄 번호, 암호문, (점수, (암호 종류, 키), 해독문, 신뢰도))를 입력 순서대로 생성한다.
+    암호 종류는 프로세스를 만들기 전에 확인한다(초기화 함수에서 실패하면 Pool이 워커를 계속 다시 만든다).
+    """
+    check_cipher_names(cipher_names)
+    with Pool(processes, initializer=_init_worker, initargs=(cipher_names,)) as pool:
+        yield from pool.imap(_crack_record, iter_ciphertexts(path), chunksize=POOL_CHUNK_SIZE)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('사용법: python cipher_pipeline.py <암호문 파일 또는 디렉토리> [암호 종류...]')
+        print(f'암호 종류: {", ".join(CRACKERS)} (기본값: 전체)')
+        sys.exit(1)
+
+    names = tuple(sys.argv[2:]) or tuple(CRACKERS)
+    try:
+        check_cipher_names(names)
+    except ValueError as error:
+        print('사용법: python cipher_pipeline.py <암호문 파일 또는 디렉토리> [암호 종류...]', file=sys.stderr)
+        print(f'오류: {error}', file=sys.stderr)
+        sys.exit(2)
+    for file_path, line_number, text, result in crack_many(sys.argv[1], names):
+        if result is None:
+            print(f'{file_path}:{line_number}\t해독 후보 없음')
+            continue
+        score, (cipher, key), plain, confidence = result
+        print(f'{file_path}:{line_number}\t{cipher}\t{key}\t{confidence:.1%}\t{plain}')
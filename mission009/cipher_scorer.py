@@ -0,0 +1,191 @@
+import math
+from collections import deque
+from caesar_batch import decode_all_shifts
+
+# 한 줄에 단어 하나가 들어 있는 영어 단어 목록 파일 경로(없으면 기본 단어 목록 사용).
+WORDLIST_PATH = 'mission009/words.txt'
+
+# 단어 목록 파일이 없을 때 사용하는 자주 쓰이는 영어 단어.
+DEFAULT_WORDS = [
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'any', 'can', 'had', 'her', 'was', 'one',
+    'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see', 'two',
+    'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use', 'that', 'with', 'have',
+    'this', 'will', 'your', 'from', 'they', 'know', 'want', 'been', 'good', 'much', 'some', 'time',
+    'very', 'when', 'come', 'here', 'just', 'like', 'long', 'make', 'many', 'more', 'only', 'over',
+    'such', 'take', 'than', 'them', 'well', 'were', 'what', 'love', 'life', 'home', 'base', 'mars',
+    'earth', 'planet', 'rocket', 'oxygen', 'mission', 'space', 'water', 'there', 'their', 'which',
+    'would', 'about', 'could', 'other', 'these', 'first', 'after', 'where', 'should', 'because',
+    'password', 'secret', 'message', 'hello', 'world', 'help', 'rescue', 'door', 'open', 'key',
+]
+
+# 영어 문장의 알파벳 출현 빈도(a~z, 합계 1).
+ENGLISH_FREQUENCIES = [
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966, 0.00153,
+    0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056,
+    0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+]
+
+# 사전 일치율과 빈도 적합도의 가중치.
+DICTIONARY_WEIGHT = 0.7
+FREQUENCY_WEIGHT = 0.3
+# 신뢰도(softmax) 계산 시 점수 차이를 얼마나 크게 반영할지 정하는 온도 값.
+CONFIDENCE_TEMPERATURE = 0.05
+
+
+class AhoCorasick:
+    """
+    여러 단어를 한 번에 찾는 Aho–Corasick 오토마톤.
+    단어 목록으로 트라이와 실패 링크를 한 번만 만들고, 텍스트는 한 번의 순회로 모든 단어를 찾는다.
+    """
+
+    def __init__(self, words, min_length=3):
+        # 노드별 전이(dict), 실패 링크, 해당 노드에서 끝나는 가장 긴 단어 길이, 일치 단어 수.
+        self._goto = [{}]
+        self._fail = [0]
+        self._longest = [0]
+        self._hits = [0]
+        self.size = 0
+
+        for word in words:
+            word = word.strip().lower()
+            if len(word) >= min_length:
+                self._add(word)
+        self._build_fail_links()
+
+    def _add(self, word):
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._longest.append(0)
+                self._hits.append(0)
+            node = next_node
+        if not self._hits[node]:
+            self.size += 1
+        self._longest[node] = len(word)
+        self._hits[node] = 1
+
+    def _build_fail_links(self):
+        """BFS로 실패 링크를 만들고, 실패 링크를 따라 도달하는 단어 정보도 합친다."""
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._longest[child] = max(self._longest[child], self._longest[self._fail[child]])
+                self._hits[child] += self._hits[self._fail[child]]
+                pending.append(child)
+
+    def scan(self, text):
+        """
+        소문자 text를 한 번 순회해 (일치 단어 수, 단어가 덮는 글자 수)를 반환한다.
+        """
+        goto, fail, longest, hits = self._goto, self._fail, self._longest, self._hits
+        node = 0
+        hit_count = 0
+        covered = 0
+        # 가장 최근까지 덮인 위치(겹치는 단어를 중복으로 세지 않기 위함).
+        covered_until = 0
+        for position, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if hits[node]:
+                hit_count += hits[node]
+                start = max(position - longest[node], covered_until)
+                if start < position:
+                    covered += position - start
+                    covered_until = position
+        return hit_count, covered
+
+
+def load_wordlist(path=WORDLIST_PATH):
+    """단어 목록 파일을 한 줄씩 읽어 생성한다. 파일이 없으면 기본 단어 목록을 사용한다."""
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                word = line.strip()
+                if word and not word.startswith('#'):
+                    yield word
+    except FileNotFoundError:
+        yield from DEFAULT_WORDS
+
+
+def chi_squared(text):
+    """text의 알파벳 빈도와 영어 빈도의 카이제곱 통계량과 알파벳 수를 반환한다."""
+    counts = [0] * 26
+    for char in text:
+        index = ord(char) - 97
+        if 0 <= index < 26:
+            counts[index] += 1
+    letters = sum(counts)
+    if not letters:
+        return 0.0, 0
+    statistic = 0.0
+    for count, frequency in zip(counts, ENGLISH_FREQUENCIES):
+        expected = letters * frequency
+        statistic += (count - expected) ** 2 / expected
+    return statistic, letters
+
+
+class CipherScorer:
+    """사전 일치(Aho–Corasick)와 영어 알파벳 빈도(카이제곱)를 합쳐 해독 후보의 영어다움을 점수화한다."""
+
+    def __init__(self, words=None, min_length=3):
+        self.automaton = AhoCorasick(load_wordlist() if words is None else words, min_length)
+
+    def score(self, text):
+        """0~1 사이의 점수를 반환한다. 높을수록 영어 문장에 가깝다."""
+        lowered = text.lower()
+        statistic, letters = chi_squared(lowered)
+        if not letters:
+            return 0.0
+        _, covered = self.automaton.scan(lowered)
+        coverage = min(covered / letters, 1.0)
+        # 카이제곱 값을 알파벳 수로 나눠 길이와 무관한 0~1 적합도로 변환.
+        fitness = 1.0 / (1.0 + statistic / letters)
+        return DICTIONARY_WEIGHT * coverage + FREQUENCY_WEIGHT * fitness
+
+    def rank(self, candidates):
+        """
+        (키, 해독문) 후보를 점수 순으로 정렬해 [(점수, 키, 해독문), ...]과 1위의 신뢰도(0~1)를 반환한다.
+        서로 다른 키가 같은 해독문을 만들면 처음 나온 키만 남긴다.
+        """
+        ranked = sorted(((self.score(text), key, text) for key, text in _unique(candidates)),
+                        key=lambda item: item[0], reverse=True)
+        return ranked, confidence(ranked)
+
+    def rank_shifts(self, text):
+        """시저 암호문 text의 26개 shift를 모두 해독하고 점수 순으로 정렬한다."""
+        return self.rank(enumerate(decode_all_shifts(text)))
+
+
+def _unique(candidates):
+    """해독문이 같은 후보는 처음 나온 것만 생성한다."""
+    seen = set()
+    for key, text in candidates:
+        if text not in seen:
+            seen.add(text)
+            yield key, text
+
+
+def confidence(ranked):
+    """
+    점수에 softmax를 적용해 1위 후보가 정답일 확률을 신뢰도로 반환한다.
+    비교할 후보가 하나뿐이거나(알파벳이 없어 해독문이 모두 같음) 1위 점수가 0이면 신뢰도는 0이다.
+    """
+    if len(ranked) < 2:
+        return 0.0
+    best = ranked[0][0]
+    if best <= 0:
+        return 0.0
+    total = sum(math.exp((score - best) / CONFIDENCE_TEMPERATURE) for score, *_ in ranked)
+    return 1.0 / total
@@ -2,6 +2,7 @@ import os # 파일 시스템 작업을 위한 내장 라이브러리.
 import sounddevice # 음성 녹음을 위한 외부 라이브러리.
 from datetime import datetime # 날짜, 시간 처리를 위한 내장 라이브라리.
 from scipy.io.wavfile import write # 파일 저장을 위한 외부 라이브러리.
+from stream_recorder import StreamRecorder # 블록 단위 스트리밍 녹음.
 
 # 음성 파일 경로.
 RECORD_PATH = 'mission010/records'
@@ -34,6 +35,34 @@ class Javis:
         # 녹음된 음성 데이터의 NumPy 배열 반환.
         return audio_data
 
+    # 녹음하면서 블록 단위로 바로 WAV 파일에 저장하는 함수(긴 녹음도 메모리 사용량 일정).
+    def record_to_file(self, duration, rollover_minutes=None, stream_factory=None):
+        '''
+        Arguments:
+            duration (int): 녹음 시간 (초 단위)
+            rollover_minutes (int): 이 시간(분)마다 새 파일로 나누어 저장. None이면 나누지 않음.
+            stream_factory (callable): 입력 스트림 생성 함수(기본값: sounddevice.InputStream).
+        return:
+            files (list): 저장된 음성 파일 경로 목록.
+        '''
+        recorder = StreamRecorder(
+            record_path=RECORD_PATH, # 음성 파일을 저장할 폴더.
+            stream_factory=stream_factory or sounddevice.InputStream, # 콜백 방식 입력 스트림.
+            samplerate=self._samplerate, # 샘플링 횟수(Hz 단위(기본값: 44,100))
+            channels=2, # 음성 채널 수.
+            dtype='int16', # 음성 데이터를 저장할 데이터 타입.
+            rollover_minutes=rollover_minutes # 파일을 나누는 주기(분).
+        )
+        print(f'{duration}초 동안 음성 녹음을 진행합니다...')
+        files = recorder.record(duration)
+        print(f'{duration}초 동안 녹음을 완료했습니다...')
+        # 저장 대기열이 가득 차서 버린 블록이 있으면 경고.
+        if recorder.dropped_blocks:
+            print(f'저장이 밀려 {recorder.dropped_blocks}개 블록을 버렸습니다.')
+        for path in files:
+            print(f'음성 데이터를 {os.path.basename(path)}(으)로 저장되었습니다.')
+        return files
+
     # 녹음된 음성 데이터를 WAV 파일로 저장하는 함수.
     def saved_audio(self, audio_data):
         '''
@@ -123,10 +152,10 @@ if __name__ == '__main__':
             try:
                 # 음성 녹음 시간 입력.
                 record_duration = int(input('녹음 시간을 입력하시오: ') or '10')
-                # 음성 녹음 함수 실행.
-                recorded_data = javis.record_audio(duration=record_duration)
-                # 음성 저장 함수 실행.
-                javis.saved_audio(audio_data=recorded_data)
+                # 파일을 나누는 주기 입력(공백이면 나누지 않음).
+                rollover = input('파일을 나눌 주기(분)를 입력하시오(공백: 나누지 않음): ')
+                # 음성 녹음 및 저장 함수 실행.
+                javis.record_to_file(duration=record_duration, rollover_minutes=float(rollover) if rollover else None)
             except Exception as error:
                 print(f'알 수 없는 오류가 발생했습니다: {error}')
         # 2. 날짜 조회.
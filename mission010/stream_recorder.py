@@ -0,0 +1,303 @@
+import os # 파일 시스템 작업을 위한 내장 라이브러리.
+import queue # 녹음 블록을 전달하는 대기열.
+import struct # WAV(RIFF) 헤더 작성을 위한 내장 라이브러리.
+import threading # 백그라운드 저장 스레드.
+import time
+import wave # 가짜 입력 장치에서 WAV 파일을 읽기 위한 내장 라이브러리.
+from datetime import datetime, timedelta
+import numpy
+
+# 기본 녹음 설정.
+SAMPLERATE = 44100
+CHANNELS = 2
+DTYPE = 'int16'
+# 입력 스트림이 콜백 한 번에 넘겨주는 프레임 수(고정 크기 블록).
+BLOCK_FRAMES = 4096
+# 저장 스레드로 넘기는 대기열 크기(블록 수). 가득 차면 블록을 버리고 개수를 센다.
+QUEUE_BLOCKS = 256
+# 이 시간(초)마다 WAV 헤더의 길이 정보를 갱신해 중간에 종료되어도 파일을 읽을 수 있게 함.
+HEADER_UPDATE_INTERVAL = 1.0
+
+# WAV 헤더(RIFF, fmt, data 청크 머리). 길이 필드는 닫을 때(또는 주기적으로) 갱신.
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+# RIFF 길이 필드(32비트)에 담을 수 있는 data 청크의 최대 바이트 수(약 4GiB).
+MAX_WAV_DATA_BYTES = 0xFFFFFFFF - 36
+SAMPLE_WIDTHS = {'int16': 2, 'int32': 4}
+
+
+class WavFileWriter:
+    '''
+    PCM WAV 파일을 블록 단위로 이어 쓰는 클래스.
+    처음에는 길이를 0으로 둔 헤더를 쓰고, update_header()/close()에서 RIFF, data 길이를 갱신함.
+    '''
+
+    def __init__(self, path, samplerate=SAMPLERATE, channels=CHANNELS, sample_width=2):
+        self.path = path
+        self.samplerate = samplerate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.data_bytes = 0
+        self._file = open(path, 'wb')
+        self._write_header()
+
+    @property
+    def frames(self):
+        return self.data_bytes // (self.channels * self.sample_width)
+
+    def _write_header(self):
+        block_align = self.channels * self.sample_width
+        self._file.write(WAV_HEADER.pack(
+            b'RIFF', 36 + self.data_bytes, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.samplerate, self.samplerate * block_align,
+            block_align, self.sample_width * 8,
+            b'data', self.data_bytes))
+
+    def write(self, data):
+        self._file.write(data)
+        self.data_bytes += len(data)
+
+    def update_header(self):
+        '''지금까지 쓴 길이로 헤더를 갱신하고 디스크에 반영.'''
+        self._file.flush()
+        position = self._file.tell()
+        self._file.seek(0)
+        self._write_header()
+        self._file.seek(position)
+        self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.update_header()
+        self._file.close()
+
+
+class StreamRecorder:
+    '''
+    콜백 방식의 입력 스트림으로 녹음하면서, 고정 크기 블록을 제한된 대기열로 저장 스레드에 넘겨
+    WAV 파일에 바로 기록하는 클래스. 녹음 길이와 무관하게 메모리 사용량이 일정함.
+    rollover_minutes를 지정하면 그 시간마다 새 파일로 나누어 저장하고,
+    지정하지 않아도 파일이 WAV 크기 한도(약 4GiB)에 닿으면 새 파일로 넘어감.
+    저장 스레드가 오류로 멈추면 이후 블록은 버리고, stop()은 기다리지 않고 끝남(오류는 error에 보관).
+    '''
+
+    def __init__(self, record_path, stream_factory, samplerate=SAMPLERATE, channels=CHANNELS, dtype=DTYPE,
+                 block_frames=BLOCK_FRAMES, queue_blocks=QUEUE_BLOCKS, rollover_minutes=None,
+                 max_file_bytes=MAX_WAV_DATA_BYTES):
+        '''
+        Args:
+            record_path (str): 음성 파일을 저장할 폴더.
+            stream_factory (callable): sounddevice.InputStream과 같은 인자를 받는 입력 스트림 생성 함수.
+            samplerate (int): 샘플링 횟수(Hz).
+            channels (int): 음성 채널 수.
+            dtype (str): 샘플 형식('int16', 'int32').
+            block_frames (int): 블록 하나의 프레임 수.
+            queue_blocks (int): 대기열에 담을 수 있는 최대 블록 수.
+            rollover_minutes (float): 파일을 나누는 주기(분). None이면 나누지 않음.
+            max_file_bytes (int): 파일 하나의 최대 data 바이트 수(MAX_WAV_DATA_BYTES를 넘을 수 없음).
+        '''
+        if dtype not in SAMPLE_WIDTHS:
+            raise ValueError(f'지원하지 않는 샘플 형식입니다: {dtype}')
+        self.record_path = record_path
+        self.stream_factory = stream_factory
+        self.samplerate = samplerate
+        self.channels = channels
+        self.dtype = dtype
+        self.block_frames = block_frames
+        self.sample_width = SAMPLE_WIDTHS[dtype]
+        self.rollover_frames = int(rollover_minutes * 60 * samplerate) if rollover_minutes else None
+        # 주기와 관계없이 파일 하나에 쓸 수 있는 최대 프레임 수(헤더 길이 필드가 넘치지 않도록).
+        frame_bytes = channels * self.sample_width
+        self.max_file_frames = min(max_file_bytes, MAX_WAV_DATA_BYTES) // frame_bytes
+        self.queue_blocks = queue_blocks
+
+        self._queue = queue.Queue(maxsize=queue_blocks)
+        self._failed = threading.Event()
+        self._stream = None
+        self._writer_thread = None
+        self._writer = None
+        self._started_at = None
+        self._total_frames = 0
+        self.files = []
+        self.dropped_blocks = 0
+        self.error = None
+
+    # 입력 스트림 콜백(오디오 스레드에서 호출되므로 기다리지 않고 대기열에 넣기만 함).
+    def _callback(self, indata, frames, time_info, status):
+        # 저장 스레드가 멈췄으면 대기열이 비워지지 않으므로 블록을 버림.
+        if self._failed.is_set():
+            self.dropped_blocks += 1
+            return
+        try:
+            self._queue.put_nowait(indata.tobytes())
+        except queue.Full:
+            self.dropped_blocks += 1
+
+    def _open_file(self):
+        '''녹음 시작 시각 + 지금까지 저장한 시간으로 파일 이름을 만들어 새 WAV 파일을 엶.'''
+        started = self._started_at + timedelta(seconds=self._total_frames / self.samplerate)
+        name = started.strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(self.record_path, f'{name}.wav')
+        # 같은 초에 시작하는 파일이 이미 있으면 번호를 붙임.
+        number = 1
+        while os.path.exists(path):
+            path = os.path.join(self.record_path, f'{name}-{number}.wav')
+            number += 1
+        self._writer = WavFileWriter(path, self.samplerate, self.channels, self.sample_width)
+        self.files.append(path)
+
+    # 저장 스레드: 대기열의 블록을 파일에 쓰고, 주기마다 파일을 나눔.
+    def _write_loop(self):
+        frame_bytes = self.channels * self.sample_width
+        file_frames = min(self.rollover_frames or self.max_file_frames, self.max_file_frames)
+        last_update = time.monotonic()
+        try:
+            while True:
+                block = self._queue.get()
+                if block is None:
+                    break
+                while block:
+                    if self._writer is None:
+                        self._open_file()
+                    # 파일을 나눌 시점(주기 또는 크기 한도)이 블록 중간이면 프레임 경계에서 잘라서 씀.
+                    room = (file_frames - self._writer.frames) * frame_bytes
+                    part, block = block[:room], block[room:]
+                    self._writer.write(part)
+                    self._total_frames += len(part) // frame_bytes
+                    if self._writer.frames >= file_frames:
+                        self._writer.close()
+                        self._writer = None
+                if self._writer and time.monotonic() - last_update >= HEADER_UPDATE_INTERVAL:
+                    self._writer.update_header()
+                    last_update = time.monotonic()
+        except Exception as error:
+            self.error = error
+            self._failed.set()
+            print(f'ERROR: 음성 파일 저장 중 오류가 발생했습니다: {error}')
+        finally:
+            if self._writer:
+                try:
+                    self._writer.close()
+                except Exception as error:
+                    self.error = self.error or error
+                    print(f'ERROR: 음성 파일을 닫는 중 오류가 발생했습니다: {error}')
+                self._writer = None
+
+    def start(self):
+        '''저장 스레드와 입력 스트림을 시작.'''
+        os.makedirs(self.record_path, exist_ok=True)
+        self._started_at = datetime.now()
+        self._total_frames = 0
+        self.files = []
+        self.dropped_blocks = 0
+        self.error = None
+        # 이전 녹음이 오류로 끝났을 수 있으므로 대기열과 오류 상태를 새로 만듦.
+        self._queue = queue.Queue(maxsize=self.queue_blocks)
+        self._failed.clear()
+        self._writer_thread = threading.Thread(target=self._write_loop, name='wav-writer', daemon=True)
+        self._writer_thread.start()
+        self._stream = self.stream_factory(samplerate=self.samplerate, channels=self.channels, dtype=self.dtype,
+                                           blocksize=self.block_frames, callback=self._callback)
+        self._stream.start()
+
+    def stop(self):
+        '''
+        입력 스트림을 멈추고 남은 블록을 모두 저장한 뒤 헤더를 갱신하고 파일을 닫음.
+
+        Returns:
+            list: 저장된 음성 파일 경로 목록.
+        '''
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        if self._writer_thread is not None:
+            # 저장 스레드가 살아 있는 동안만 종료 신호를 넣음(오류로 멈췄으면 대기열이 비워지지 않음).
+            while self._writer_thread.is_alive():
+                try:
+                    self._queue.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            self._writer_thread.join()
+            self._writer_thread = None
+        return list(self.files)
+
+    def record(self, duration):
+        '''
+        duration초 동안 녹음해 저장하고 저장된 파일 경로 목록을 반환. Ctrl+C로 중단해도 녹음한 부분은 저장됨.
+
+        Args:
+            duration (float): 녹음 시간(초).
+        Returns:
+            list: 저장된 음성 파일 경로 목록.
+        '''
+        self.start()
+        try:
+            time.sleep(duration)
+        finally:
+            files = self.stop()
+        return files
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class FileInputStream:
+    '''
+    WAV 파일(또는 NumPy 배열)을 입력 장치처럼 흉내 내는 가짜 입력 스트림.
+    sounddevice.InputStream과 같은 인자를 받고, 별도 스레드에서 blocksize 프레임씩 callback을 호출함.
+    realtime=False면 기다리지 않고 최대한 빨리 블록을 넘김(테스트용).
+    '''
+
+    def __init__(self, source, samplerate=SAMPLERATE, channels=CHANNELS, dtype=DTYPE, blocksize=BLOCK_FRAMES,
+                 callback=None, realtime=True, loop=True):
+        if isinstance(source, str):
+            with wave.open(source, 'rb') as wav_file:
+                data = numpy.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=dtype)
+                source = data.reshape(-1, wav_file.getnchannels())
+        self._data = numpy.asarray(source, dtype=dtype).reshape(-1, channels)
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.callback = callback
+        self.realtime = realtime
+        self.loop = loop
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        position = 0
+        deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            if self.loop:
+                # 데이터 끝에 닿으면 처음으로 돌아가 블록을 채움.
+                indexes = numpy.arange(position, position + self.blocksize)
+                block = self._data.take(indexes, axis=0, mode='wrap')
+                position = (position + self.blocksize) % len(self._data)
+            else:
+                block = self._data[position:position + self.blocksize]
+                position += self.blocksize
+                if not len(block):
+                    break
+            self.callback(block, len(block), None, None)
+            if self.realtime:
+                deadline += self.blocksize / self.samplerate
+                self._stop_event.wait(max(0.0, deadline - time.monotonic()))
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='fake-input', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        self.stop()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import threading
+import unittest
+import wave
+from unittest import mock
+import numpy
+from stream_recorder import WAV_HEADER, FileInputStream, StreamRecorder, WavFileWriter
+
+# 테스트용 녹음 설정(1초 = 1,000프레임으로 파일 나누기를 빠르게 확인).
+SAMPLERATE = 1000
+CHANNELS = 2
+BLOCK_FRAMES = 256
+
+
+def make_source(frames):
+    '''프레임마다 값이 다른 int16 스테레오 배열을 만듦.'''
+    samples = numpy.arange(frames * CHANNELS, dtype=numpy.int64) % 65536 - 32768
+    return samples.astype(numpy.int16).reshape(-1, CHANNELS)
+
+
+def record_all(recorder, source):
+    '''가짜 입력 장치의 데이터를 끝까지 녹음하고 저장된 파일 목록을 반환.'''
+    streams = []
+
+    def stream_factory(**kwargs):
+        stream = FileInputStream(source, realtime=False, loop=False, **kwargs)
+        streams.append(stream)
+        return stream
+
+    recorder.stream_factory = stream_factory
+    recorder.start()
+    # 입력이 끝나면 가짜 입력 스레드가 스스로 종료됨.
+    streams[0]._thread.join()
+    return recorder.stop()
+
+
+class StreamRecorderTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.record_path = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def make_recorder(self, **kwargs):
+        return StreamRecorder(self.record_path, None, samplerate=SAMPLERATE, channels=CHANNELS,
+                              block_frames=BLOCK_FRAMES, **kwargs)
+
+    def read_files(self, files):
+        '''파일마다 헤더의 길이 필드를 확인하고 모든 프레임을 이어 붙여 반환.'''
+        data = b''
+        for path in files:
+            size = os.path.getsize(path)
+            with open(path, 'rb') as file:
+                fields = WAV_HEADER.unpack(file.read(WAV_HEADER.size))
+            self.assertEqual(fields[0], b'RIFF')
+            self.assertEqual(fields[1], size - 8)
+            self.assertEqual(fields[12], size - WAV_HEADER.size)
+            with wave.open(path, 'rb') as wav_file:
+                self.assertEqual(wav_file.getframerate(), SAMPLERATE)
+                self.assertEqual(wav_file.getnchannels(), CHANNELS)
+                data += wav_file.readframes(wav_file.getnframes())
+        return data
+
+    def test_rollover_output_matches_input(self):
+        source = make_source(5000)
+        # 0.01분 = 600프레임마다 새 파일.
+        recorder = self.make_recorder(rollover_minutes=0.01)
+        files = record_all(recorder, source)
+
+        self.assertEqual(recorder.dropped_blocks, 0)
+        self.assertIsNone(recorder.error)
+        self.assertEqual(len(files), 9)
+        self.assertEqual(self.read_files(files), source.tobytes())
+        for path in files[:-1]:
+            with wave.open(path, 'rb') as wav_file:
+                self.assertEqual(wav_file.getnframes(), 600)
+
+    def test_size_limit_forces_rollover(self):
+        source = make_source(3000)
+        # 주기를 지정하지 않아도 파일 하나의 data 크기 한도(1,000프레임)에서 나눔.
+        recorder = self.make_recorder(max_file_bytes=1000 * CHANNELS * 2)
+        files = record_all(recorder, source)
+
+        self.assertEqual(len(files), 3)
+        self.assertEqual(self.read_files(files), source.tobytes())
+
+    def test_failing_writer_does_not_hang_stop(self):
+        recorder = StreamRecorder(
+            self.record_path,
+            lambda **kwargs: FileInputStream(make_source(5000), realtime=False, **kwargs),
+            samplerate=SAMPLERATE, channels=CHANNELS, block_frames=BLOCK_FRAMES, queue_blocks=4)
+
+        def run():
+            with mock.patch.object(WavFileWriter, 'write', side_effect=RuntimeError('disk failure')):
+                recorder.record(0.2)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive(), 'stop()이 저장 스레드 오류 후 멈춤')
+        self.assertIsInstance(recorder.error, RuntimeError)
+        self.assertGreater(recorder.dropped_blocks, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
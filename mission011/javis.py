@@ -4,6 +4,7 @@ import speech_recognition as sr # STT 외부 라이브러리.
 from datetime import datetime # 날짜, 시간 처리를 위한 내장 라이브라리.
 from scipy.io.wavfile import write # 파일 저장을 위한 외부 라이브러리.
 from pydub import AudioSegment # 음성 파일 처리를 위한 외부 라이브러리.
+from stream_recorder import StreamRecorder # 블록 단위 스트리밍 녹음.
 
 # 음성 파일 경로. (이제 기본값 또는 사용자 지정 경로로 사용됨)
 RECORD_PATH = 'mission011/records' 
@@ -64,6 +65,33 @@ class Javis:
         print(f'INFO: {duration}초 동안 녹음을 완료했습니다...')
         return audio_data
 
+    # 녹음하면서 블록 단위로 바로 WAV 파일에 저장하는 함수(긴 녹음도 메모리 사용량 일정).
+    def record_to_file(self, duration, rollover_minutes=None, stream_factory=None):
+        '''
+        Args:
+            duration (int): 녹음 시간 (초 단위)
+            rollover_minutes (float): 이 시간(분)마다 새 파일로 나누어 저장. None이면 나누지 않음.
+            stream_factory (callable): 입력 스트림 생성 함수(기본값: sounddevice.InputStream).
+        Returns:
+            list: 저장된 음성 파일의 전체 경로 목록.
+        '''
+        recorder = StreamRecorder(
+            record_path=self.record_path,
+            stream_factory=stream_factory or sounddevice.InputStream,
+            samplerate=self._samplerate,
+            channels=2,
+            dtype='int16',
+            rollover_minutes=rollover_minutes
+        )
+        print(f'INFO: {duration}초 동안 음성 녹음을 진행합니다...')
+        files = recorder.record(duration)
+        print(f'INFO: {duration}초 동안 녹음을 완료했습니다...')
+        if recorder.dropped_blocks:
+            print(f'WARNING: 저장이 밀려 {recorder.dropped_blocks}개 블록을 버렸습니다.')
+        for path in files:
+            print(f'INFO: 음성 데이터를 {os.path.basename(path)}(으)로 저장되었습니다.')
+        return files
+
     # 녹음된 음성 데이터를 WAV 파일로 저장하는 함수.
     def saved_audio(self, audio_data):
         '''
@@ -302,10 +330,13 @@ if __name__ == '__main__':
             if javis._check_microphone_status():
                 try:
                     record_duration = int(input('녹음 시간을 입력하시오(기본값: 10초): ') or '10')
-                    recorded_data = javis.record_audio(duration=record_duration)
-                    saved_audio_path = javis.saved_audio(audio_data=recorded_data)
+                    rollover = input('파일을 나눌 주기(분)를 입력하시오(공백: 나누지 않음): ')
+                    saved_audio_paths = javis.record_to_file(
+                        duration=record_duration,
+                        rollover_minutes=float(rollover) if rollover else None
+                    )
                     
-                    if saved_audio_path:
+                    for saved_audio_path in saved_audio_paths:
                         javis.convert_audio_to_text_and_save_csv(audio_file_path=saved_audio_path)
                 except ValueError:
                     print('ERROR: 유효한 녹음 시간을 입력하십시오.')